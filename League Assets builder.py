@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#pip install requests tqdm
+#pip install requests tqdm pillow
 """
 Download League of Legends champion portraits and ultimate (R) icons
 from Riot Data Dragon into:
@@ -7,12 +7,36 @@ from Riot Data Dragon into:
   - ultimates/{champ}.png
 
 Run once, then drop these folders next to your overlay app.
+
+Downloads run concurrently over a shared keep-alive session:
+  python "League Assets builder.py" --jobs 16
+  python "League Assets builder.py" --bench   # local stand-in server, no network
+
+Every asset is recorded in res/manifest.json (url, version, size, ETag,
+Last-Modified, sha256). Later runs skip files that are already current and
+send conditional requests for the rest:
+  python "League Assets builder.py" --verify  # re-hash local files, no network
+  python "League Assets builder.py" --force   # ignore the manifest
+
+Finally every icon under res/heroes, res/spells and res/ultimates is packed
+into a single res/atlas.jpg plus a res/atlas.json index of sprite rects, which
+is what the overlay loads at runtime. The atlas is generated, not committed;
+build.bat repacks it before bundling:
+  python "League Assets builder.py" --atlas   # repack from local files only
+
+Champion and summoner spell names are also fetched for every Data Dragon
+locale and merged into res/names.json, a single lookup table from any
+localized display name to its canonical (en_US) name, cooldown and icon slug.
 """
-import os, re, json, sys, time, unicodedata
+import os, re, json, sys, time, unicodedata, argparse, threading, tempfile, hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Dict, Tuple, Optional
+from typing import Callable, Dict, Iterable, List, Tuple, Optional
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
 # -------------------- Config --------------------
@@ -20,8 +44,18 @@ LANG = "en_US"  # change if you want another locale’s champion data
 OUT_HEROES = Path("res/heroes")
 OUT_ULTS   = Path("res/ultimates")
 OUT_CHAMP_DATA = Path("res/champ_data.json")
+OUT_MANIFEST = Path("res/manifest.json")
+OUT_SPELLS = Path("res/spells")
+OUT_ATLAS = Path("res/atlas.jpg")
+OUT_ATLAS_INDEX = Path("res/atlas.json")
+OUT_NAMES = Path("res/names.json")
+ATLAS_WIDTH = 2048
+ATLAS_ICON = 96     # px; icons are drawn at most 100 px (50 px cells at the 200% scale)
+ATLAS_QUALITY = 88  # JPEG quality of the atlas
 RETRY_COUNT = 3
 TIMEOUT = 10
+JOBS = 8            # worker threads (--jobs N)
+PER_HOST_LIMIT = 8  # max in-flight requests against a single host
 
 # -------------------- Utils ---------------------
 def slugify(name: str) -> str:
@@ -34,40 +68,190 @@ def slugify(name: str) -> str:
     s = re.sub(r"_+", "_", s).strip("_")
     return s
 
-def get_json(url: str) -> dict:
-    for i in range(RETRY_COUNT):
-        try:
-            r = requests.get(url, timeout=TIMEOUT)
-            if r.ok:
-                return r.json()
-        except Exception:
-            pass
-        time.sleep(0.6 * (i + 1))
-    raise RuntimeError(f"Failed to GET JSON after retries: {url}")
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
-def download_file(url: str, dest: Path) -> bool:
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    for i in range(RETRY_COUNT):
+class Manifest:
+    """Per-asset record of what is on disk and where it came from.
+
+    Keyed by the asset's path (posix, relative to the repo root); each entry
+    holds url, version, size, etag, last_modified and sha256.
+    """
+    def __init__(self, path: Path = OUT_MANIFEST):
+        self.path = path
+        self.version = ""
+        self.assets: Dict[str, dict] = {}
+        self._hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}  # key -> ((size, mtime_ns), sha256) this run
+        self._lock = threading.Lock()
         try:
-            with requests.get(url, stream=True, timeout=TIMEOUT) as r:
-                if not r.ok:
-                    time.sleep(0.6 * (i + 1))
-                    continue
-                total = int(r.headers.get("content-length", 0))
-                tmp = dest.with_suffix(dest.suffix + ".part")
-                with open(tmp, "wb") as f, tqdm(
-                    total=total, unit="B", unit_scale=True, desc=dest.name, leave=False
-                ) as pbar:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            if total:
-                                pbar.update(len(chunk))
-                tmp.replace(dest)
-                return True
-        except Exception:
+            if path.exists():
+                with open(path, "r", encoding="utf-8") as f:
+                    raw = json.load(f) or {}
+                self.version = raw.get("version", "")
+                self.assets = raw.get("assets", {}) or {}
+        except Exception as e:
+            print(f"[MANIFEST] Ignoring unreadable {path}: {e}")
+
+    @staticmethod
+    def key(dest: Path) -> str:
+        return dest.as_posix()
+
+    def get(self, dest: Path) -> Optional[dict]:
+        with self._lock:
+            return self.assets.get(self.key(dest))
+
+    def put(self, dest: Path, entry: dict):
+        with self._lock:
+            self.assets[self.key(dest)] = entry
+
+    def is_intact(self, dest: Path) -> bool:
+        """True when the local file still has the size and sha256 recorded for it."""
+        entry = self.get(dest)
+        if not entry or not dest.exists():
+            return False
+        return dest.stat().st_size == entry.get("size") and self.local_sha256(dest) == entry.get("sha256")
+
+    def local_sha256(self, dest: Path) -> str:
+        """sha256 of the local file, hashed once per run unless the file changes."""
+        st = dest.stat()
+        stamp, key = (st.st_size, st.st_mtime_ns), self.key(dest)
+        with self._lock:
+            cached = self._hashes.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        digest = sha256_file(dest)
+        with self._lock:
+            self._hashes[key] = (stamp, digest)
+        return digest
+
+    def is_current(self, dest: Path, version: str) -> bool:
+        """True when the entry matches ``version`` and the local file still hashes the same."""
+        entry = self.get(dest)
+        return bool(entry) and entry.get("version") == version and self.is_intact(dest)
+
+    def verify(self) -> List[Tuple[str, str]]:
+        """Re-hash every recorded file. Returns (path, problem) pairs."""
+        problems = []
+        for key, entry in sorted(self.assets.items()):
+            path = Path(key)
+            if not path.exists():
+                problems.append((key, "missing"))
+            elif path.stat().st_size != entry.get("size"):
+                problems.append((key, "size mismatch"))
+            elif sha256_file(path) != entry.get("sha256"):
+                problems.append((key, "hash mismatch"))
+        return problems
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".part")
+        with self._lock:
+            payload = {"version": self.version, "assets": dict(sorted(self.assets.items()))}
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        tmp.replace(self.path)
+
+class Downloader:
+    """Pooled keep-alive session + bounded thread pool.
+
+    Every request goes through one ``requests.Session`` so connections to
+    Data Dragon are reused, and a per-host semaphore caps how many requests
+    hit the same host at once. Retries/backoff happen inside each task, so a
+    slow or failing file never stalls the others.
+    """
+    def __init__(self, jobs: int = JOBS, per_host: int = PER_HOST_LIMIT):
+        self.jobs = max(1, int(jobs))
+        self.per_host = max(1, int(per_host))
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.jobs)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._hosts: Dict[str, threading.BoundedSemaphore] = {}
+        self._hosts_lock = threading.Lock()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._hosts_lock:
+            sem = self._hosts.get(host)
+            if sem is None:
+                sem = self._hosts[host] = threading.BoundedSemaphore(min(self.per_host, self.jobs))
+            return sem
+
+    def get_json(self, url: str) -> dict:
+        for i in range(RETRY_COUNT):
+            try:
+                with self._host_slot(url):
+                    r = self.session.get(url, timeout=TIMEOUT)
+                if r.ok:
+                    return r.json()
+            except Exception:
+                pass
             time.sleep(0.6 * (i + 1))
-    return False
+        raise RuntimeError(f"Failed to GET JSON after retries: {url}")
+
+    def download_file(self, url: str, dest: Path) -> bool:
+        return self.fetch(url, dest)[0] != "failed"
+
+    def fetch(self, url: str, dest: Path, prev: Optional[dict] = None, version: str = "") -> Tuple[str, Optional[dict]]:
+        """Download ``url`` into ``dest``, conditionally if ``prev`` describes the local copy.
+
+        Returns (status, manifest entry) where status is "updated",
+        "unchanged" (server answered 304) or "failed".
+        """
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_suffix(dest.suffix + ".part")
+        headers = {}
+        if prev and dest.exists():
+            if prev.get("etag"):
+                headers["If-None-Match"] = prev["etag"]
+            if prev.get("last_modified"):
+                headers["If-Modified-Since"] = prev["last_modified"]
+        for i in range(RETRY_COUNT):
+            try:
+                with self._host_slot(url), self.session.get(url, stream=True, timeout=TIMEOUT, headers=headers) as r:
+                    if r.status_code == 304:
+                        return "unchanged", dict(prev, url=url, version=version)
+                    if r.ok:
+                        h = hashlib.sha256(); size = 0
+                        with open(tmp, "wb") as f:
+                            for chunk in r.iter_content(chunk_size=8192):
+                                if chunk:
+                                    f.write(chunk); h.update(chunk); size += len(chunk)
+                        tmp.replace(dest)
+                        return "updated", {
+                            "url": url,
+                            "version": version,
+                            "size": size,
+                            "etag": r.headers.get("ETag", ""),
+                            "last_modified": r.headers.get("Last-Modified", ""),
+                            "sha256": h.hexdigest(),
+                        }
+            except Exception:
+                pass
+            time.sleep(0.6 * (i + 1))
+        return "failed", None
+
+    def run(self, tasks: Iterable[Callable[[], object]], total: int, desc: str) -> List[object]:
+        """Run tasks on the pool behind a single aggregate progress bar."""
+        results = []
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool, tqdm(total=total, desc=desc, unit="task") as pbar:
+            futures = [pool.submit(t) for t in tasks]
+            for fut in as_completed(futures):
+                results.append(fut.result())
+                pbar.update(1)
+        return results
+
+DL = Downloader()
+
+def get_json(url: str) -> dict:
+    return DL.get_json(url)
+
+def download_file(url: str, dest: Path) -> bool:
+    return DL.download_file(url, dest)
 
 # -------------------- Data Dragon ----------------
 def get_latest_version() -> str:
@@ -83,6 +267,14 @@ def list_champions(version: str, lang: str = LANG) -> Dict[str, dict]:
     data = get_json(url)
     return data.get("data", {})
 
+def list_locales() -> List[str]:
+    return get_json("https://ddragon.leagueoflegends.com/cdn/languages.json")
+
+def list_summoners(version: str, lang: str = LANG) -> Dict[str, dict]:
+    url = f"https://ddragon.leagueoflegends.com/cdn/{version}/data/{lang}/summoner.json"
+    data = get_json(url)
+    return data.get("data", {})
+
 def get_champion_detail(version: str, champ_id: str) -> dict:
     # Full champion record including spells (Q/W/E/R)
     url = f"https://ddragon.leagueoflegends.com/cdn/{version}/data/{LANG}/champion/{champ_id}.json"
@@ -99,72 +291,191 @@ def spell_icon_url(version: str, spell_id: str) -> str:
     return f"https://ddragon.leagueoflegends.com/cdn/{version}/img/spell/{spell_id}.png"
 
 # -------------------- Main logic -----------------
-def main():
+def fetch_asset(manifest: Manifest, version: str, url: str, dest: Path, force: bool = False) -> str:
+    """Bring one asset up to date. Returns "skipped", "unchanged", "updated" or "failed"."""
+    entry = None if force else manifest.get(dest)
+    intact = bool(entry) and manifest.is_intact(dest)  # the one hash of this file
+    if intact and entry.get("version") == version:
+        return "skipped"
+    # a 304 only vouches for the bytes we recorded: a corrupted/edited local copy is downloaded in full
+    prev = entry if intact else None
+    status, entry = DL.fetch(url, dest, prev, version)
+    if entry:
+        manifest.put(dest, entry)
+    return status
+
+def fetch_champion_assets(manifest: Manifest, version: str, champ_id: str, cdata: dict,
+                          force: bool = False) -> List[Tuple[str, str, str, str]]:
+    """One pool task: portrait + ultimate icon for a single champion."""
+    champ_name = cdata.get("name", champ_id)
+    champ_slug = slugify(champ_name)
+    out = []
+
+    # --- portrait
+    p_url = portrait_url(version, champ_id)
+    out.append((champ_name, "portrait", fetch_asset(manifest, version, p_url, OUT_HEROES / f"{champ_slug}.png", force), p_url))
+
+    # --- ultimate icon
+    u_dest = OUT_ULTS / f"{champ_slug}.png"
+    try:
+        if not force and manifest.is_current(u_dest, version):
+            # same patch, same bytes: no need to fetch the champion detail JSON either
+            out.append((champ_name, "ultimate", "skipped", manifest.get(u_dest)["url"]))
+            return out
+        detail = get_champion_detail(version, champ_id)
+        spells = detail.get("spells", [])
+        if not spells or len(spells) < 4:
+            raise RuntimeError("No spell list or incomplete (expected 4).")
+        spell_id = spells[3].get("id")  # Q,W,E,**R** (index 3), e.g. "AhriR"
+        if not spell_id:
+            raise RuntimeError("R spell has no 'id'.")
+        u_url = spell_icon_url(version, spell_id)
+        out.append((champ_name, "ultimate", fetch_asset(manifest, version, u_url, u_dest, force), u_url))
+    except Exception as e:
+        out.append((champ_name, "ultimate", "failed", str(e)))
+    return out
+
+def fetch_locale_names(version: str, lang: str) -> Tuple[str, Dict[str, dict], Dict[str, dict]]:
+    """One pool task: champion.json + summoner.json for a single locale."""
+    try:
+        return lang, list_champions(version, lang), list_summoners(version, lang)
+    except Exception as e:
+        print(f"[NAMES] Skipping locale {lang}: {e}")
+        return lang, {}, {}
+
+def build_name_tables(version: str) -> dict:
+    """Merge every locale into {localized name: canonical record}.
+
+    champions: name -> [en_US name, slug]
+    spells:    name -> [en_US name, cooldown, slug]
+    Some spells exist once per game mode under the same name (e.g. Mark);
+    the CLASSIC (Summoner's Rift) variant wins those collisions.
+    """
+    locales = list_locales() or [LANG]
+    if LANG not in locales:
+        locales.insert(0, LANG)
+    tasks = [(lambda lang=lang: fetch_locale_names(version, lang)) for lang in locales]
+    by_locale = {lang: (champs, spells) for lang, champs, spells in DL.run(tasks, total=len(tasks), desc="Locales")}
+
+    en_champs, en_spells = by_locale.get(LANG, ({}, {}))
+    if not en_champs or not en_spells:
+        raise RuntimeError(f"Missing {LANG} data, cannot pick canonical names.")
+
+    champions: Dict[str, list] = {}
+    spells: Dict[str, list] = {}
+    spell_classic: Dict[str, bool] = {}
+    for lang in [LANG] + sorted(l for l in by_locale if l != LANG):
+        champs, sums = by_locale[lang]
+        for cid, c in champs.items():
+            canonical = en_champs.get(cid, {}).get("name")
+            if canonical and c.get("name"):
+                champions.setdefault(c["name"], [canonical, slugify(canonical)])
+        for sid, sp in sums.items():
+            en = en_spells.get(sid)
+            name = sp.get("name")
+            if not en or not name:
+                continue
+            classic = "CLASSIC" in (en.get("modes") or [])
+            if name in spells and (spell_classic[name] or not classic):
+                continue
+            cooldown = int((en.get("cooldown") or [0])[0])
+            spells[name] = [en["name"], cooldown, slugify(en["name"])]
+            spell_classic[name] = classic
+
+    table = {"version": version, "locales": sorted(by_locale), "champions": champions, "spells": spells}
+    with open(OUT_NAMES, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"Name tables for {len(by_locale)} locales exported to: {OUT_NAMES}")
+    return table
+
+def read_table_version(path: Path) -> str:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return (json.load(f) or {}).get("version", "")
+    except Exception:
+        return ""
+
+def read_champ_data_version(path: Path = OUT_CHAMP_DATA) -> str:
+    return read_table_version(path)
+
+def verify(manifest: Optional[Manifest] = None) -> int:
+    """--verify: re-hash local files against the manifest, no network."""
+    manifest = manifest or Manifest()
+    if not manifest.assets:
+        print(f"No manifest at {manifest.path}; run the builder first.")
+        return 1
+    problems = manifest.verify()
+    print(f"Checked {len(manifest.assets)} assets (version {manifest.version or '?'}).")
+    for key, problem in problems:
+        print(f" - {key}: {problem}")
+    print("All assets match the manifest." if not problems else f"{len(problems)} asset(s) out of date.")
+    return 1 if problems else 0
+
+def main(jobs: int = JOBS, force: bool = False):
+    global DL
+    DL = Downloader(jobs=jobs)
+    manifest = Manifest()
+
     print("Fetching latest Data Dragon version…")
     version = get_latest_version()
     print(f"Latest version: {version}")
+    if manifest.version:
+        print(f"Manifest version: {manifest.version}")
 
     champs = list_champions(version)
     if not champs:
         print("No champions found, exiting.")
         sys.exit(1)
 
-    # Plan: for each champion:
+    # Plan: for each champion (one pool task each):
     #  - portrait: img/champion/{ChampId}.png → heroes/{slug(champName)}.png
     #  - ultimate: spells list index 3 → its 'id' → img/spell/{id}.png
     #    saved as ultimates/{slug(champName)}.png
-    portraits_ok = 0
-    ults_ok = 0
+    counts = {"portrait": {}, "ultimate": {}}
     fails = []
 
-    # for champ_id, cdata in tqdm(champs.items(), desc="Champions", unit="champ"):
-    #     champ_name = cdata.get("name", champ_id)
-    #     champ_slug = slugify(champ_name)
-
-    #     # --- portrait
-    #     p_url = portrait_url(version, champ_id)
-    #     p_dest = OUT_HEROES / f"{champ_slug}.png"
-    #     ok_portrait = download_file(p_url, p_dest)
-    #     if ok_portrait:
-    #         portraits_ok += 1
-    #     else:
-    #         fails.append((champ_name, "portrait", p_url))
-
-    #     # --- ultimate icon
-    #     try:
-    #         detail = get_champion_detail(version, champ_id)
-    #         spells = detail.get("spells", [])
-    #         if not spells or len(spells) < 4:
-    #             raise RuntimeError("No spell list or incomplete (expected 4).")
-    #         r_spell = spells[3]  # Q,W,E,**R** (index 3)
-    #         spell_id = r_spell.get("id")  # e.g., "AhriR"
-    #         if not spell_id:
-    #             raise RuntimeError("R spell has no 'id'.")
-    #         u_url = spell_icon_url(version, spell_id)
-    #         u_dest = OUT_ULTS / f"{champ_slug}.png"
-    #         ok_ult = download_file(u_url, u_dest)
-    #         if ok_ult:
-    #             ults_ok += 1
-    #         else:
-    #             fails.append((champ_name, "ultimate", u_url))
-    #     except Exception as e:
-    #         fails.append((champ_name, "ultimate", str(e)))
+    tasks = [
+        (lambda cid=cid, cdata=cdata: fetch_champion_assets(manifest, version, cid, cdata, force))
+        for cid, cdata in champs.items()
+    ]
+    try:
+        for results in DL.run(tasks, total=len(tasks), desc=f"Champions (x{DL.jobs})"):
+            for champ_name, kind, status, info in results:
+                counts[kind][status] = counts[kind].get(status, 0) + 1
+                if status == "failed":
+                    fails.append((champ_name, kind, info))
+    finally:
+        manifest.version = version
+        manifest.save()
 
     print()
     print("===== DONE =====")
-    print(f"Portraits saved: {portraits_ok}")
-    print(f"Ult icons saved: {ults_ok}")
-
-    champs_ES = list_champions(version, lang="es_ES")
-
-    champ_list = [
-            {c.get("name", ""): champs.get(cid, {}).get("name", "")}
-            for cid, c in champs_ES.items()
-        ]
-    with open(OUT_CHAMP_DATA, "w", encoding="utf-8") as f:
-        json.dump({"version": version, "champions": champ_list}, f, ensure_ascii=False, indent=2)
-    print(f"Champion names exported to: {OUT_CHAMP_DATA}")
-    
+    for kind, label in (("portrait", "Portraits"), ("ultimate", "Ult icons")):
+        c = counts[kind]
+        print(f"{label}: {c.get('updated', 0)} downloaded, {c.get('unchanged', 0)} not modified, "
+              f"{c.get('skipped', 0)} skipped, {c.get('failed', 0)} failed")
+
+    if force or read_champ_data_version() != version:
+        champs_ES = list_champions(version, lang="es_ES")
+
+        champ_list = [
+                {c.get("name", ""): champs.get(cid, {}).get("name", "")}
+                for cid, c in champs_ES.items()
+            ]
+        with open(OUT_CHAMP_DATA, "w", encoding="utf-8") as f:
+            json.dump({"version": version, "champions": champ_list}, f, ensure_ascii=False, indent=2)
+        print(f"Champion names exported to: {OUT_CHAMP_DATA}")
+    else:
+        print(f"Champion names already at {version}: {OUT_CHAMP_DATA}")
+
+    if force or read_table_version(OUT_NAMES) != version:
+        try:
+            build_name_tables(version)
+        except Exception as e:
+            fails.append(("*", "names", str(e)))
+    else:
+        print(f"Name tables already at {version}: {OUT_NAMES}")
+
     if fails:
         print("Some items failed:")
         for name, kind, info in fails[:20]:
@@ -172,10 +483,125 @@ def main():
         if len(fails) > 20:
             print(f" ... and {len(fails)-20} more")
 
-    print(f"\nPlace these folders next to your overlay:\n  {OUT_HEROES.resolve()}\n  {OUT_ULTS.resolve()}")
+    changed = any(counts[k].get("updated", 0) for k in counts)
+    if force or changed or not OUT_ATLAS.exists() or not OUT_ATLAS_INDEX.exists():
+        build_atlas(version)
+    else:
+        print(f"Atlas already up to date: {OUT_ATLAS}")
+
+    print(f"\nPlace these next to your overlay:\n  {OUT_ATLAS.resolve()}\n  {OUT_ATLAS_INDEX.resolve()}")
+
+# -------------------- Atlas ----------------------
+def build_atlas(version: str = "", width: int = ATLAS_WIDTH, icon: int = ATLAS_ICON) -> int:
+    """Pack every local icon into one image + a JSON index of sprite rects.
+
+    Keys are "<folder>/<slug>" (e.g. "heroes/aatrox", "spells/flash"), the
+    same slugs the overlay derives from champion and spell names. Sprites
+    are shelf-packed tallest first, which is near optimal here since icons
+    only come in a couple of square sizes. Icons larger than ``icon`` px are
+    scaled down to it first: nothing is drawn bigger, and at 96 and 64 px
+    every sprite edge falls on a 16 px JPEG block, so no sprite bleeds into
+    its neighbours.
+    """
+    from PIL import Image
+
+    icons = []
+    for folder in (OUT_HEROES, OUT_SPELLS, OUT_ULTS):
+        for path in sorted(folder.glob("*.png")):
+            with Image.open(path) as im:
+                im = im.convert("RGB")
+                im.thumbnail((icon, icon), Image.LANCZOS)  # only ever shrinks, keeps the aspect
+                icons.append((f"{folder.name}/{slugify(path.stem)}", im))
+    if not icons:
+        print("No icons to pack.")
+        return 0
+    icons.sort(key=lambda kv: (-kv[1].height, -kv[1].width, kv[0]))
+
+    sprites: Dict[str, List[int]] = {}
+    x = y = shelf_h = 0
+    for key, im in icons:
+        if x + im.width > width:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        sprites[key] = [x, y, im.width, im.height]
+        x += im.width
+        shelf_h = max(shelf_h, im.height)
+
+    atlas = Image.new("RGB", (width, y + shelf_h))
+    for key, im in icons:
+        sx, sy, _, _ = sprites[key]
+        atlas.paste(im, (sx, sy))
+    tmp = OUT_ATLAS.with_suffix(".part" + OUT_ATLAS.suffix)
+    atlas.save(tmp, "JPEG", quality=ATLAS_QUALITY, optimize=True)
+    tmp.replace(OUT_ATLAS)
+    with open(OUT_ATLAS_INDEX, "w", encoding="utf-8") as f:
+        json.dump({"version": version or read_champ_data_version(), "image": OUT_ATLAS.name, "sprites": sprites},
+                  f, separators=(",", ":"))
+    print(f"Packed {len(sprites)} icons into {OUT_ATLAS} ({atlas.width}x{atlas.height}, {OUT_ATLAS.stat().st_size // 1024} KB)")
+    return len(sprites)
+
+# -------------------- Benchmark ------------------
+BENCH_FILES = 200
+BENCH_LATENCY = 0.03  # seconds of simulated round-trip per request
+BENCH_PAYLOAD = b"\x89PNG\r\n\x1a\n" + b"\0" * 4096
+
+class _BenchHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like Data Dragon's CDN
+
+    def do_GET(self):
+        time.sleep(BENCH_LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(BENCH_PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(BENCH_PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+def bench(jobs: int = JOBS):
+    """Compare sequential vs pooled downloads against a local stand-in server."""
+    global DL
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _BenchHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        timings = {}
+        for n in sorted({1, jobs}):
+            DL = Downloader(jobs=n)
+            with tempfile.TemporaryDirectory() as tmp:
+                tasks = [
+                    (lambda i=i: download_file(f"{base}/img/{i}.png", Path(tmp) / f"{i}.png"))
+                    for i in range(BENCH_FILES)
+                ]
+                t0 = time.perf_counter()
+                ok = sum(1 for r in DL.run(tasks, total=len(tasks), desc=f"bench x{n}") if r)
+                timings[n] = time.perf_counter() - t0
+            print(f"jobs={n:<3} {ok}/{BENCH_FILES} files in {timings[n]:.2f}s")
+        if jobs != 1:
+            print(f"Speedup x{jobs}: {timings[1] / timings[jobs]:.1f}x")
+    finally:
+        server.shutdown()
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Build local League icon assets from Data Dragon.")
+    ap.add_argument("--jobs", "-j", type=int, default=JOBS, help=f"concurrent downloads (default {JOBS})")
+    ap.add_argument("--bench", action="store_true", help="benchmark the downloader against a local server")
+    ap.add_argument("--verify", action="store_true", help="re-hash local assets against the manifest (no network)")
+    ap.add_argument("--force", action="store_true", help="ignore the manifest and re-download everything")
+    ap.add_argument("--atlas", action="store_true", help="only repack the icon atlas from local files")
+    return ap.parse_args(argv)
 
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        main()
+        if args.bench:
+            bench(args.jobs)
+        elif args.verify:
+            sys.exit(verify())
+        elif args.atlas:
+            sys.exit(0 if build_atlas() else 1)
+        else:
+            main(args.jobs, force=args.force)
     except KeyboardInterrupt:
         print("\nInterrupted.")
@@ -1,13 +1,24 @@
 # pip install PySide6 requests pygetwindow google-cloud-firestore firebase-admin tqdm
 import sys
+import threading
+profile = None
+if __name__ == "__main__" and "--profile-startup" in sys.argv:
+    # per-phase and per-import timing up to the first painted frame
+    from src.StartupProfile import StartupProfile
+    profile = StartupProfile(); profile.install()
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 from src.widgets.OverlayWidget import OverlayWidget
-from pystray import Icon, Menu, MenuItem
-from PIL import Image, ImageDraw
-import threading
+from src.SyncBackend import active_backend
+from src.UserData import UserData
+from src.Scheduler import Scheduler
+from src.Activity import Activity
+from src.Metrics import configure as configure_metrics
+# pystray/PIL (tray), requests (Live Client), pygetwindow and Firebase/dotenv (team sync) load on first use
 
 
 def create_image():
+    from PIL import Image, ImageDraw
     # Generate an image and draw a pattern
     width = 64
     height = 64
@@ -27,6 +38,7 @@ def on_quit(icon, item):
     QApplication.quit()
 
 def run_tray_icon():
+    from pystray import Icon, Menu, MenuItem
     # Create the tray icon
     icon = Icon("Spell Tracker")
     icon.icon = create_image()
@@ -38,11 +50,28 @@ def run_tray_icon():
 
 # ================================ MAIN ========================================
 if __name__ == "__main__":
-    # Start the tray icon in a separate thread
-    tray_thread = threading.Thread(target=run_tray_icon, daemon=True)
-    tray_thread.start()
+    if profile: profile.phase("imports")
 
     # Start the Qt application
     app = QApplication(sys.argv)
+    if profile: profile.phase("QApplication")
+    if "--measure-power" in sys.argv:
+        # wakeups/s and CPU ms/min per activity level, printed on quit
+        Activity().measure()
+        app.aboutToQuit.connect(lambda: print("[ACTIVITY] Per level:\n" + Activity().report()))
+    # --metrics / --metrics-port N: counters and histograms on the diagnostics page (and http://127.0.0.1:N/metrics)
+    configure_metrics(sys.argv)
     w = OverlayWidget()
+    if profile:
+        profile.phase("OverlayWidget()")
+        profile.watch_first_paint(w)
+
+    # Start the tray icon in a separate thread, once the event loop runs (its imports stay off the first frame)
+    tray_thread = threading.Thread(target=run_tray_icon, daemon=True)
+    QTimer.singleShot(0, tray_thread.start)
+
+    # send team-sync writes still queued and drop the match stream before the process goes away
+    app.aboutToQuit.connect(lambda: active_backend() and active_backend().close())
+    app.aboutToQuit.connect(lambda: UserData().flush())
+    app.aboutToQuit.connect(lambda: Scheduler().shutdown(wait=False))
     sys.exit(app.exec())
@@ -1,8 +1,25 @@
 @echo off
 REM This batch file builds the Spell Tracker application for Windows using PyInstaller.
 
+REM Repack the icon atlas from res\heroes, res\spells and res\ultimates (it is generated, not committed)
+python "League Assets builder.py" --atlas
+if errorlevel 1 (
+    echo Could not pack the icon atlas, run "League Assets builder.py" first.
+    exit /b 1
+)
+
+REM Bundle the atlas and the name data (src/commons.py res_path finds them inside the exe).
+REM The loose icons are only the atlas' source and are not shipped.
+REM res\names.json (every locale's champion and spell names) is required: without it the exe
+REM would quietly fall back to English plus the hand-kept Spanish aliases.
+if not exist res\names.json (
+    echo res\names.json is missing, run "League Assets builder.py" first.
+    exit /b 1
+)
+set DATA=--add-data "res\atlas.jpg;res" --add-data "res\atlas.json;res" --add-data "res\champ_data.json;res" --add-data "res\names.json;res"
+
 REM Run PyInstaller to create a single executable without a console window
-pyinstaller --onefile --noconsole SpellTracker.py
+pyinstaller --onefile --noconsole %DATA% SpellTracker.py
 
 REM Move the generated executable to the release directory
 move dist\SpellTracker.exe ./
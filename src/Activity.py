@@ -0,0 +1,128 @@
+import time
+from typing import Dict, Optional
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, Signal
+from src.Scheduler import Scheduler
+
+class Activity(QObject):
+    """How much work the overlay is allowed to do right now.
+
+    idle     -> no game: only GameStateWorker's backed-off probe runs
+    loading  -> Live Client up, no players yet: game-state probes at
+                LOADING_INTERVAL, nothing else
+    hidden   -> in game, overlay hidden (League not focused): the focus
+                probe runs slower and the grid stops repainting
+    visible  -> in game and shown: everything on
+
+    The level follows ``GameStateWorker.state_changed`` and the overlay's
+    show/hide events. Each change applies ``POLICY`` to the Scheduler
+    (a job with ``None`` for the level is paused) and emits ``changed``.
+
+    ``measure()`` turns on accounting per level: GUI-thread wakeups (timer
+    and cross-thread signal events) and process CPU time, printed by
+    ``report()``. Off by default; the event filter is only installed then.
+    """
+    _instance = None
+
+    IDLE = "idle"
+    LOADING = "loading"
+    HIDDEN = "hidden"
+    VISIBLE = "visible"
+    LEVELS = (IDLE, LOADING, HIDDEN, VISIBLE)
+
+    # Scheduler job -> interval (s) per level, None = paused
+    POLICY: Dict[str, Dict[str, Optional[float]]] = {
+        "topmost": {IDLE: None, LOADING: None, HIDDEN: 0.25, VISIBLE: 0.2},
+    }
+    WAKEUP_EVENTS = (QEvent.Timer, QEvent.MetaCall)
+
+    changed = Signal(str)
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init()
+        return cls._instance
+
+    def __init__(self):
+        pass  # the singleton is set up once in _init
+
+    def _init(self):
+        QObject.__init__(self)
+        self.level = self.IDLE
+        self._game = "idle"
+        self._visible = True
+        self._measuring = False
+        self.wakeups = 0
+        self._stats: Dict[str, list] = {}  # level -> [seconds, wakeups, cpu seconds]
+        self._mark = None                   # (monotonic, wakeups, process_time) at the last level change
+
+    # ---------------- inputs ----------------
+    def set_game_state(self, state: str):
+        self._game = state
+        self._update()
+
+    def set_visible(self, visible: bool):
+        self._visible = bool(visible)
+        self._update()
+
+    def _update(self):
+        # GameStateWorker states: idle / loading / in_game / ended
+        if self._game == "in_game":
+            level = self.VISIBLE if self._visible else self.HIDDEN
+        elif self._game == "loading":
+            level = self.LOADING
+        else:
+            level = self.IDLE
+        if level == self.level:
+            return
+        self._account()
+        print(f"[ACTIVITY] {self.level} -> {level}")
+        self.level = level
+        self.apply()
+        self.changed.emit(level)
+
+    def apply(self):
+        """Pause/resume/tune the Scheduler jobs for the current level."""
+        sched = Scheduler()
+        for job, intervals in self.POLICY.items():
+            interval = intervals.get(self.level)
+            if interval is None:
+                sched.pause(job)
+            else:
+                sched.resume(job, interval=interval)
+
+    # ---------------- measurement ----------------
+    def measure(self):
+        """Start counting wakeups and CPU per level (``--measure-power``)."""
+        app = QCoreApplication.instance()
+        if self._measuring or app is None:
+            return
+        self._measuring = True
+        app.installEventFilter(self)
+        self._mark = (time.monotonic(), self.wakeups, time.process_time())
+
+    def eventFilter(self, obj, event):
+        if event.type() in self.WAKEUP_EVENTS:
+            self.wakeups += 1
+        return False
+
+    def _account(self):
+        if not self._measuring:
+            return
+        now = (time.monotonic(), self.wakeups, time.process_time())
+        row = self._stats.setdefault(self.level, [0.0, 0, 0.0])
+        row[0] += now[0] - self._mark[0]
+        row[1] += now[1] - self._mark[1]
+        row[2] += now[2] - self._mark[2]
+        self._mark = now
+
+    def report(self) -> str:
+        """Per level: time spent, GUI wakeups per second and CPU ms per minute."""
+        self._account()
+        rows = [f"{'level':<9}{'seconds':>10}{'wakeups/s':>11}{'cpu ms/min':>12}"]
+        for level in self.LEVELS:
+            secs, wakeups, cpu = self._stats.get(level, (0.0, 0, 0.0))
+            if secs <= 0:
+                continue
+            rows.append(f"{level:<9}{secs:>10.1f}{wakeups / secs:>11.2f}{cpu * 1000.0 * 60.0 / secs:>12.1f}")
+        return "\n".join(rows)
@@ -0,0 +1,32 @@
+import time
+from collections import deque
+from typing import Callable, Optional
+
+class ClockSync:
+    """Offset of the sync server's clock from ours, estimated NTP-style.
+
+    Each sample is (t0 local send, server time, t1 local receive) in ms;
+    the server is assumed to stamp halfway through the round trip, so the
+    sample with the smallest round trip is the most trustworthy one.
+    """
+    KEEP = 8
+
+    def __init__(self):
+        self.samples = deque(maxlen=self.KEEP)  # (rtt_ms, offset_ms)
+        self.offset_ms = 0.0
+        self.rtt_ms: Optional[float] = None
+
+    def add(self, t0_ms: float, server_ms: float, t1_ms: float):
+        self.samples.append((t1_ms - t0_ms, server_ms - (t0_ms + t1_ms) / 2.0))
+        self.rtt_ms, self.offset_ms = min(self.samples)
+
+    def sample(self, probe: Callable[[], float], n: int = 3):
+        """Take ``n`` samples with ``probe()``, which returns the server time in ms."""
+        for _ in range(n):
+            t0 = time.time() * 1000.0
+            server_ms = probe()
+            self.add(t0, server_ms, time.time() * 1000.0)
+        print(f"[SYNC] Clock offset {self.offset_ms:+.1f} ms (rtt {self.rtt_ms:.1f} ms)")
+
+    def now_ms(self) -> float:
+        return time.time() * 1000.0 + self.offset_ms
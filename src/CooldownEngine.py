@@ -0,0 +1,118 @@
+import heapq
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+class CooldownEngine:
+    """Cooldown table for ``rows`` enemies x ``slots`` spells, keyed by absolute deadlines.
+
+    Each cell stores the monotonic time its spell is back up (0.0 = up), so
+    "is it up / how long left" is one array read, no per-frame ticking. A
+    (champion, spell) -> cell index replaces scanning the roster for team
+    sync updates, and a lazy min-heap of (deadline, cell) yields expiries in
+    O(log n). No Qt in here on purpose.
+    """
+    __slots__ = ("rows", "slots", "_clock", "_deadline", "_duration", "_index", "_heap")
+
+    def __init__(self, rows: int = 5, slots: int = 2, clock: Callable[[], float] = time.monotonic):
+        self.rows = rows
+        self.slots = slots
+        self._clock = clock
+        self._deadline = array("d", [0.0] * (rows * slots))
+        self._duration = array("d", [0.0] * (rows * slots))
+        self._index: Dict[Tuple[str, str], int] = {}
+        self._heap: List[Tuple[float, int]] = []
+
+    # ---------------- roster ----------------
+    def cell(self, row: int, slot: int) -> int:
+        if not (0 <= row < self.rows and 0 <= slot < self.slots):
+            raise IndexError(f"cell ({row}, {slot}) out of range")
+        return row * self.slots + slot
+
+    def set_roster(self, roster: List[Tuple[str, List[str]]]):
+        """Bind (champion, [spell per slot]) to rows and reset every cooldown."""
+        self.clear()
+        for row, (champion, spells) in enumerate(roster[:self.rows]):
+            for slot, spell in enumerate(spells[:self.slots]):
+                self.bind(row, slot, champion, spell)
+
+    def bind(self, row: int, slot: int, champion: str, spell: str):
+        """Route (champion, spell) to a cell; extra names (aliases) may point at the same cell."""
+        if champion and spell:
+            self._index.setdefault((champion, spell), self.cell(row, slot))
+
+    def lookup(self, champion: str, spell: str) -> Optional[Tuple[int, int]]:
+        c = self._index.get((champion, spell))
+        return None if c is None else divmod(c, self.slots)
+
+    def clear(self):
+        for i in range(len(self._deadline)):
+            self._deadline[i] = 0.0
+            self._duration[i] = 0.0
+        self._index.clear()
+        self._heap.clear()
+
+    # ---------------- mutations ----------------
+    def start(self, row: int, slot: int, duration: float, now: Optional[float] = None) -> float:
+        """Put a cell on cooldown for ``duration`` seconds from ``now``. Returns the deadline."""
+        now = self._clock() if now is None else now
+        return self.start_until(row, slot, now + max(0.0, duration), duration)
+
+    def start_until(self, row: int, slot: int, deadline: float, duration: float = 0.0) -> float:
+        c = self.cell(row, slot)
+        self._deadline[c] = deadline
+        self._duration[c] = max(0.0, duration)
+        heapq.heappush(self._heap, (deadline, c))
+        return deadline
+
+    def start_from_wall(self, row: int, slot: int, used_at: float, duration: float,
+                        wall_now: Optional[float] = None, now: Optional[float] = None) -> float:
+        """Cooldown that started at wall-clock ``used_at`` (e.g. a team sync timestamp)."""
+        wall_now = time.time() if wall_now is None else wall_now
+        now = self._clock() if now is None else now
+        deadline = now + (used_at + duration - wall_now)
+        if deadline <= now:
+            self.reset(row, slot); return 0.0
+        return self.start_until(row, slot, deadline, duration)
+
+    def reset(self, row: int, slot: int):
+        c = self.cell(row, slot)
+        self._deadline[c] = 0.0  # heap entry goes stale and is dropped lazily
+
+    # ---------------- queries ----------------
+    def deadline(self, row: int, slot: int) -> float:
+        return self._deadline[self.cell(row, slot)]
+
+    def remaining(self, row: int, slot: int, now: Optional[float] = None) -> float:
+        now = self._clock() if now is None else now
+        return max(0.0, self._deadline[self.cell(row, slot)] - now)
+
+    def is_running(self, row: int, slot: int, now: Optional[float] = None) -> bool:
+        now = self._clock() if now is None else now
+        return self._deadline[self.cell(row, slot)] > now
+
+    def running(self, now: Optional[float] = None) -> List[Tuple[int, int, float]]:
+        """(row, slot, remaining) of every cell currently on cooldown."""
+        now = self._clock() if now is None else now
+        return [(c // self.slots, c % self.slots, d - now) for c, d in enumerate(self._deadline) if d > now]
+
+    def _prune(self):
+        heap, deadline = self._heap, self._deadline
+        while heap and deadline[heap[0][1]] != heap[0][0]:
+            heapq.heappop(heap)
+
+    def next_expiry(self) -> Optional[float]:
+        self._prune()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_expired(self, now: Optional[float] = None) -> List[Tuple[int, int]]:
+        """Cells whose cooldown ended at or before ``now``; each is reported once."""
+        now = self._clock() if now is None else now
+        out = []
+        self._prune()
+        while self._heap and self._heap[0][0] <= now:
+            _, c = heapq.heappop(self._heap)
+            self._deadline[c] = 0.0
+            out.append(divmod(c, self.slots))
+            self._prune()
+        return out
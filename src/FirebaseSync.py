@@ -1,13 +1,18 @@
 import time
 import firebase_admin
-import re
 from firebase_admin import credentials,db
 import os
+from typing import Dict
 from dotenv import load_dotenv
+from src.Scheduler import Scheduler
+from src.SyncBackend import SyncBackend, WriteQueue
 load_dotenv()
-class FirebaseSync:
+
+class FirebaseSync(SyncBackend):
+    TAG = "FIREBASE"
     _instance = None
-    match_id: str = ""
+    _listener = None  # the one live RTDB stream (ListenerRegistration), for match_id
+    _clock_job = None  # Future of the clock sampling in flight, if any
     DB_URL = os.getenv("FIREBASE_DB_URL")
     DEFAULT_DB_URL = "https://leaguespelltracker-default-rtdb.europe-west1.firebasedatabase.app/"
     def __new__(cls):
@@ -21,51 +26,70 @@ class FirebaseSync:
             except Exception as e:
                 print(f"[FIREBASE] Initialization error: {e}")
                 pass
+            cls._instance._init_sync()
+            cls._instance.writes = WriteQueue(cls._instance._write_batch)
+            cls._instance.signals = cls._instance.writes.signals
         return cls._instance
     # "/Sett fanatic#SETTilouteur84#biteMaren Gain#GarenPulz Say Run#EUWDekyl#EUW"
     def setMatchID(self, match_id):
         newmatch_id = self._sanitize_key(match_id)
         if self.match_id != newmatch_id:
-            self.match_id = newmatch_id
-            ref = db.reference(f"/{self.match_id}")
-            ref.listen(self.on_snapshot)
+            self.leave()
+            ref = db.reference(f"/{newmatch_id}")
+            # first event is the whole match subtree at "/", so late joiners see running cooldowns
+            self._listener = ref.listen(self._dispatch)
+            self.match_id = newmatch_id  # only now: if listen() raised, the next call retries
             print(f"[FIREBASE] Listening to match ID: {self.match_id}")
+            if self._clock_job is None or self._clock_job.done():
+                self._clock_job = Scheduler().submit(self._sample_clock)
+
+    def _sample_clock(self, n: int = 3):
+        # the server stamps the write, so only the set() round trip is timed; the read-back is not
+        ref = db.reference(f"/_clock/{self.peer_id}")
+        try:
+            for _ in range(n):
+                t0 = time.time() * 1000.0
+                ref.set({".sv": "timestamp"})
+                t1 = time.time() * 1000.0
+                self.clock.add(t0, float(ref.get()), t1)
+            print(f"[FIREBASE] Clock offset {self.clock.offset_ms:+.1f} ms (rtt {self.clock.rtt_ms:.1f} ms)")
+        except Exception as e:
+            print("[FIREBASE] Clock sampling failed:", e)
+        finally:
+            try:
+                ref.delete()  # scratch node, one per peer: don't leave it in the database
+            except Exception as e:
+                print("[FIREBASE] Could not remove clock node:", e)
+
+    def leave(self):
+        """Game over: stop streaming the match (queued writes still go out)."""
+        self._close_listener()
+        super().leave()
 
-    def _sanitize_key(self, key: str) -> str:
-        """Sanitize a string to be safe as a RTDB key segment.
-        Firebase RTDB keys cannot contain '.', '#', '$', '[', or ']'.
-        Also replace '/' to avoid accidental nested paths from user input.
-        """
-        if not isinstance(key, str):
-            key = str(key or "")
-        # replace invalid characters with underscore
-        return re.sub(r'[.\#\$\[\]/]', '_', key)
+    def close(self, timeout: float = 2.0):
+        self.writes.close(timeout)
+        self.leave()
 
-    def listen(self, callback):
-        print("[FIREBASE] Setting on_snapshot callback.")
-        self.on_snapshot = callback
+    def _close_listener(self):
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        try:
+            listener.close()  # closes the SSE stream and joins its thread
+            print(f"[FIREBASE] Stopped listening to match ID: {self.match_id}")
+        except Exception as e:
+            print("[FIREBASE] Failed to close listener:", e)
 
-    def mark_spell_used(self, champ, spell):
-        timestamp = int(time.time())  # Unix time in seconds
-        spell = self.sanitize_spell(spell)
-        print(f"[FIREBASE] Marking spell used: {champ} - {spell} at {timestamp}")
-        ref = db.reference(f"/{self.match_id}/{champ}/{spell}")
-        ref.set({"usedAt": timestamp})
+    def _put(self, path: str, value: dict):
+        if not self.match_id:  # would land at the database root
+            print(f"[FIREBASE] Not in a match, dropping write to {path}")
+            self.signals.failed.emit([path], "not in a match")
+            return
+        self.writes.put(f"{self.match_id}/{path}", value)
 
-    def reset_spell(self, champ, spell):
-        timestamp = int(time.time()) - 600
-        spell = self.sanitize_spell(spell)
-        print(f"[FIREBASE] Resetting spell: {champ} - {spell}")
-        ref = db.reference(f"/{self.match_id}/{champ}/{spell}")
-        ref.set({"usedAt": timestamp})
+    def _write_batch(self, batch: Dict[str, dict]):
+        # one round-trip for every path changed in the window
+        db.reference("/").update(batch)
 
-    def sanitize_spell(self, spell_name: str) -> str:
-        if spell_name in self.duplicatedSpells:
-            spell_name = self.duplicatedSpells[spell_name]
-        return spell_name
-    
-    duplicatedSpells = {
-        "Unleashed Teleport": "Teleport",
-        "Unleashed Smite": "Smite",
-        "Hexflash": "Flash",
-    }
\ No newline at end of file
+    def flush(self, timeout: float = 2.0) -> bool:
+        return self.writes.flush(timeout)
@@ -0,0 +1,158 @@
+import bisect
+import os
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+_gw = False  # pygetwindow module once imported (None when unavailable)
+
+def pygetwindow():
+    """pygetwindow, imported on first use (None where it is not supported)."""
+    global _gw
+    if _gw is False:
+        try:
+            import pygetwindow as gw
+        except Exception:  # pygetwindow only supports Windows/macOS
+            gw = None
+        _gw = gw
+    return _gw
+
+class FocusProbe:
+    """Where TopmostWorker gets the foreground window title from.
+
+    Polling probes only implement ``title()``; the worker asks at its job
+    interval. Event-driven probes also call ``notify`` (given to ``start``)
+    whenever the foreground window changes, and set ``POLL_INTERVAL`` to the
+    slow safety poll that catches what the events miss (title changes of an
+    already focused window). The base class has no window system and never
+    reports a title.
+    """
+    NAME = "none"
+    POLL_INTERVAL: Optional[float] = None  # seconds; None = poll at the worker's interval
+
+    def title(self) -> str:
+        return ""
+
+    def start(self, notify: Callable[[], None]):
+        pass
+
+    def stop(self):
+        pass
+
+class PyGetWindowProbe(FocusProbe):
+    """``pygetwindow.getActiveWindow()`` on every poll."""
+    NAME = "pygetwindow"
+
+    def title(self) -> str:
+        active = pygetwindow().getActiveWindow()
+        return active.title if active else ""
+
+class WinEventProbe(FocusProbe):
+    """Windows foreground-change hook (SetWinEventHook, out of context).
+
+    The callback runs on the thread that installed the hook while it pumps
+    messages, i.e. the Qt GUI thread, so ``notify`` needs no locking.
+    """
+    NAME = "winevent"
+    POLL_INTERVAL = 2.0
+    EVENT_SYSTEM_FOREGROUND = 0x0003
+    WINEVENT_OUTOFCONTEXT = 0x0000
+
+    def __init__(self):
+        import ctypes, ctypes.wintypes as wt
+        self._ctypes = ctypes
+        self._user32 = ctypes.windll.user32
+        self._proc_type = ctypes.WINFUNCTYPE(None, wt.HANDLE, wt.DWORD, wt.HWND, wt.LONG, wt.LONG, wt.DWORD, wt.DWORD)
+        self._user32.SetWinEventHook.restype = wt.HANDLE
+        self._user32.SetWinEventHook.argtypes = [wt.DWORD, wt.DWORD, wt.HMODULE, self._proc_type, wt.DWORD, wt.DWORD, wt.DWORD]
+        self._user32.UnhookWinEvent.argtypes = [wt.HANDLE]
+        self._user32.GetForegroundWindow.restype = wt.HWND
+        self._hook = None
+        self._proc = None  # keep the ctypes callback alive while hooked
+
+    def title(self) -> str:
+        hwnd = self._user32.GetForegroundWindow()
+        if not hwnd:
+            return ""
+        n = self._user32.GetWindowTextLengthW(hwnd)
+        buf = self._ctypes.create_unicode_buffer(n + 1)
+        self._user32.GetWindowTextW(hwnd, buf, n + 1)
+        return buf.value
+
+    def start(self, notify: Callable[[], None]):
+        if self._hook:
+            return
+        self._proc = self._proc_type(lambda *_: notify())
+        self._hook = self._user32.SetWinEventHook(self.EVENT_SYSTEM_FOREGROUND, self.EVENT_SYSTEM_FOREGROUND,
+                                                  None, self._proc, 0, 0, self.WINEVENT_OUTOFCONTEXT)
+        if not self._hook:
+            self._proc = None
+            raise OSError("SetWinEventHook failed")
+
+    def stop(self):
+        if self._hook:
+            self._user32.UnhookWinEvent(self._hook)
+            self._hook = None
+            self._proc = None
+
+class ScriptedProbe(FocusProbe):
+    """Fake foreground window for tests and benchmarks on any OS.
+
+    ``script`` is [(seconds after start, title), ...]; ``set_title`` changes
+    it by hand and, once started, notifies like an event-driven probe.
+    ``calls`` counts ``title()`` lookups.
+    """
+    NAME = "scripted"
+
+    def __init__(self, script: Optional[List[Tuple[float, str]]] = None, poll_interval: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.script = sorted(script or [])
+        self._times = [t for t, _ in self.script]
+        self.POLL_INTERVAL = poll_interval
+        self.clock = clock
+        self.calls = 0
+        self._manual: Optional[str] = None
+        self._t0: Optional[float] = None
+        self._notify: Optional[Callable[[], None]] = None
+
+    def title(self) -> str:
+        self.calls += 1
+        if self._manual is not None:
+            return self._manual
+        if self._t0 is None:
+            return ""
+        i = bisect.bisect_right(self._times, self.clock() - self._t0) - 1
+        return self.script[i][1] if i >= 0 else ""
+
+    def set_title(self, title: str):
+        self._manual = title
+        if self._notify:
+            self._notify()
+
+    def start(self, notify: Callable[[], None]):
+        self._t0 = self.clock()
+        self._notify = notify
+
+    def stop(self):
+        self._notify = None
+
+PROBES = {p.NAME: p for p in (FocusProbe, PyGetWindowProbe, WinEventProbe, ScriptedProbe)}
+
+def focus_probe(name: Optional[str] = None) -> FocusProbe:
+    """Probe from ``name`` or FOCUS_PROBE; defaults to the hook on Windows, else pygetwindow when present."""
+    if name is None:
+        from dotenv import load_dotenv
+        load_dotenv()
+    name = (name or os.getenv("FOCUS_PROBE", "")).strip().lower()
+    if not name:
+        name = "winevent" if sys.platform.startswith("win") else ("pygetwindow" if pygetwindow() is not None else "none")
+    if name == "pygetwindow" and pygetwindow() is None:
+        print("[TOPMOST] pygetwindow unavailable, focus is never reported")
+        name = "none"
+    if name not in PROBES:
+        print(f"[TOPMOST] Unknown FOCUS_PROBE '{name}', focus is never reported")
+    try:
+        return PROBES.get(name, FocusProbe)()
+    except Exception as e:
+        print(f"[TOPMOST] Focus probe '{name}' unavailable ({e}), polling instead")
+        return PyGetWindowProbe() if pygetwindow() is not None else FocusProbe()
@@ -0,0 +1,199 @@
+import re, unicodedata, os, json
+from dataclasses import dataclass
+from typing import Dict, Optional
+from src.commons import res_path
+
+# ============================== RECORDS =======================================
+@dataclass(frozen=True)
+class ChampionRecord:
+    name: str           # canonical (en_US) display name
+    slug: str
+    hero_icon: str      # atlas key, e.g. "heroes/aatrox"
+    ultimate_icon: str  # atlas key, e.g. "ultimates/aatrox"
+    ult_cd: int
+
+@dataclass(frozen=True)
+class SpellRecord:
+    name: str           # canonical (en_US) display name
+    slug: str
+    icon: str           # atlas key, e.g. "spells/flash"
+    cooldown: int       # 0 when unknown
+
+# ============================== REGISTRY ======================================
+class GameRegistry:
+    """Champion and summoner spell records, built once on first use.
+
+    Any known display name (English or localized) maps straight to its
+    canonical record, so resolving an enemy is a dict lookup and slugs /
+    icon keys / cooldowns are computed up front instead of per paint.
+    Unknown names get a record on first sight and are memoized too.
+
+    Names come from res/names.json (every Data Dragon locale, generated by
+    the assets builder). Without it we fall back to the es_ES champion map
+    in res/champ_data.json. The hand-written SUMMONER_CD_ES aliases are
+    applied on top either way; generated names win where both exist.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init()
+        return cls._instance
+
+    def _init(self, names_path=res_path("names.json"), champ_data_path=res_path("champ_data.json"), ult_cd_path="ult_cooldowns.json"):
+        self._ult_cd_map = load_ult_cd_map(ult_cd_path)
+        self._champions: Dict[str, ChampionRecord] = {}
+        self._spells: Dict[str, SpellRecord] = {}
+        self.version = ""
+        self._load_spells()
+        if not self._load_names(names_path):
+            self._load_champions(champ_data_path)
+        # always: names.json has no in-game variants (Hextello, "Teleportar desatado", ...)
+        self._load_spanish_spells()
+
+    def _load_names(self, path: str) -> bool:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                table = json.load(f) or {}
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print("[REGISTRY] Failed to load name tables:", e)
+            return False
+        self.version = table.get("version", "")
+        # champions: localized -> [canonical, slug]; spells: localized -> [canonical, cooldown, slug]
+        for localized, (canonical, slug) in (table.get("champions") or {}).items():
+            rec = self._champions.get(canonical)
+            if rec is None:
+                rec = self._champions[canonical] = ChampionRecord(
+                    name=canonical, slug=slug,
+                    hero_icon=f"heroes/{slug}" if slug else "",
+                    ultimate_icon=f"ultimates/{slug}" if slug else "",
+                    ult_cd=int(self._ult_cd_map.get(slug, DEFAULT_ULT_CD)),
+                )
+            self._champions.setdefault(localized, rec)
+        for localized, (canonical, cooldown, slug) in (table.get("spells") or {}).items():
+            rec = self._spells.get(canonical)
+            if rec is None or canonical == localized:  # Data Dragon beats the hand-kept cooldowns
+                rec = self._spells[canonical] = SpellRecord(
+                    name=canonical, slug=slug, icon=f"spells/{slug}" if slug else "", cooldown=int(cooldown or 0))
+            self._spells.setdefault(localized, rec)
+        return True
+
+    def _load_champions(self, path: str):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                champ_data = json.load(f) or {}
+        except Exception as e:
+            print("[REGISTRY] Failed to load champion data:", e)
+            return
+        self.version = champ_data.get("version", "")
+        # champions is a list of {localized name: en_US name}
+        for entry in champ_data.get("champions", []):
+            for localized, canonical in entry.items():
+                rec = self.champion(canonical or localized)
+                self._champions.setdefault(localized, rec)
+
+    def _load_spells(self):
+        # hand-kept table: also covers in-game variants Data Dragon doesn't list (Hexflash, Unleashed ...)
+        for name, cd in SUMMONER_CD.items():
+            self._spells[name] = self._make_spell(name, cd)
+
+    def _load_spanish_spells(self):
+        # SUMMONER_CD_ES lists the same spells in the same order
+        for localized, canonical in zip(SUMMONER_CD_ES, SUMMONER_CD):
+            self._spells.setdefault(localized, self._spells[canonical])
+
+    def _make_champion(self, name: str) -> ChampionRecord:
+        slug = slugify(name)
+        return ChampionRecord(
+            name=name,
+            slug=slug,
+            hero_icon=f"heroes/{slug}" if slug else "",
+            ultimate_icon=f"ultimates/{slug}" if slug else "",
+            ult_cd=int(self._ult_cd_map.get(slug, DEFAULT_ULT_CD)),
+        )
+
+    def _make_spell(self, name: str, cooldown: int = 0) -> SpellRecord:
+        slug = slugify(name)
+        return SpellRecord(name=name, slug=slug, icon=f"spells/{slug}" if slug else "", cooldown=int(cooldown or 0))
+
+    def champion(self, name: str) -> ChampionRecord:
+        name = name or ""
+        rec = self._champions.get(name)
+        if rec is None:
+            rec = self._champions[name] = self._make_champion(name)
+        return rec
+
+    def spell(self, name: str) -> SpellRecord:
+        name = name or ""
+        rec = self._spells.get(name)
+        if rec is None:
+            rec = self._spells[name] = self._make_spell(name)
+        return rec
+
+    def find_spell(self, name: str) -> Optional[SpellRecord]:
+        """Like spell() but without memoizing unknown names."""
+        return self._spells.get(name)
+
+# ============================== COOLDOWNS =====================================
+SUMMONER_CD = {
+    "Flash": 300,
+    "Hexflash": 300,
+    "Ignite": 180,
+    "Teleport": 360,
+    "Unleashed Teleport": 360,
+    "Heal": 240,
+    "Barrier": 180,
+    "Exhaust": 210,
+    "Ghost": 210,
+    "Cleanse": 210,
+    "Smite": 15,
+    "Unleashed Smite": 15,
+    "Clarity": 240,
+    "Mark": 80,
+    "Porobelt": 10,
+    "Poro_toss": 10,
+}
+
+SUMMONER_CD_ES = {
+    "Destello": 300,
+    "Hextello": 300,
+    "Prender": 180,
+    "Teleportar": 360,
+    "Teleportar desatado": 360,
+    "Curar": 240,
+    "Barrera": 180,
+    "Extenuación": 210,
+    "Fantasmal": 210,
+    "Limpiar": 210,
+    "Aplastar": 15,
+    "Aplastar desatado": 15,
+    "Claridad": 240,
+    "Marca": 80,
+    "porobelt": 10,
+    "poro_toss": 10,
+}
+DEFAULT_ULT_CD = 120
+
+def load_ult_cd_map(path="ult_cooldowns.json") -> Dict[str, int]:
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            return {slugify(k): int(v) for k, v in raw.items() if isinstance(v, (int, float, str))}
+        except Exception as e:
+            print("[ULT-CD] Failed to load ult_cooldowns.json:", e)
+    return {}
+
+# ============================== HELPERS =======================================
+def slugify(name: str) -> str:
+    if not name:
+        return ""
+    s = unicodedata.normalize("NFKD", name)
+    s = s.encode("ascii", "ignore").decode("ascii")
+    s = s.lower()
+    s = re.sub(r"[^\w]+", "_", s)
+    s = re.sub(r"_+", "_", s).strip("_")
+    return s
@@ -0,0 +1,66 @@
+import json
+import os
+from typing import Dict, Optional, Tuple
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QPixmap
+from src.commons import res_path
+
+class IconAtlas:
+    """Every hero/spell/ultimate icon packed into one image (res/atlas.jpg).
+
+    The sprite index (res/atlas.json) maps "<folder>/<slug>" keys such as
+    "heroes/aatrox" or "spells/flash" to [x, y, w, h] rects. The sheet is
+    decoded once on first use and sub-pixmaps are cut from it on demand.
+    Keys missing from the atlas fall back to the loose res/<key>.png files.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init()
+        return cls._instance
+
+    def _init(self, res_dir: str = res_path()):
+        self._res_dir = res_dir
+        self._image_path = os.path.join(res_dir, "atlas.jpg")
+        self._rects: Dict[str, Tuple[int, int, int, int]] = {}
+        self._sheet: Optional[QPixmap] = None
+        self._cache: Dict[str, Optional[QPixmap]] = {}
+        self.version = ""
+        try:
+            with open(os.path.join(res_dir, "atlas.json"), "r", encoding="utf-8") as f:
+                index = json.load(f) or {}
+            self.version = index.get("version", "")
+            self._image_path = os.path.join(res_dir, index.get("image", "atlas.jpg"))
+            self._rects = {k: tuple(v) for k, v in (index.get("sprites") or {}).items()}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print("[ATLAS] Failed to load atlas index:", e)
+
+    def _get_sheet(self) -> Optional[QPixmap]:
+        # QPixmap needs a QGuiApplication, so decode lazily on the first paint
+        if self._sheet is None:
+            sheet = QPixmap(self._image_path) if self._rects else QPixmap()
+            if self._rects and sheet.isNull():
+                print(f"[ATLAS] Could not load {self._image_path}, using loose icons.")
+                self._rects = {}
+            self._sheet = sheet
+        return self._sheet
+
+    def pixmap(self, key: str) -> Optional[QPixmap]:
+        """Pixmap for a "<folder>/<slug>" key, or None if there is no such icon."""
+        if not key: return None
+        if key in self._cache: return self._cache[key]
+        pm = None
+        sheet = self._get_sheet()
+        rect = self._rects.get(key)
+        if rect and sheet is not None:
+            pm = sheet.copy(QRect(*rect))
+        else:
+            path = os.path.join(self._res_dir, f"{key}.png")
+            if os.path.exists(path):
+                pm = QPixmap(path)
+        self._cache[key] = pm
+        return pm
@@ -0,0 +1,193 @@
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from typing import Dict, Optional
+from dotenv import load_dotenv
+from src.SyncBackend import SyncBackend, SyncEvent, SyncSignals
+load_dotenv()
+
+class LanSync(SyncBackend):
+    """Team sync over UDP multicast for teammates on the same LAN/VPN.
+
+    Every peer joins one multicast group and tags its datagrams with the
+    match id, so peers in the same game find each other without a server:
+
+      hello  {"t": "hello", "m": match, "from": peer}        on join (repeated)
+      state  {"t": "state", "m": match, "from": peer, "to": peer, "v": {path: value}}
+      set    {"t": "set",   "m": match, "from": peer, "path": "Ahri/Flash", "v": {"usedAt": ts}}
+      ack    {"t": "ack",   "m": match, "from": peer, "to": peer, "path": "Ahri/Flash", "trace": id}
+
+    A peer answers ``hello`` with everything it knows about the match, which
+    a late joiner receives as one "/" snapshot. Sends are fire-and-forget,
+    so ``signals.written`` only fires once a peer has echoed the write back
+    with an ``ack`` (nobody else in the match = never confirmed). Several processes on one box
+    work too (SO_REUSEADDR/SO_REUSEPORT + multicast loopback). There is no
+    server to take time from, so the clock offset stays 0 (peers on one LAN
+    are normally NTP-synced anyway).
+    """
+    TAG = "LANSYNC"
+    _instance = None
+    GROUP = os.getenv("LAN_SYNC_GROUP", "239.255.77.77")
+    PORT = int(os.getenv("LAN_SYNC_PORT", "47777"))
+    IFACE = os.getenv("LAN_SYNC_IFACE", "0.0.0.0")  # local address of the LAN/VPN interface
+    TTL = int(os.getenv("LAN_SYNC_TTL", "1"))
+    HELLO_RETRIES = 3
+    HELLO_INTERVAL = 0.5  # seconds
+    MAX_DATAGRAM = 8192
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init()
+        return cls._instance
+
+    def _init(self):
+        self._init_sync()
+        self.signals = SyncSignals()
+        self._state: Dict[str, dict] = {}  # "Ahri/Flash" -> {"usedAt": ts} for match_id
+        self._unacked: Dict[str, str] = {}  # path -> trace of our latest write no peer has echoed yet
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._hellos_left = 0
+        self._next_hello = 0.0
+
+    # ---------------- socket ----------------
+    def _open(self):
+        if self._sock is not None:
+            return
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        sock.bind(("", self.PORT))
+        mreq = struct.pack("4s4s", socket.inet_aton(self.GROUP), socket.inet_aton(self.IFACE))
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, self.TTL)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+        if self.IFACE != "0.0.0.0":
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(self.IFACE))
+        sock.settimeout(self.HELLO_INTERVAL / 2)
+        self._sock = sock
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="lan-sync", daemon=True)
+        self._thread.start()
+        print(f"[LANSYNC] Peer {self.peer_id} on {self.GROUP}:{self.PORT}")
+
+    def _send(self, msg: dict) -> Optional[str]:
+        """Send one datagram; returns the error text on failure."""
+        if self._sock is None:
+            return "not connected"
+        try:
+            self._sock.sendto(json.dumps(msg, separators=(",", ":")).encode("utf-8"), (self.GROUP, self.PORT))
+            return None
+        except OSError as e:
+            return str(e)
+
+    # ---------------- backend API ----------------
+    def setMatchID(self, match_id):
+        newmatch_id = self._sanitize_key(match_id)
+        if self.match_id == newmatch_id:
+            return
+        self._open()
+        with self._lock:
+            self.match_id = newmatch_id
+            self._state = {}
+            self._unacked = {}
+            self._hellos_left = self.HELLO_RETRIES
+            self._next_hello = 0.0
+        print(f"[LANSYNC] Joined match ID: {self.match_id}")
+
+    def leave(self):
+        with self._lock:
+            super().leave()
+            self._state = {}
+            self._unacked = {}
+            self._hellos_left = 0
+
+    def close(self, timeout: float = 2.0):
+        self.leave()
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout)
+        if self._sock:
+            self._sock.close()
+        self._sock = self._thread = None
+
+    def _put(self, path: str, value: dict):
+        with self._lock:
+            if not self.match_id:
+                return
+            self._state[path] = value
+            self._unacked[path] = value.get("trace", "")
+            match_id = self.match_id
+        error = self._send({"t": "set", "m": match_id, "from": self.peer_id, "path": path, "v": value})
+        if error:
+            print(f"[LANSYNC] Send failed for {path}: {error}")
+            self.signals.failed.emit([path], error)
+
+    # ---------------- receive loop ----------------
+    def _run(self):
+        while self._running:
+            self._maybe_hello()
+            try:
+                payload, _ = self._sock.recvfrom(self.MAX_DATAGRAM)
+            except socket.timeout:
+                continue
+            except OSError:
+                if self._running:
+                    time.sleep(self.HELLO_INTERVAL)
+                continue
+            try:
+                self._handle(json.loads(payload.decode("utf-8")))
+            except Exception as e:
+                print("[LANSYNC] Bad datagram:", e)
+
+    def _maybe_hello(self):
+        with self._lock:
+            if not self._hellos_left or time.monotonic() < self._next_hello:
+                return
+            self._hellos_left -= 1
+            self._next_hello = time.monotonic() + self.HELLO_INTERVAL
+            match_id = self.match_id
+        self._send({"t": "hello", "m": match_id, "from": self.peer_id})
+
+    def _handle(self, msg: dict):
+        kind = msg.get("t")
+        with self._lock:
+            if msg.get("from") == self.peer_id or not self.match_id or msg.get("m") != self.match_id:
+                return
+            if kind == "hello":
+                reply = dict(self._state)
+            elif kind == "set" and msg.get("path"):
+                self._state[msg["path"]] = msg.get("v")
+            elif kind == "ack" and msg.get("to") == self.peer_id:
+                # only the echo of our latest value for the path confirms it
+                if msg.get("path") not in self._unacked or self._unacked[msg["path"]] != msg.get("trace"):
+                    return
+                del self._unacked[msg["path"]]
+            elif kind == "state" and msg.get("to") == self.peer_id:
+                # fill only what we don't know; anything we already have is at least as fresh
+                fresh = {k: v for k, v in (msg.get("v") or {}).items() if k not in self._state}
+                self._state.update(fresh)
+            else:
+                return
+        if kind == "hello":
+            if reply:
+                self._send({"t": "state", "m": msg["m"], "from": self.peer_id, "to": msg.get("from"), "v": reply})
+        elif kind == "set":
+            value = msg.get("v")
+            self._send({"t": "ack", "m": msg["m"], "from": self.peer_id, "to": msg.get("from"), "path": msg["path"],
+                        "trace": value.get("trace", "") if isinstance(value, dict) else ""})
+            self._dispatch(SyncEvent("/" + msg["path"], value))
+        elif kind == "ack":
+            self.signals.written.emit([msg["path"]])
+        elif fresh:
+            self._dispatch(SyncEvent("/", fresh))  # snapshot, like a join
@@ -0,0 +1,150 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, Type
+from src.commons import LiveClient, live_client
+
+# ============================== EVENTS ========================================
+@dataclass
+class LiveEvent:
+    """One entry of /liveclientdata/eventdata."""
+    id: int
+    name: str
+    time: float  # game time in seconds
+    raw: Dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_raw(cls, raw: Dict) -> "LiveEvent":
+        return cls(id=int(raw.get("EventID", -1)), name=raw.get("EventName", ""),
+                   time=float(raw.get("EventTime", 0.0)), raw=raw)
+
+    @property
+    def killer(self) -> str:
+        return self.raw.get("KillerName", "")
+
+    @property
+    def assisters(self) -> List[str]:
+        return self.raw.get("Assisters", []) or []
+
+@dataclass
+class DragonKill(LiveEvent):
+    @property
+    def dragon_type(self) -> str:
+        return self.raw.get("DragonType", "")
+
+    @property
+    def stolen(self) -> bool:
+        return str(self.raw.get("Stolen", "False")).lower() == "true"
+
+@dataclass
+class BaronKill(LiveEvent):
+    @property
+    def stolen(self) -> bool:
+        return str(self.raw.get("Stolen", "False")).lower() == "true"
+
+@dataclass
+class HeraldKill(BaronKill):
+    pass
+
+@dataclass
+class InhibKilled(LiveEvent):
+    @property
+    def inhib(self) -> str:
+        return self.raw.get("InhibKilled", "")  # e.g. "Barracks_T2_L1"
+
+@dataclass
+class ChampionKill(LiveEvent):
+    @property
+    def victim(self) -> str:
+        return self.raw.get("VictimName", "")
+
+@dataclass
+class Ace(LiveEvent):
+    @property
+    def acer(self) -> str:
+        return self.raw.get("Acer", "")
+
+    @property
+    def acing_team(self) -> str:
+        return self.raw.get("AcingTeam", "")
+
+EVENT_TYPES: Dict[str, Type[LiveEvent]] = {
+    "DragonKill": DragonKill,
+    "BaronKill": BaronKill,
+    "HeraldKill": HeraldKill,
+    "InhibKilled": InhibKilled,
+    "ChampionKill": ChampionKill,
+    "Ace": Ace,
+}
+
+# seconds until the objective is back after the event
+RESPAWN = {
+    "DragonKill": 300,
+    "BaronKill": 360,
+    "InhibKilled": 300,
+}
+ELDER_RESPAWN = 360
+
+def objective_key(event: LiveEvent) -> Tuple[str, ...]:
+    """Identity of the objective an event is about: each inhibitor is its own, dragon/baron share a pit."""
+    if isinstance(event, InhibKilled):
+        return (event.name, event.inhib)
+    return (event.name,)
+
+def parse_event(raw: Dict) -> LiveEvent:
+    return EVENT_TYPES.get(raw.get("EventName", ""), LiveEvent).from_raw(raw)
+
+def respawn_at(event: LiveEvent) -> Optional[float]:
+    """Game time at which the objective killed by ``event`` is back, if it respawns."""
+    delay = RESPAWN.get(event.name)
+    if isinstance(event, DragonKill) and event.dragon_type == "Elder":
+        delay = ELDER_RESPAWN
+    return event.time + delay if delay else None
+
+# ============================== FEED ==========================================
+class EventFeed:
+    """Incremental reader of the Live Client event stream.
+
+    Keeps a cursor (next EventID) and only asks the API for events from
+    there on, so each poll returns just what happened since the last one
+    instead of the whole match history. New events are dispatched to
+    subscribers by name ("*" receives everything).
+    """
+    def __init__(self, client: Optional[LiveClient] = None):
+        self.client = client or live_client()
+        self.cursor = 0
+        self._subscribers: Dict[str, List[Callable[[LiveEvent], None]]] = {}
+
+    def subscribe(self, name: str, callback: Callable[[LiveEvent], None]):
+        self._subscribers.setdefault(name, []).append(callback)
+
+    def unsubscribe(self, name: str, callback: Callable[[LiveEvent], None]):
+        callbacks = self._subscribers.get(name, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def reset(self):
+        self.cursor = 0
+
+    def seed(self, raw_events: List[Dict]) -> List[LiveEvent]:
+        """Start over from the history already in hand (allgamedata's events); polls continue after it."""
+        self.reset()
+        return self.feed(raw_events)
+
+    def poll(self) -> List[LiveEvent]:
+        """Fetch and dispatch events newer than the cursor. Raises LiveClientError."""
+        payload = self.client.eventdata(self.cursor)
+        return self.feed(payload.get("Events", []) if isinstance(payload, dict) else [])
+
+    def feed(self, raw_events: List[Dict]) -> List[LiveEvent]:
+        out = []
+        for raw in raw_events:
+            event = parse_event(raw)
+            if event.id < self.cursor:
+                continue  # already seen (older clients ignore eventID and send everything)
+            self.cursor = event.id + 1
+            out.append(event)
+            for callback in self._subscribers.get(event.name, []) + self._subscribers.get("*", []):
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"[EVENTS] Subscriber error on {event.name}:", e)
+        return out
@@ -0,0 +1,243 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Optional, Tuple
+
+class Counter:
+    """Monotonic count (requests, failures, events)."""
+    __slots__ = ("name", "labels", "help", "value", "_m")
+    kind = "counter"
+
+    def __init__(self, registry: "Metrics", name: str, labels: Tuple, help: str):
+        self._m, self.name, self.labels, self.help = registry, name, labels, help
+        self.value = 0
+
+    def inc(self, n: int = 1):
+        if self._m.enabled:
+            self.value += n
+
+class Gauge:
+    """Last value set, or ``fn()`` evaluated when read (zero cost on the hot path)."""
+    __slots__ = ("name", "labels", "help", "_value", "fn", "_m")
+    kind = "gauge"
+
+    def __init__(self, registry: "Metrics", name: str, labels: Tuple, help: str, fn: Optional[Callable[[], float]] = None):
+        self._m, self.name, self.labels, self.help, self.fn = registry, name, labels, help, fn
+        self._value = 0.0
+
+    def set(self, value: float):
+        if self._m.enabled:
+            self._value = value
+
+    @property
+    def value(self) -> float:
+        if self.fn is None:
+            return self._value
+        try:
+            return float(self.fn())
+        except Exception:
+            return float("nan")
+
+class Histogram:
+    """Fixed-bucket histogram; ``buckets`` are upper bounds, one overflow bucket on top."""
+    __slots__ = ("name", "labels", "help", "buckets", "counts", "count", "sum", "max", "_m")
+    kind = "histogram"
+
+    def __init__(self, registry: "Metrics", name: str, labels: Tuple, help: str, buckets: Tuple[float, ...]):
+        self._m, self.name, self.labels, self.help, self.buckets = registry, name, labels, help, buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        if self._m.enabled:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def since(self, started: float):
+        """Observe the ms elapsed since ``started`` (from ``Metrics.now()``; 0 = not measuring)."""
+        if started:
+            self.observe((time.perf_counter() - started) * 1000.0)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile."""
+        if not self.count:
+            return 0.0
+        seen, rank = 0, q * self.count
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return float(self.buckets[i]) if i < len(self.buckets) else self.max
+        return self.max
+
+    def describe(self) -> str:
+        if not self.count:
+            return "no samples"
+        return (f"n={self.count} avg={self.sum / self.count:.2f} p50<={self.percentile(0.5):g} "
+                f"p99<={self.percentile(0.99):g} max={self.max:.2f}")
+
+class Metrics:
+    """Process-wide registry of counters, gauges and fixed-bucket histograms.
+
+    Instruments are created once (usually at import) and kept by the code
+    that records into them. While ``enabled`` is False every record call
+    is one attribute check and returns, and ``now()`` returns 0 so timed
+    sections skip perf_counter entirely. ``render()`` is the Prometheus
+    text format; ``serve()`` exposes it on a localhost port.
+    """
+    _instance = None
+    MS_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+    BYTES_BUCKETS = (1e3, 4e3, 16e3, 64e3, 256e3, 1e6, 4e6)
+    PREFIX = "spelltracker_"
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init()
+        return cls._instance
+
+    def _init(self):
+        self.enabled = False
+        self.started = time.monotonic()
+        self._items: Dict[Tuple[str, Tuple], object] = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    # ---------------- instruments ----------------
+    def _get(self, cls, name: str, labels: Optional[Dict[str, str]], help: str, *extra):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                item = self._items[key] = cls(self, name, key[1], help, *extra)
+            return item
+
+    def counter(self, name: str, help: str = "", labels: Optional[Dict[str, str]] = None) -> Counter:
+        return self._get(Counter, name, labels, help)
+
+    def gauge(self, name: str, help: str = "", labels: Optional[Dict[str, str]] = None,
+              fn: Optional[Callable[[], float]] = None) -> Gauge:
+        gauge = self._get(Gauge, name, labels, help)
+        if fn is not None:
+            gauge.fn = fn
+        return gauge
+
+    def histogram(self, name: str, help: str = "", labels: Optional[Dict[str, str]] = None,
+                  buckets: Tuple[float, ...] = MS_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, labels, help, tuple(buckets))
+
+    def drop(self, item):
+        """Unregister ``item`` (e.g. one labelled with a match that is over)."""
+        with self._lock:
+            self._items.pop((item.name, item.labels), None)
+
+    def now(self) -> float:
+        """Start of a timed section for ``Histogram.since`` (0 while disabled)."""
+        return time.perf_counter() if self.enabled else 0.0
+
+    def enable(self, on: bool = True):
+        if on and not self.enabled:
+            self.started = time.monotonic()
+        self.enabled = on
+
+    def items(self):
+        with self._lock:
+            return sorted(self._items.values(), key=lambda i: (i.name, i.labels))
+
+    # ---------------- output ----------------
+    def render(self) -> str:
+        """Prometheus text exposition of every instrument."""
+        out, described = [], set()
+        for item in self.items():
+            name = self.PREFIX + item.name
+            if name not in described:
+                described.add(name)
+                if item.help:
+                    out.append(f"# HELP {name} {item.help}")
+                out.append(f"# TYPE {name} {item.kind}")
+            labels = ",".join(f'{k}="{v}"' for k, v in item.labels)
+            if item.kind != "histogram":
+                out.append(f"{name}{{{labels}}} {item.value:g}" if labels else f"{name} {item.value:g}")
+                continue
+            sep = "," if labels else ""
+            cumulative = 0
+            for bound, c in zip(item.buckets + (float("inf"),), item.counts):
+                cumulative += c
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                out.append(f'{name}_bucket{{{labels}{sep}le="{le}"}} {cumulative}')
+            suffix = f"{{{labels}}}" if labels else ""
+            out.append(f"{name}_sum{suffix} {item.sum:g}")
+            out.append(f"{name}_count{suffix} {item.count}")
+        return "\n".join(out) + "\n"
+
+    def summary(self) -> str:
+        """Compact human-readable table (diagnostics page)."""
+        if not self.enabled:
+            return "Metrics are off.\nStart with --metrics (or METRICS=1)."
+        rows = [f"uptime {time.monotonic() - self.started:.0f}s"]
+        for item in self.items():
+            name = item.name + ("{" + ",".join(v for _, v in item.labels) + "}" if item.labels else "")
+            if item.kind == "histogram":
+                if item.count:
+                    rows.append(f"{name:<34} {item.describe()}")
+            else:
+                rows.append(f"{name:<34} {item.value:g}")
+        return "\n".join(rows)
+
+    def serve(self, port: int, host: str = "127.0.0.1"):
+        """Serve ``render()`` at http://host:port/metrics from a daemon thread."""
+        if self._server is not None:
+            return
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404); return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), Handler)
+        except OSError as e:
+            print(f"[METRICS] Could not listen on {host}:{port}: {e}")
+            return
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        print(f"[METRICS] Serving http://{host}:{port}/metrics")
+
+    def close(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+def configure(argv=None):
+    """Turn metrics on from ``--metrics`` / ``--metrics-port N`` or the METRICS / METRICS_PORT environment."""
+    argv = list(argv or [])
+    port = os.getenv("METRICS_PORT")
+    if "--metrics-port" in argv:
+        i = argv.index("--metrics-port")
+        port = argv[i + 1] if i + 1 < len(argv) else None
+    metrics = Metrics()
+    if port or "--metrics" in argv or os.getenv("METRICS", "").strip().lower() in ("1", "true", "yes", "on"):
+        metrics.enable()
+    if port:
+        try:
+            metrics.serve(int(port))
+        except ValueError:
+            print(f"[METRICS] Invalid port '{port}'")
+    return metrics
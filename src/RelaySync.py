@@ -0,0 +1,170 @@
+import json
+import os
+import socket
+import threading
+from typing import Dict, Optional
+from dotenv import load_dotenv
+from src.SyncBackend import SyncBackend, SyncEvent, WriteQueue
+load_dotenv()
+
+class RelaySync(SyncBackend):
+    """Team sync through a self-hosted relay (tools/SyncRelay.py).
+
+    One TCP connection, newline-delimited JSON. A reader thread keeps it
+    open (reconnecting with backoff and re-subscribing to the current
+    match) and turns the relay's snapshot/patch messages into "/" events.
+    Writes go through the same WriteQueue as Firebase, so clicks never wait
+    on the socket. A batch only counts as written once the relay acks its
+    ``seq``; no ack within ACK_TIMEOUT (e.g. the connection dropped) and
+    the queue retries it. RELAY_SECRET must match the relay's --secret.
+    """
+    TAG = "RELAY"
+    _instance = None
+    URL = os.getenv("RELAY_URL", "127.0.0.1:47800")  # host:port
+    SECRET = os.getenv("RELAY_SECRET", "")
+    CONNECT_TIMEOUT = 3.0
+    ACK_TIMEOUT = 2.0
+    RECONNECT_MIN = 0.5  # seconds, doubled up to RECONNECT_MAX
+    RECONNECT_MAX = 10.0
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init()
+        return cls._instance
+
+    def _init(self):
+        self._init_sync()
+        host, _, port = self.URL.rpartition(":")
+        self.address = (host or "127.0.0.1", int(port or 47800))
+        self.writes = WriteQueue(self._write_batch, window=0.0)
+        self.signals = self.writes.signals
+        self._sock: Optional[socket.socket] = None
+        self._send_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._running = True
+        self._seq = 0
+        self._acks: Dict[int, threading.Event] = {}  # seq -> set by the reader thread when acked
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------------- connection ----------------
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="relay-sync", daemon=True)
+            self._thread.start()
+
+    def _send(self, msg: Dict):
+        sock = self._sock
+        if sock is None:
+            raise ConnectionError(f"relay {self.address[0]}:{self.address[1]} not connected")
+        with self._send_lock:
+            sock.sendall(json.dumps(msg, separators=(",", ":")).encode("utf-8") + b"\n")
+
+    def _run(self):
+        delay = self.RECONNECT_MIN
+        while self._running:
+            try:
+                sock = socket.create_connection(self.address, timeout=self.CONNECT_TIMEOUT)
+            except OSError as e:
+                print(f"[RELAY] Connect to {self.address[0]}:{self.address[1]} failed: {e}")
+                self._wake.wait(delay); self._wake.clear()
+                delay = min(self.RECONNECT_MAX, delay * 2)
+                continue
+            sock.settimeout(None)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._sock = sock
+            delay = self.RECONNECT_MIN
+            print(f"[RELAY] Connected to {self.address[0]}:{self.address[1]}")
+            try:
+                lines = sock.makefile("rb")
+                if self.SECRET:
+                    self._send({"op": "auth", "secret": self.SECRET})
+                self.clock.sample(lambda: self._ping(lines))
+                if self.match_id:
+                    self._send({"op": "sub", "m": self.match_id})
+                for line in lines:
+                    self._handle(json.loads(line))
+            except (OSError, ValueError) as e:
+                if self._running:
+                    print("[RELAY] Connection lost:", e)
+            finally:
+                self._sock = None
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+
+    def _ping(self, lines) -> float:
+        self._send({"op": "ping"})
+        while True:
+            line = lines.readline()
+            if not line:
+                raise ConnectionError("relay closed the connection")
+            msg = json.loads(line)
+            if msg.get("op") == "pong":
+                return float(msg["ts"])
+            self._handle(msg)  # a snap can slip in if setMatchID raced the handshake
+
+    def _handle(self, msg: Dict):
+        op = msg.get("op")
+        if op in ("snap", "patch") and msg.get("m") == self.match_id and isinstance(msg.get("v"), dict):
+            self._dispatch(SyncEvent("/", msg["v"], "put" if op == "snap" else "patch"))
+        elif op == "ack":
+            acked = self._acks.get(msg.get("seq"))
+            if acked:
+                acked.set()
+
+    # ---------------- backend API ----------------
+    def setMatchID(self, match_id):
+        newmatch_id = self._sanitize_key(match_id)
+        if self.match_id == newmatch_id:
+            return
+        self.match_id = newmatch_id
+        self._start()
+        try:
+            self._send({"op": "sub", "m": self.match_id})
+        except (OSError, ConnectionError):
+            pass  # sent by the reader thread once connected
+        print(f"[RELAY] Joined match ID: {self.match_id}")
+
+    def leave(self):
+        if self.match_id:
+            try:
+                self._send({"op": "unsub"})
+            except (OSError, ConnectionError):
+                pass
+        super().leave()
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        return self.writes.flush(timeout)
+
+    def close(self, timeout: float = 2.0):
+        self.writes.close(timeout)
+        self.leave()
+        self._running = False
+        self._wake.set()
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _put(self, path: str, value: dict):
+        self.writes.put(path, value)
+
+    def _write_batch(self, batch: Dict[str, dict]):
+        # runs on the WriteQueue thread only, so _seq needs no lock
+        if not self.match_id:
+            raise RuntimeError("not in a match, nothing to write to")
+        self._seq += 1
+        seq, acked = self._seq, threading.Event()
+        self._acks[seq] = acked
+        try:
+            self._send({"op": "mset", "seq": seq, "v": batch})
+            if not acked.wait(self.ACK_TIMEOUT):
+                raise TimeoutError(f"relay did not ack write {seq} within {self.ACK_TIMEOUT:g}s")
+        finally:
+            del self._acks[seq]
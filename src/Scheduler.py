@@ -0,0 +1,223 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+
+@dataclass
+class Job:
+    """One periodic task. ``fn`` may return the delay until its next run (seconds), or None for ``interval``."""
+    name: str
+    fn: Callable[[], Optional[float]]
+    interval: float
+    jitter: float = 0.0          # +- fraction of the delay, spreads jobs that would wake together
+    backoff: float = 0.0         # max delay after consecutive errors (0 = retry at ``interval``)
+    blocking: bool = False       # run on the shared executor instead of the GUI thread
+    due: float = 0.0
+    running: bool = False
+    paused: bool = False         # kept registered but never due (see pause/resume)
+    errors: int = 0
+    runs: int = 0
+    total_ms: float = 0.0
+    last_ms: float = 0.0
+    last_delay: float = 0.0
+    seq: int = field(default=0, repr=False)
+
+class Scheduler(QObject):
+    """Every periodic task of the app on one clock.
+
+    Jobs live in a heap ordered by due time and a single single-shot QTimer
+    on the GUI thread is armed for the earliest one, so the process wakes
+    up only when some job is actually due. Jobs that block (HTTP, window
+    probes) run on a small shared executor and report back through a
+    queued signal; the rest run inline. ``table()`` lists every job with
+    its interval and cost, ``tune()`` changes one at runtime.
+    """
+    _instance = None
+    MAX_WORKERS = 2
+
+    _finished = Signal(object, object, object)  # Job or one-off callback, result, error (from executor threads)
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init()
+        return cls._instance
+
+    def __init__(self):
+        pass  # the singleton is set up once in _init
+
+    def _init(self):
+        QObject.__init__(self)
+        self._jobs: Dict[str, Job] = {}
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.wakeups = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_due)
+        self._finished.connect(self._on_finished, Qt.QueuedConnection)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Shared pool for blocking work (threads are created on first use)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="sched")
+            return self._executor
+
+    # ---------------- registration ----------------
+    def add(self, name: str, fn: Callable[[], Optional[float]], interval: float, jitter: float = 0.0,
+            backoff: float = 0.0, blocking: bool = False, delay: float = 0.0) -> Job:
+        """Register (or replace) a job; first run after ``delay`` seconds."""
+        self.remove(name)
+        job = Job(name, fn, interval, jitter, backoff, blocking)
+        self._jobs[name] = job
+        self._push(job, delay)
+        return job
+
+    def remove(self, name: str):
+        job = self._jobs.pop(name, None)
+        if job:
+            job.seq = -1  # heap entry goes stale
+            self._arm()
+
+    def wake(self, name: str):
+        """Run a job as soon as possible instead of waiting for its delay."""
+        job = self._jobs.get(name)
+        if job and not job.running and not job.paused:
+            self._push(job, 0.0)
+
+    def pause(self, name: str):
+        """Stop running a job without forgetting it; its heap entry goes stale."""
+        job = self._jobs.get(name)
+        if job and not job.paused:
+            job.paused = True
+            job.seq = -1
+            self._arm()
+
+    def resume(self, name: str, delay: float = 0.0, **changes):
+        """Undo ``pause`` (optionally tuning the job too); next run after ``delay`` seconds."""
+        job = self._jobs.get(name)
+        if not job:
+            return
+        was_paused, job.paused = job.paused, False
+        if changes:
+            self.tune(name, **changes)
+        elif was_paused and not job.running:
+            self._push(job, delay)
+
+    def tune(self, name: str, **changes):
+        """Change interval/jitter/backoff of a job at runtime."""
+        job = self._jobs.get(name)
+        if not job:
+            return
+        for key, value in changes.items():
+            if key in ("interval", "jitter", "backoff"):
+                setattr(job, key, value)
+        if not job.running and not job.paused:
+            self._push(job, min(job.interval, max(0.0, job.due - time.monotonic())))
+
+    def submit(self, fn: Callable[[], Any], on_done: Optional[Callable[[Any, Optional[BaseException]], None]] = None) -> Future:
+        """One-off blocking call on the shared executor; ``on_done(result, error)`` runs on the GUI thread."""
+        future = self.executor.submit(fn)
+        if on_done:
+            future.add_done_callback(lambda f: self._finished.emit(on_done, None if f.exception() else f.result(), f.exception()))
+        return future
+
+    def shutdown(self, wait: bool = True):
+        if self._jobs:
+            print("[SCHED] Jobs at shutdown:\n" + self.describe())
+        for name in list(self._jobs):
+            self.remove(name)
+        self._timer.stop()
+        if self._executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    # ---------------- introspection ----------------
+    def table(self) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        return [{"name": j.name, "interval": j.interval, "jitter": j.jitter, "backoff": j.backoff,
+                 "blocking": j.blocking, "paused": j.paused, "runs": j.runs, "errors": j.errors,
+                 "avg_ms": round(j.total_ms / j.runs, 3) if j.runs else 0.0,
+                 "last_delay": round(j.last_delay, 3), "next_in": round(max(0.0, j.due - now), 3)}
+                for j in self._jobs.values()]
+
+    def describe(self) -> str:
+        rows = [f"{'job':<14}{'interval':>9}{'jitter':>8}{'backoff':>9}{'runs':>7}{'errors':>7}{'avg ms':>9}{'next in':>9}"]
+        for r in self.table():
+            rows.append(f"{r['name']:<14}{r['interval']:>9.2f}{r['jitter']:>8.2f}{r['backoff']:>9.1f}"
+                        f"{r['runs']:>7}{r['errors']:>7}{r['avg_ms']:>9.3f}"
+                        + (f"{'paused':>9}" if r['paused'] else f"{r['next_in']:>9.2f}"))
+        return "\n".join(rows)
+
+    # ---------------- loop ----------------
+    def _push(self, job: Job, delay: float):
+        if job.jitter and delay > 0:
+            delay *= 1.0 + random.uniform(-job.jitter, job.jitter)
+        job.last_delay = delay
+        job.due = time.monotonic() + max(0.0, delay)
+        job.seq = next(self._seq)
+        heapq.heappush(self._heap, (job.due, job.seq, job.name))
+        self._arm()
+
+    def _arm(self):
+        heap = self._heap
+        while heap and (heap[0][2] not in self._jobs or self._jobs[heap[0][2]].seq != heap[0][1]):
+            heapq.heappop(heap)
+        if not heap:
+            self._timer.stop(); return
+        ms = max(0, int((heap[0][0] - time.monotonic()) * 1000 + 0.999))
+        if not self._timer.isActive() or self._timer.remainingTime() > ms:
+            self._timer.start(ms)
+
+    def _run_due(self):
+        self.wakeups += 1
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now + 0.001:
+            _, seq, name = heapq.heappop(self._heap)
+            job = self._jobs.get(name)
+            if not job or job.seq != seq or job.running:
+                continue
+            job.running = True
+            if job.blocking:
+                started = time.perf_counter()
+                future = self.executor.submit(job.fn)
+                future.add_done_callback(lambda f, j=job, t=started: self._finished.emit(
+                    j, (None if f.exception() else f.result(), (time.perf_counter() - t) * 1000.0), f.exception()))
+            else:
+                started = time.perf_counter()
+                try:
+                    result, error = job.fn(), None
+                except Exception as e:
+                    result, error = None, e
+                self._complete(job, result, error, (time.perf_counter() - started) * 1000.0)
+        self._arm()
+
+    def _on_finished(self, target, payload, error):
+        if not isinstance(target, Job):
+            target(payload, error); return
+        result, elapsed_ms = payload
+        self._complete(target, result, error, elapsed_ms)
+
+    def _complete(self, job: Job, result, error, elapsed_ms: float):
+        job.running = False
+        job.runs += 1
+        job.last_ms = elapsed_ms
+        job.total_ms += elapsed_ms
+        if error is not None:
+            job.errors += 1
+            print(f"[SCHED] {job.name} failed:", error)
+            delay = min(job.backoff, job.interval * (2 ** job.errors)) if job.backoff else job.interval
+        else:
+            job.errors = 0
+            delay = job.interval if result is None else float(result)
+        if self._jobs.get(job.name) is job and not job.paused:  # not removed/replaced/paused while it ran
+            self._push(job, delay)
@@ -0,0 +1,96 @@
+import builtins
+import importlib.util
+import sys
+import threading
+import time
+from typing import Dict, List, Tuple
+
+class StartupProfile:
+    """Cold-start timing up to the first painted frame (``--profile-startup``).
+
+    ``phase(name)`` closes the phase that started at the previous mark.
+    While installed, ``__import__`` on the main thread is timed: a module's
+    cumulative time includes the imports it triggered, its self time does
+    not. Only imports that actually load something are kept; lookups of
+    modules already in sys.modules take the untimed fast path. Interpreter
+    start (and, for the onefile exe, unpacking) happens before any of this
+    and is not included.
+    """
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self._mark = self.t0
+        self.phases: List[Tuple[str, float]] = []     # (name, ms)
+        self.imports: Dict[str, List[float]] = {}     # module -> [self ms, cumulative ms]
+        self._stack: List[float] = []                 # child time of the imports in progress
+        self._main = threading.get_ident()
+        self._original = None
+
+    def install(self):
+        if self._original is None:
+            self._original = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def phase(self, name: str):
+        now = time.perf_counter()
+        self.phases.append((name, (now - self._mark) * 1000.0))
+        self._mark = now
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original
+        if (level == 0 and not fromlist and name in sys.modules) or threading.get_ident() != self._main:
+            return original(name, globals, locals, fromlist, level)
+        loaded = len(sys.modules)
+        self._stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            total = (time.perf_counter() - started) * 1000.0
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            if len(sys.modules) > loaded:
+                if level:
+                    try:
+                        name = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+                    except (ImportError, ValueError):
+                        pass
+                row = self.imports.setdefault(name, [0.0, 0.0])
+                row[0] += total - children
+                row[1] += total
+
+    def watch_first_paint(self, widget, name: str = "show -> first paint"):
+        """Close phase ``name`` and print the report once ``widget`` has painted."""
+        from PySide6.QtCore import QEvent, QObject, QTimer
+
+        profile = self
+        class FirstPaint(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint:
+                    obj.removeEventFilter(self)
+                    QTimer.singleShot(0, done)  # after this paint has been handled
+                return False
+
+        def done():
+            profile.phase(name)
+            profile.uninstall()
+            print(profile.report())
+
+        self._filter = FirstPaint(widget)
+        widget.installEventFilter(self._filter)
+
+    def report(self, top: int = 20) -> str:
+        total = sum(ms for _, ms in self.phases)
+        rows = ["[STARTUP] Phases (ms):"]
+        rows += [f"  {name:<28}{ms:>9.1f}" for name, ms in self.phases]
+        rows.append(f"  {'total to first paint':<28}{total:>9.1f}")
+        rows.append(f"[STARTUP] Slowest imports, {len(self.imports)} timed (self / cumulative ms):")
+        for name, (own, cumulative) in sorted(self.imports.items(), key=lambda kv: -kv[1][1])[:top]:
+            rows.append(f"  {name:<40}{own:>9.1f}{cumulative:>9.1f}")
+        return "\n".join(rows)
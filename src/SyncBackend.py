@@ -0,0 +1,293 @@
+import os
+import re
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from PySide6.QtCore import QObject, Signal
+from src.ClockSync import ClockSync
+from src.Metrics import Histogram
+from src.SyncMetrics import METRICS, WRITE_MS, WRITE_FAILURES, WRITE_PATHS, EVENTS, CLICK_TO_RENDER_MS, match_latency
+
+class SyncSignals(QObject):
+    written = Signal(list)      # paths confirmed by the server
+    failed = Signal(list, str)  # paths, error (after the last retry)
+
+class WriteQueue:
+    """Background writer for team-sync updates.
+
+    ``put`` only records the value under its path and returns, so the UI
+    thread never waits on the network. A worker thread waits ``WINDOW``
+    seconds after the first pending write, then hands everything queued to
+    ``write`` as one {path: value} batch; repeated writes to the same path
+    inside the window collapse into the latest one. Failed batches are retried with
+    backoff unless a newer value for the path arrived meanwhile.
+    """
+    WINDOW = 0.05   # seconds
+    RETRIES = 3
+    BACKOFF = 0.5   # doubled per retry
+
+    def __init__(self, write: Callable[[Dict[str, dict]], None], window: Optional[float] = None):
+        self._write = write
+        self.window = self.WINDOW if window is None else window
+        self._pending: Dict[str, dict] = {}
+        self._cond = threading.Condition()
+        self._busy = False
+        self._running = True
+        self.signals = SyncSignals()
+        self._thread = threading.Thread(target=self._run, name="sync-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, path: str, value: dict):
+        with self._cond:
+            self._pending[path] = value
+            self._cond.notify_all()
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Wait until everything queued has been sent (or given up on)."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while self._pending or self._busy:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                self._cond.wait(left)
+        return True
+
+    def close(self, timeout: float = 2.0):
+        self.flush(timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _take(self) -> Dict[str, dict]:
+        with self._cond:
+            while self._running and not self._pending:
+                self._cond.wait()
+            if not self._pending:
+                return {}
+            # let a click burst coalesce (put() notifies, so wait out the whole window)
+            end = time.monotonic() + self.window
+            while self._running and time.monotonic() < end:
+                self._cond.wait(end - time.monotonic())
+            batch, self._pending = self._pending, {}
+            self._busy = True
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._take()
+            if not batch:
+                return
+            paths = list(batch)
+            for attempt in range(self.RETRIES + 1):
+                started = METRICS.now()
+                try:
+                    self._write(batch)
+                    WRITE_MS.since(started)
+                    WRITE_PATHS.inc(len(paths))
+                    self.signals.written.emit(paths)
+                    break
+                except Exception as e:
+                    WRITE_FAILURES.inc()
+                    with self._cond:
+                        # a newer value for a path supersedes the failed one
+                        batch = {k: v for k, v in batch.items() if k not in self._pending}
+                    if not batch:
+                        break
+                    if attempt == self.RETRIES or not self._running:
+                        print(f"[SYNC] Write failed for {len(batch)} path(s): {e}")
+                        self.signals.failed.emit(list(batch), str(e))
+                        break
+                    time.sleep(self.BACKOFF * (2 ** attempt))
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+@dataclass
+class SyncEvent:
+    """RTDB-shaped change: ``path`` relative to the match ("/", "/Ahri", "/Ahri/Flash") and its ``data``."""
+    path: str
+    data: Any
+    event_type: str = "put"
+
+class SyncBackend(ABC):
+    """Team-sync transport used by the overlay.
+
+    Implementations are singletons (``__new__`` + ``_init``) and deliver
+    remote changes to the ``listen`` callback as RTDB-shaped events (see
+    SyncEvent): the whole match at "/" when joining, then one event per
+    changed spell. Callbacks may run on any thread.
+
+    Written values look like {"usedAt": s, "usedAtMs": ms, "trace": id}:
+    usedAtMs is in the server's clock (local clock + ``clock`` offset) and
+    the trace id ("<peer>-<n>") lets receivers time click -> render.
+    """
+    TAG = "SYNC"
+    match_id: str = ""
+    on_snapshot: Optional[Callable[[Any], None]] = None
+    signals: Optional[SyncSignals] = None
+    peer_id: str = ""
+    clock: Optional[ClockSync] = None
+
+    duplicatedSpells = {
+        "Unleashed Teleport": "Teleport",
+        "Unleashed Smite": "Smite",
+        "Hexflash": "Flash",
+    }
+
+    def _init_sync(self):
+        self.peer_id = uuid.uuid4().hex[:8]
+        self.clock = ClockSync()
+        self.latency: Optional[Histogram] = None  # click -> render in match_id (see SyncMetrics)
+        self._trace_seq = 0
+
+    @abstractmethod
+    def setMatchID(self, match_id):
+        """Join ``match_id``: deliver its "/" snapshot, then its changes."""
+
+    @abstractmethod
+    def _put(self, path: str, value: dict):
+        """Write ``value`` at ``path`` ("Ahri/Flash") of the current match."""
+
+    def mark_spell_used(self, champ, spell):
+        spell = self.sanitize_spell(spell)
+        value = self._stamp()
+        print(f"[{self.TAG}] Marking spell used: {champ} - {spell} at {value['usedAtMs']} ({value['trace']})")
+        self._put(f"{champ}/{spell}", value)
+
+    def reset_spell(self, champ, spell):
+        spell = self.sanitize_spell(spell)
+        value = self._stamp(ago_s=600)
+        print(f"[{self.TAG}] Resetting spell: {champ} - {spell}")
+        self._put(f"{champ}/{spell}", value)
+
+    def _stamp(self, ago_s: float = 0.0) -> dict:
+        ms = int(self.now_ms() - ago_s * 1000)
+        self._trace_seq += 1
+        # usedAt (seconds) stays for clients that predate usedAtMs
+        return {"usedAt": ms // 1000, "usedAtMs": ms, "trace": f"{self.peer_id}-{self._trace_seq}"}
+
+    def now_ms(self) -> float:
+        """Wall clock in ms, corrected to the server's clock."""
+        return self.clock.now_ms() if self.clock else time.time() * 1000.0
+
+    def is_own(self, trace: str) -> bool:
+        return bool(trace) and trace.split("-", 1)[0] == self.peer_id
+
+    def record_latency(self, ms: float):
+        CLICK_TO_RENDER_MS.observe(ms)
+        if not METRICS.enabled:
+            return
+        match_id = self.match_id or "-"
+        if self.latency is None or self.latency.labels != (("match", match_id),):
+            if self.latency is not None:
+                METRICS.drop(self.latency)
+            self.latency = match_latency(match_id)
+        self.latency.observe(ms)
+
+    def latency_summary(self) -> str:
+        """Click -> render for the current match."""
+        return self.latency.describe() if self.latency else "no samples"
+
+    def listen(self, callback):
+        print(f"[SYNC] Setting on_snapshot callback ({type(self).__name__}).")
+        self.on_snapshot = callback
+
+    def leave(self):
+        """Game over: stop receiving updates for the current match."""
+        latency, self.latency = getattr(self, "latency", None), None
+        if latency is not None:
+            print(f"[{self.TAG}] Click -> remote render for {self.match_id}: {latency.describe()}")
+            METRICS.drop(latency)
+        self.match_id = ""
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        return True
+
+    def close(self, timeout: float = 2.0):
+        self.flush(timeout)
+        self.leave()
+
+    def _dispatch(self, event):
+        EVENTS.inc()
+        callback = self.on_snapshot
+        if callback:
+            callback(event)
+
+    def _sanitize_key(self, key: str) -> str:
+        """Sanitize a string to be safe as a RTDB key segment.
+        Firebase RTDB keys cannot contain '.', '#', '$', '[', or ']'.
+        Also replace '/' to avoid accidental nested paths from user input.
+        """
+        if not isinstance(key, str):
+            key = str(key or "")
+        # replace invalid characters with underscore
+        return re.sub(r'[.\#\$\[\]/]', '_', key)
+
+    def sanitize_spell(self, spell_name: str) -> str:
+        if spell_name in self.duplicatedSpells:
+            spell_name = self.duplicatedSpells[spell_name]
+        return spell_name
+
+# ============================== SELECTION =====================================
+BACKENDS = ("firebase", "lan", "relay")
+_backend: Optional[SyncBackend] = None
+_lock = threading.RLock()  # re-entrant: on_backend callbacks may call sync_backend()
+_on_ready = []             # callbacks run for every backend once it exists
+
+def sync_backend() -> SyncBackend:
+    """The team-sync backend picked by SYNC_BACKEND (.env or environment): firebase (default), lan or relay.
+
+    Created on first call, so Firebase and friends are only imported once
+    team sync is actually used (a click, or joining a match).
+    """
+    global _backend
+    with _lock:
+        if _backend is None:
+            from dotenv import load_dotenv
+            load_dotenv()
+            name = (os.getenv("SYNC_BACKEND") or "firebase").strip().lower()
+            if name == "lan":
+                from src.LanSync import LanSync
+                _backend = LanSync()
+            elif name == "relay":
+                from src.RelaySync import RelaySync
+                _backend = RelaySync()
+            else:
+                if name not in BACKENDS:
+                    print(f"[SYNC] Unknown SYNC_BACKEND '{name}', using firebase")
+                from src.FirebaseSync import FirebaseSync
+                _backend = FirebaseSync()
+            _ready(_backend)
+        return _backend
+
+def active_backend() -> Optional[SyncBackend]:
+    """The backend if one was created, without creating it (e.g. for shutdown)."""
+    return _backend
+
+def on_backend(callback: Callable[[SyncBackend], None]):
+    """Run ``callback(backend)`` for the current backend (if any) and every one created later."""
+    with _lock:
+        _on_ready.append(callback)
+        if _backend is not None:
+            callback(_backend)
+
+def _ready(backend: SyncBackend):
+    for callback in _on_ready:
+        try:
+            callback(backend)
+        except Exception as e:
+            print("[SYNC] Backend hook failed:", e)
+
+def set_backend(backend: Optional[SyncBackend]):
+    """Replace the active backend (tools/benchmarks); None re-reads the configuration next time."""
+    global _backend
+    with _lock:
+        _backend = backend
+        if backend is not None:
+            _ready(backend)
@@ -0,0 +1,14 @@
+from src.Metrics import Histogram, Metrics
+
+METRICS = Metrics()
+WRITE_MS = METRICS.histogram("sync_write_ms", "Team-sync batch write round trip")
+WRITE_FAILURES = METRICS.counter("sync_write_failures_total", "Team-sync write attempts that raised")
+WRITE_PATHS = METRICS.counter("sync_written_paths_total", "Team-sync paths confirmed by the backend")
+EVENTS = METRICS.counter("sync_events_total", "Team-sync events received from the backend")
+LATENCY_BUCKETS = (5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+CLICK_TO_RENDER_MS = METRICS.histogram("sync_click_to_render_ms", "Teammate click -> local paint", buckets=LATENCY_BUCKETS)
+
+def match_latency(match_id: str) -> Histogram:
+    """Click -> render for one match, labelled with its id; ``drop`` it when the match ends."""
+    return METRICS.histogram("sync_match_click_to_render_ms", "Teammate click -> local paint in the current match",
+                             labels={"match": match_id}, buckets=LATENCY_BUCKETS)
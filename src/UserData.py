@@ -1,8 +1,25 @@
+import atexit
 import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from PySide6.QtCore import QCoreApplication, QThread, QTimer
 
 class UserData:
+    """Settings store with write-behind persistence.
+
+    ``set`` only updates memory and restarts one single-shot QTimer; the
+    file is written once the values stop changing for ``FLUSH_DELAY``
+    seconds, on ``flush()`` or at exit. A slider drag therefore costs one
+    write, not one per step. Without a Qt event loop on the calling thread
+    there is nothing to wait on, so ``set`` writes right away. Writes go to
+    a temp file that replaces userdata.json, so a crash never leaves it
+    half-written.
+    """
     _instance = None
+    FLUSH_DELAY = 0.5  # seconds
 
     def __new__(cls):
         if cls._instance is None:
@@ -13,7 +30,14 @@ class UserData:
     def _init(self):
         self._path = Path("userdata.json")
         self._data = {}
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        self._timer = None  # QTimer, created on first use in the GUI thread
+        self._dirty = False
+        self._batch = 0  # open transactions
+        self.writes = 0
         self._load()
+        atexit.register(self.flush)
 
     def _load(self):
         try:
@@ -25,11 +49,70 @@ class UserData:
             self._data = {}
 
     def _save(self):
+        with self._io_lock:  # one writer at a time, so an older snapshot never replaces a newer one
+            with self._lock:
+                payload = json.dumps(self._data, indent=2)
+                self._dirty = False
+            self._write(payload)
+
+    def _write(self, payload: str):
+        path = self._path
         try:
-            with self._path.open("w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2)
+            fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent or "."))
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            self.writes += 1
         except Exception as e:
             print("[USERDATA] Failed to write userdata:", e)
+            with self._lock:
+                self._dirty = True
+
+    def _schedule(self):
+        with self._lock:
+            self._dirty = True
+            if self._batch:
+                return  # the outermost transaction schedules on exit
+        if not self._on_gui_thread():
+            self.flush(); return
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        self._timer.start(int(self.FLUSH_DELAY * 1000))  # restarts the countdown
+
+    def _on_gui_thread(self) -> bool:
+        app = QCoreApplication.instance()
+        return app is not None and QThread.currentThread() is app.thread()
+
+    def flush(self):
+        """Write pending changes now (no-op when nothing changed)."""
+        if self._timer is not None and self._on_gui_thread():
+            self._timer.stop()
+        with self._lock:
+            if not self._dirty:
+                return
+        self._save()
+
+    @contextmanager
+    def transaction(self):
+        """Group several ``set`` calls into one scheduled write."""
+        with self._lock:
+            self._batch += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch -= 1
+                pending = not self._batch and self._dirty
+            if pending:
+                self._schedule()
 
     def get(self, key: str, default=None):
         return self._data.get(key, default)
@@ -42,5 +125,11 @@ class UserData:
             return default
 
     def set(self, key: str, value):
-        self._data[key] = value
-        self._save()
\ No newline at end of file
+        with self._lock:
+            self._data[key] = value
+        self._schedule()
+
+    def update(self, values: dict):
+        with self.transaction():
+            for key, value in values.items():
+                self.set(key, value)
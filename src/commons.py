@@ -1,35 +1,151 @@
-import requests
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+from src.Metrics import Metrics
 
-def is_in_game():
-    # print("[LCA] Checking if in-game via Live Client API…")
-    urls = [
-        "http://127.0.0.1:2999/liveclientdata/gamestats",
-        "https://127.0.0.1:2999/liveclientdata/gamestats",
-    ]
-    for url in urls:
-        try:
-            # try HTTP first (no cert issues), then HTTPS with verify=False if needed
-            verify = False if url.startswith("https://") else True
-            # use separate connect/read timeouts so local endpoint has enough time to respond
-            timeout = (0.5, 2.0)  # (connect, read)
-            if not verify:
-                import urllib3
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            r = requests.get(url, timeout=timeout, verify=verify)
-            # print("[LCA] Tried", url, "->", getattr(r, "status_code", "no-response"))
+METRICS = Metrics()
+_probe_metrics: Dict[str, tuple] = {}
+
+def res_path(*parts: str) -> str:
+    """Path under res/: relative to the working directory, or inside the one-file exe once unpacked (see build.bat)."""
+    return os.path.join(getattr(sys, "_MEIPASS", ""), "res", *parts)
+
+def probe_metrics(endpoint: str) -> tuple:
+    """(round trip ms, failures, response bytes, parse ms) instruments of one endpoint."""
+    inst = _probe_metrics.get(endpoint)
+    if inst is None:
+        labels = {"endpoint": endpoint}
+        inst = _probe_metrics[endpoint] = (
+            METRICS.histogram("liveclient_request_ms", "Live Client API round trip", labels),
+            METRICS.counter("liveclient_failures_total", "Live Client API calls that got no usable answer", labels),
+            METRICS.histogram("liveclient_response_bytes", "Live Client API response size", labels, Metrics.BYTES_BUCKETS),
+            METRICS.histogram("liveclient_parse_ms", "Live Client API JSON decode time", labels))
+    return inst
+
+class LiveClientError(RuntimeError):
+    """The Live Client Data API could not be reached or answered with an error.
+
+    ``status`` is the HTTP status when the server did answer (e.g. 404 while
+    the game is still loading), None when nothing was listening.
+    """
+    def __init__(self, msg: str, status: Optional[int] = None):
+        super().__init__(msg)
+        self.status = status
+
+class LiveClient:
+    """Keep-alive client for the League Live Client Data API (127.0.0.1:2999).
+
+    One pooled ``requests.Session`` is reused for every call, so a probe is a
+    request on an already open socket instead of a fresh TCP/TLS setup. The
+    scheme that last worked is tried first; the other one is only tried when
+    it fails (the client has served both HTTP and self-signed HTTPS).
+    requests itself is only imported by the first call, off the startup path.
+    """
+    HOST = "127.0.0.1"
+    PORT = 2999
+    SCHEMES = ("http", "https")
+    # (connect, read) per endpoint; allgamedata is the big one
+    TIMEOUTS: Dict[str, Tuple[float, float]] = {
+        "gamestats": (0.5, 2.0),
+        "activeplayer": (0.5, 2.0),
+        "playerlist": (0.5, 2.0),
+        "eventdata": (0.5, 2.0),
+        "allgamedata": (0.5, 4.0),
+    }
+
+    def __init__(self, host: str = HOST, port: int = PORT, schemes=SCHEMES):
+        self.host = host
+        self.port = port
+        self._schemes = tuple(schemes)
+        self.scheme: Optional[str] = None  # last scheme that answered
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests, urllib3
+            from requests.adapters import HTTPAdapter
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def url(self, endpoint: str, scheme: Optional[str] = None) -> str:
+        return f"{scheme or self.scheme or self._schemes[0]}://{self.host}:{self.port}/liveclientdata/{endpoint}"
+
+    def _get(self, endpoint: str, params: Optional[dict] = None):
+        session = self.session
+        import requests
+        schemes = self._schemes
+        if self.scheme in schemes:
+            schemes = (self.scheme,) + tuple(s for s in schemes if s != self.scheme)
+        last_error = None
+        latency, failures, size, parse = probe_metrics(endpoint)
+        for scheme in schemes:
+            started = METRICS.now()
+            try:
+                # verify per request: a session-level verify=False loses to REQUESTS_CA_BUNDLE
+                # the game serves a self-signed certificate
+                r = session.get(self.url(endpoint, scheme), params=params, verify=False,
+                                     timeout=self.TIMEOUTS.get(endpoint, (0.5, 2.0)))
+            except requests.RequestException as e:
+                last_error = e
+                continue
+            latency.since(started)
+            self.scheme = scheme  # any HTTP answer proves the scheme; only connection errors try the other one
             if r.ok:
-                # ensure we can parse JSON (browser showed JSON body)
-                # try:
-                #     _ = r.json()
-                # except Exception as je:
-                    # print("[LCA] Warning: response not JSON:", je)
-                return True
-        except:
-            pass
-        # except requests.ReadTimeout:
-            #print(f"[LCA] Read timed out for {url}")
-        # except requests.RequestException as exc:
-            #print(f"[LCA] Request to {url} failed: {exc}")
-            # try next URL
-    # print("[LCA] No reachable Live Client API endpoint, assuming not in-game.")
-    return False
\ No newline at end of file
+                size.observe(len(r.content))
+                started = METRICS.now()
+                try:
+                    data = r.json()
+                except ValueError as e:
+                    failures.inc()
+                    raise LiveClientError(f"Live Client API {endpoint} returned invalid JSON: {e}")
+                parse.since(started)
+                return data
+            failures.inc()
+            raise LiveClientError(f"Live Client API {endpoint} answered HTTP {r.status_code}", r.status_code)
+        failures.inc()
+        raise LiveClientError(f"Live Client API {endpoint} not reachable on {self.host}:{self.port} ({last_error})")
+
+    def gamestats(self) -> Dict:
+        return self._get("gamestats")
+
+    def allgamedata(self) -> Dict:
+        return self._get("allgamedata")
+
+    def activeplayer(self) -> Dict:
+        return self._get("activeplayer")
+
+    def playerlist(self) -> List[Dict]:
+        return self._get("playerlist")
+
+    def eventdata(self, event_id: Optional[int] = None) -> Dict:
+        """Events with EventID >= ``event_id`` (the whole history if None)."""
+        return self._get("eventdata", {"eventID": event_id} if event_id is not None else None)
+
+    def is_in_game(self) -> bool:
+        try:
+            self.gamestats()
+            return True
+        except LiveClientError:
+            return False
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+_live_client: Optional[LiveClient] = None
+
+def live_client() -> LiveClient:
+    """The shared LiveClient (one keep-alive pool for the whole app)."""
+    global _live_client
+    if _live_client is None:
+        _live_client = LiveClient()
+    return _live_client
+
+def is_in_game():
+    return live_client().is_in_game()
@@ -1,10 +1,19 @@
-import re, unicodedata, os, time, json
+import time, math
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Tuple
 from PySide6.QtWidgets import QWidget, QSizePolicy
-from PySide6.QtCore import Qt, QSize, QRect, QTimer, QRectF
+from PySide6.QtCore import Qt, QSize, QRect, QTimer, QRectF, QPointF, Signal
 from PySide6.QtGui import QPainter, QColor, QPixmap, QFont, QPainterPath
-from src.FirebaseSync import FirebaseSync
+from src.SyncBackend import SyncBackend, on_backend, sync_backend
+from src.CooldownEngine import CooldownEngine
+from src.IconAtlas import IconAtlas
+from src.GameRegistry import GameRegistry, ChampionRecord, SpellRecord
+from src.Metrics import Metrics
+
+METRICS = Metrics()
+PAINT_MS = METRICS.histogram("grid_paint_ms", "GridWidget.paintEvent duration")
+TICK_MS = METRICS.histogram("grid_tick_ms", "GridWidget countdown tick cost")
 # ============================== GRID CONTENT ==================================
 
 class GridWidget(QWidget):
@@ -16,6 +25,10 @@ class GridWidget(QWidget):
       row 3: ultimate
     Click: left=start, right=reset
     """
+    RENDER_CACHE_BUDGET = 8 * 1024 * 1024  # bytes of pre-scaled icons kept around
+
+    _remote = Signal(object)  # RTDB events arrive on the listener thread; handled on the GUI thread
+
     def __init__(self, scale: float = 1.0, parent=None):
         super().__init__(parent)
         self._scale = scale
@@ -23,72 +36,95 @@ class GridWidget(QWidget):
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
 
         self.content = GridContent()
-        self._cache: Dict[str, QPixmap] = {}
+        self.atlas = IconAtlas()
+        self._cache = RenderCache(self.RENDER_CACHE_BUDGET)
+        METRICS.gauge("grid_cache_hit_ratio", "Pre-scaled icon cache hits / lookups", fn=self._cache.hit_ratio)
+        METRICS.gauge("grid_cache_bytes", "Pre-scaled icon cache size", fn=lambda: self._cache.bytes)
         self.label_font = QFont(); self.label_font.setPointSize(9)
 
-        self.timers: Dict[Tuple[int,int], CellTimer] = {}
-        self.ult_cd_map = load_ult_cd_map()
+        # (row, spell slot) -> absolute deadline; spell slot 0/1 is grid col 1/2
+        self.cooldowns = CooldownEngine(rows=5, slots=2)
+        self._shown: Dict[Tuple[int,int], int] = {}  # whole seconds last painted per running cell
+        self._traces: Dict[Tuple[int,int], float] = {}  # cell -> remote click time (server ms), until painted
+        self.registry = GameRegistry()
 
+        # single-shot, armed for the next moment a visible countdown changes (see _schedule)
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self._on_tick)
-        self.timer.start(250)
-        FirebaseSync().listen(self._on_firebase_update)
+        self._remote.connect(self._on_firebase_update)
+        on_backend(self._attach_sync)  # the backend is created lazily, on first team-sync use
+
+    def _attach_sync(self, sync: SyncBackend):
+        # may run on the thread that first needed team sync; both calls are thread-safe
+        sync.listen(self._remote.emit)
+        sync.signals.failed.connect(self._on_sync_failed)
 
     def _on_firebase_update(self, event):
-        path = event.path  # e.g., "/Aatrox/ultimate"
-        data = event.data  # e.g., {"usedAt": 1234567890} or {"usedAt": 0}
-        if not path or not data:
-            return
-        parts = path.strip("/").split("/")
-        if len(parts) != 2:
-            return
-        champ, spell = parts
-        used_at = data.get("usedAt", 0)
-        now = int(time.time())
-        duration = 0
+        # path "/" + whole match on attach, "/Aatrox" + {spell: {...}} or "/Aatrox/Flash" + {"usedAt": ...};
+        # every cell in the event is applied first and repainted once
+        dirty = None
+        path = event.path or "/"
+        snapshot = path == "/" and getattr(event, "event_type", "put") == "put"  # history, not a live click
+        for champ, spell, value in iter_spell_updates(path, event.data):
+            cell = self._apply_remote(champ, spell, value, trace=not snapshot)
+            if cell:
+                rect = self.cell_rect(cell[0], cell[1] + 1)
+                dirty = rect if dirty is None else dirty.united(rect)
+        if dirty is not None:
+            self.update(dirty)
+            self._schedule()
+
+    def _apply_remote(self, champ: str, spell: str, value: dict, trace: bool = True) -> Optional[Tuple[int,int]]:
         if spell == "ultimate":
             #duration = self._ult_base_cd(champ)
-            return
-        else:
-            duration = self._spell_base_cd(spell)
+            return None
         try:
-            duration = int(duration)
+            duration = int(self._spell_base_cd(spell))
         except Exception:
             duration = 0
         if duration <= 0:
-            return
-        key = None
-        # ahora los enemigos están en filas
-        for row in range(len(self.content.enemies)):
-            if self.content.enemies[row].champion == champ:
-                if self.content.enemies[row].spells[0] == spell:
-                    key = (row, 1)
-                elif self.content.enemies[row].spells[1] == spell:
-                    key = (row, 2)
-                if key:
-                    break
-        if not key:
-            return
-        t = self.timers.get(key)
-        if not t:
-            t = CellTimer(); self.timers[key] = t
+            return None
+        cell = self.cooldowns.lookup(champ, spell)
+        if not cell:
+            return None
+        row, slot = cell
+        sync = sync_backend()
+        try:
+            # usedAtMs is in the server's clock; older clients only send whole seconds
+            used_at = float(value.get("usedAtMs") or 0) / 1000.0 or float(value.get("usedAt") or 0)
+        except (TypeError, ValueError, AttributeError):
+            used_at = 0
         if used_at > 0:
-            elapsed = now - used_at
-            remaining = max(0, duration - elapsed)
-            t.start(float(remaining))
+            self.cooldowns.start_from_wall(row, slot, used_at, float(duration), wall_now=sync.now_ms() / 1000.0)
+            if trace and value.get("trace") and not sync.is_own(value["trace"]):
+                self._traces[cell] = used_at * 1000.0
         else:
-            t.reset()
-        print(f"[GRID] Firebase update: {champ} - {spell} usedAt={used_at}, duration={duration}s")
-        self.update()
+            self.cooldowns.reset(row, slot)
+        print(f"[GRID] Firebase update: {champ} - {spell} usedAt={used_at:.3f}, duration={duration}s")
+        return cell
+
+    def _on_sync_failed(self, paths: list, error: str):
+        # the local countdown stays; only teammates miss the update
+        print(f"[GRID] Team sync write failed ({error}): {', '.join(paths)}")
 
     def set_scale(self, s: float):
         self._scale = max(0.25, s)
+        self._cache.clear()  # every cell size changed, old renders are dead weight
         self.updateGeometry()
         self.update()
 
     def set_content_from_enemies(self, enemies: List[Dict]):
         self.content.set_enemies(enemies)
-        self.timers.clear()
+        self.cooldowns.set_roster([(e.champion, e.spells) for e in self.content.enemies])
+        # team sync paths use the sanitized spell name (Hexflash -> Flash, ...)
+        for row, e in enumerate(self.content.enemies):
+            for slot, spell in enumerate(e.spells):
+                self.cooldowns.bind(row, slot, e.champion, SyncBackend.duplicatedSpells.get(spell, spell))
+        self._shown.clear()
+        self._traces.clear()
+        self.timer.stop()
         self.update()
 
     def clear(self):
@@ -110,14 +146,26 @@ class GridWidget(QWidget):
         y = margin + row * (square + spacing)
         return QRect(x, y, square, square)
 
-    def _get_pixmap(self, path: str) -> Optional[QPixmap]:
-        if not path: return None
-        if path in self._cache: return self._cache[path]
-        if os.path.exists(path):
-            pm = QPixmap(path); self._cache[path] = pm; return pm
-        return None
-
-    def paintEvent(self, _):
+    def _get_pixmap(self, key: str) -> Optional[QPixmap]:
+        return self.atlas.pixmap(key)
+
+    def _draw_icon(self, p: QPainter, key: str, rect: QRect, radius: int) -> bool:
+        """Blit the icon for ``key`` into ``rect``, scaling/rounding it only on a cache miss."""
+        if not key: return False
+        dpr = self.devicePixelRatioF()
+        ck = (key, rect.width(), rect.height(), radius, dpr)
+        pm = self._cache.get(ck)
+        if pm is None:
+            src = self._get_pixmap(key)
+            if not src or src.isNull(): return False
+            pm = render_pixmap_fit_center(src, rect.size(), radius, dpr)
+            self._cache.put(ck, pm)
+        p.drawPixmap(rect.topLeft(), pm)
+        return True
+
+    def paintEvent(self, e):
+        started = METRICS.now()
+        dirty = e.region()
         p = QPainter(self)
         try:
             p.setRenderHint(QPainter.Antialiasing)
@@ -128,35 +176,44 @@ class GridWidget(QWidget):
             margin = int(m.margin * s); spacing = int(m.spacing * s); square = int(m.square * s)
             extra = int(m.champion_gap * s)
             radius = max(6, int(8 * s))
-            # grid outlines (3 columnas x 5 filas)
+            # grid outlines (3 columnas x 5 filas); cells outside the dirty region are skipped
             for r in range(5):
                 for c in range(3):
                     rect = self.cell_rect(r, c)
-                    p.drawRoundedRect(rect, radius, radius)
+                    if dirty.intersects(rect):
+                        p.drawRoundedRect(rect, radius, radius)
             
             # contents: ahora cada enemigo es una fila (hasta 5)
             for i in range(min(5, len(self.content.enemies))):
                 # champion (col 0)
                 rect0 = self.cell_rect(i, 0)
-                pm = self._get_pixmap(self.content.hero_path(i))
-                if pm: draw_pixmap_fit_center(p, pm, rect0, radius)
-                else:  self._draw_label(p, rect0, self.content.enemies[i].champion)
+                if dirty.intersects(rect0) and not self._draw_icon(p, self.content.hero_icon(i), rect0, radius):
+                    self._draw_label(p, rect0, self.content.enemies[i].champion)
 
                 # spell1 (col 1)
                 rect1 = self.cell_rect(i, 1)
-                pm = self._get_pixmap(self.content.spell1_path(i))
-                if pm: draw_pixmap_fit_center(p, pm, rect1, radius)
-                else:  self._draw_label(p, rect1, self.content.enemies[i].spells[0] or "—")
-                self._draw_timer_overlay(p, i, 1, rect1)
+                if dirty.intersects(rect1):
+                    if not self._draw_icon(p, self.content.spell1_icon(i), rect1, radius):
+                        self._draw_label(p, rect1, self.content.enemies[i].spells[0] or "—")
+                    self._draw_timer_overlay(p, i, 1, rect1)
+                    self._trace_rendered(i, 0)
 
                 # spell2 (col 2)
                 rect2 = self.cell_rect(i, 2)
-                pm = self._get_pixmap(self.content.spell2_path(i))
-                if pm: draw_pixmap_fit_center(p, pm, rect2, radius)
-                else:  self._draw_label(p, rect2, self.content.enemies[i].spells[1] or "—")
-                self._draw_timer_overlay(p, i, 2, rect2)
+                if dirty.intersects(rect2):
+                    if not self._draw_icon(p, self.content.spell2_icon(i), rect2, radius):
+                        self._draw_label(p, rect2, self.content.enemies[i].spells[1] or "—")
+                    self._draw_timer_overlay(p, i, 2, rect2)
+                    self._trace_rendered(i, 1)
         finally:
             p.end()
+            PAINT_MS.since(started)
+
+    def _trace_rendered(self, row: int, slot: int):
+        clicked_ms = self._traces.pop((row, slot), None) if self._traces else None
+        if clicked_ms is not None:
+            sync = sync_backend()
+            sync.record_latency(sync.now_ms() - clicked_ms)
 
     def _draw_label(self, p: QPainter, rect: QRect, text: str):
         if not text: text = "?"
@@ -167,40 +224,60 @@ class GridWidget(QWidget):
         p.restore()
 
     def _draw_timer_overlay(self, p: QPainter, row: int, col: int, rect: QRect):
-        t = self.timers.get((row, col))
-        if not t: return
-        if t.running:
-            txt = fmt_mmss(t.remaining); bg = QColor(0, 0, 0, 140)
-        else:
+        remaining = self.cooldowns.remaining(row, col - 1)
+        if remaining <= 0:
             return
+        txt = fmt_mmss(remaining); bg = QColor(0, 0, 0, 140)
         p.save()
-        pill_h = max(14, int(16 * self._scale))
-        r = QRect(rect.x()+2, rect.bottom()-pill_h-2, rect.width()-4, pill_h)
+        r = self._pill_rect(rect)
         p.setBrush(bg); p.setPen(Qt.NoPen); p.drawRoundedRect(r, 4, 4)
         f = QFont(self.label_font); f.setBold(True); f.setPointSize(max(8, int(10 * self._scale))); p.setFont(f)
         p.setPen(QColor(255,255,255,230)); p.drawText(r, Qt.AlignCenter, txt)
         p.restore()
 
+    def _pill_rect(self, cell: QRect) -> QRect:
+        pill_h = max(14, int(16 * self._scale))
+        return QRect(cell.x()+2, cell.bottom()-pill_h-2, cell.width()-4, pill_h)
+
     def _on_tick(self):
-        changed = False
-        for t in self.timers.values():
-            before = (t.running, t.remaining); t.tick(); after = (t.running, t.remaining)
-            if before != after: changed = True
-        if changed: self.update()
+        # repaint only the pills whose mm:ss text (or visibility) actually changed
+        started = METRICS.now()
+        now = time.monotonic()
+        for row, slot in self.cooldowns.pop_expired(now):
+            self._shown.pop((row, slot), None)
+            self.update(self._pill_rect(self.cell_rect(row, slot + 1)))
+        for row, slot, remaining in self.cooldowns.running(now):
+            if self._shown.get((row, slot)) != int(remaining):
+                self._shown[(row, slot)] = int(remaining)
+                self.update(self._pill_rect(self.cell_rect(row, slot + 1)))
+        self._schedule()
+        TICK_MS.since(started)
+
+    def _schedule(self):
+        """Arm the single-shot timer for the next instant any visible countdown changes."""
+        running = self.cooldowns.running() if self.isVisible() else None
+        if not running:
+            self.timer.stop(); return  # nothing counting down, or hidden (re-armed in showEvent)
+        delay = min(next_change_in(remaining) for _, _, remaining in running)
+        self.timer.start(max(1, math.ceil(delay * 1000)))
+
+    def showEvent(self, e):
+        self._shown.clear()
+        self._schedule()
+        super().showEvent(e)
+
+    def hideEvent(self, e):
+        # rendering is suspended while hidden: no ticks, and traces would only measure the hidden time
+        self.timer.stop()
+        self._traces.clear()
+        super().hideEvent(e)
 
     def _spell_base_cd(self, display_name: str) -> int:
-        try:
-            return SUMMONER_CD.get(display_name)
-        except Exception as e:
-            print(f"Error getting spell base cooldown for {display_name}: {e}")
-            return 0
+        rec = self.registry.find_spell(display_name)
+        return rec.cooldown if rec else 0
 
     def _ult_base_cd(self, champ_name: str) -> int:
-        try:
-            return int(self.ult_cd_map.get(slugify(champ_name), DEFAULT_ULT_CD))
-        except Exception as e:
-            print(f"Error getting ultimate base cooldown for {champ_name}: {e}")
-            return DEFAULT_ULT_CD
+        return self.registry.champion(champ_name).ult_cd
 
     def mousePressEvent(self, e):
         if e.button() not in (Qt.LeftButton, Qt.RightButton):
@@ -218,8 +295,8 @@ class GridWidget(QWidget):
         if col == 0:
             return
         if e.button() == Qt.RightButton: # reset
-            t = self.timers.get((row, col))
-            if t: t.reset(); self.update()
+            if self.cooldowns.is_running(row, col - 1):
+                self.cooldowns.reset(row, col - 1); self.update(self.cell_rect(row, col)); self._schedule()
             # reset usando champ + spell para mantener semántica
             if row < len(self.content.enemies):
                 champ = self.content.enemies[row].champion
@@ -230,7 +307,7 @@ class GridWidget(QWidget):
                 else:
                     #disp = "ultimate"
                     return
-                FirebaseSync().reset_spell(champ, disp)
+                sync_backend().reset_spell(champ, disp)
             return
         duration = 0
         if row < len(self.content.enemies):
@@ -239,57 +316,47 @@ class GridWidget(QWidget):
                 idx = 0 if col == 1 else 1
                 disp = self.content.enemies[row].spells[idx]
                 duration = self._spell_base_cd(disp)
-                FirebaseSync().mark_spell_used(champ, disp)
+                sync_backend().mark_spell_used(champ, disp)
                 print(f"[GRID] Marked spell used: {champ} - {disp}")
-        t = self.timers.get((row, col))
-        if not t: t = CellTimer(); self.timers[(row, col)] = t
-        t.start(float(duration)); self.update()
+        self.cooldowns.start(row, col - 1, float(duration)); self.update(self.cell_rect(row, col)); self._schedule()
 
 
 class GridContent:
-    def __init__(self, heroes_dir="res/heroes", spells_dir="res/spells", ultimates_dir="res/ultimates"):
-        self.heroes_dir = heroes_dir
-        self.spells_dir = spells_dir
-        self.ultimates_dir = ultimates_dir
+    def __init__(self):
+        self.registry = GameRegistry()
         self.enemies: List[EnemyInfo] = []
 
     def set_enemies(self, enemies: List[Dict]):
         out: List[EnemyInfo] = []
         for e in enemies[:5]:
-            champ = e.get("champion", "") or ""
-            champ = self.getChampName(champ)
-            spells = (e.get("spells", []) or []) + ["", ""]
-            spells = [self.getSummoner(s) for s in spells]
-            out.append(EnemyInfo(champion=champ, spells=spells[:2]))
+            champ = self.registry.champion(e.get("champion", "") or "")
+            spells = [self.registry.spell(s) for s in ((e.get("spells", []) or []) + ["", ""])[:2]]
+            out.append(EnemyInfo(champion=champ.name, spells=[s.name for s in spells],
+                                 champ_rec=champ, spell_recs=spells))
         self.enemies = out
 
     def getSummoner(self, key):
-        if SUMMONER_CD_ES.get(key):
-            return list(SUMMONER_CD.keys())[list(SUMMONER_CD_ES.keys()).index(key)]
-        return key
-    
+        return self.registry.spell(key).name
+
     def getChampName(self, key):
-        with open("res/champ_data.json", "r", encoding="utf-8") as f:
-            champ_data = json.load(f)
-        for champ in champ_data.get("champions", []):
-            if key in champ:
-                return champ[key]
-        return key
-
-    def hero_path(self, idx: int) -> str:
+        return self.registry.champion(key).name
+
+    # atlas keys ("heroes/aatrox", "spells/flash", ...) used by IconAtlas
+    def hero_icon(self, idx: int) -> str:
         if idx >= len(self.enemies): return ""
-        return os.path.join(self.heroes_dir, f"{slugify(self.enemies[idx].champion)}.png")
+        return self.enemies[idx].champ_rec.hero_icon
 
-    def spell1_path(self, idx: int) -> str:
+    def spell1_icon(self, idx: int) -> str:
         if idx >= len(self.enemies): return ""
-        return os.path.join(self.spells_dir, f"{slugify(self.enemies[idx].spells[0])}.png")
+        return self.enemies[idx].spell_recs[0].icon
 
-    def spell2_path(self, idx: int) -> str:
+    def spell2_icon(self, idx: int) -> str:
         if idx >= len(self.enemies): return ""
-        return os.path.join(self.spells_dir, f"{slugify(self.enemies[idx].spells[1])}.png")
-    def ultimate_path(self, idx: int) -> str:
+        return self.enemies[idx].spell_recs[1].icon
+
+    def ultimate_icon(self, idx: int) -> str:
         if idx >= len(self.enemies): return ""
-        return os.path.join(self.ultimates_dir, f"{slugify(self.enemies[idx].champion)}.png")
+        return self.enemies[idx].champ_rec.ultimate_icon
 
 # ============================== GRID WIDGET ===================================
 @dataclass
@@ -299,107 +366,104 @@ class GridMetrics:
     square: int = 50
     champion_gap: int = 20
 
-@dataclass
-class CellTimer:
-    running: bool = False
-    duration: float = 0.0
-    start_time: float = 0.0
-    remaining: float = 0.0
-    def start(self, duration: float):
-        self.running = True
-        self.duration = max(0.0, duration)
-        self.start_time = time.monotonic()
-        self.remaining = self.duration
-    def reset(self):
-        self.running = False
-        self.remaining = 0.0
-    def tick(self):
-        if not self.running: return
-        elapsed = time.monotonic() - self.start_time
-        self.remaining = max(0.0, self.duration - elapsed)
-        if self.remaining <= 0: self.running = False
+class RenderCache:
+    """LRU of pre-scaled, rounded icon pixmaps bounded by a byte budget.
+
+    Keyed by (asset, width, height, radius, devicePixelRatio). ``hits`` and
+    ``misses`` let us check that steady-state paints never rescale.
+    """
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self._items: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple) -> Optional[QPixmap]:
+        pm = self._items.get(key)
+        if pm is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return pm
+
+    def put(self, key: tuple, pm: QPixmap):
+        if key in self._items:
+            self.bytes -= pixmap_bytes(self._items.pop(key))
+        self._items[key] = pm
+        self.bytes += pixmap_bytes(pm)
+        while self.bytes > self.budget_bytes and len(self._items) > 1:
+            _, old = self._items.popitem(last=False)
+            self.bytes -= pixmap_bytes(old)
+            self.evictions += 1
+
+    def clear(self):
+        self._items.clear()
+        self.bytes = 0
+
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._items), "bytes": self.bytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
 
 @dataclass
 class EnemyInfo:
     champion: str
     spells: List[str]  # [spell1, spell2]
-
-# ============================== COOLDOWNS =====================================
-SUMMONER_CD = {
-    "Flash": 300,
-    "Hexflash": 300,
-    "Ignite": 180,
-    "Teleport": 360,
-    "Unleashed Teleport": 360,
-    "Heal": 240,
-    "Barrier": 180,
-    "Exhaust": 210,
-    "Ghost": 210,
-    "Cleanse": 210,
-    "Smite": 15,
-    "Unleashed Smite": 15,
-    "Clarity": 240,
-    "Mark": 80,
-    "Porobelt": 10,
-    "Poro_toss": 10,
-}
-
-SUMMONER_CD_ES = {
-    "Destello": 300,
-    "Hextello": 300,
-    "Prender": 180,
-    "Teleportar": 360,
-    "Teleportar desatado": 360,
-    "Curar": 240,
-    "Barrera": 180,
-    "Extenuación": 210,
-    "Fantasmal": 210,
-    "Limpiar": 210,
-    "Aplastar": 15,
-    "Aplastar desatado": 15,
-    "Claridad": 240,
-    "Marca": 80,
-    "porobelt": 10,
-    "poro_toss": 10,
-}
-DEFAULT_ULT_CD = 120
-
-def load_ult_cd_map(path="ult_cooldowns.json") -> Dict[str, int]:
-    if os.path.exists(path):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            return {slugify(k): int(v) for k, v in raw.items() if isinstance(v, (int, float, str))}
-        except Exception as e:
-            print("[ULT-CD] Failed to load ult_cooldowns.json:", e)
-    return {}
+    champ_rec: Optional[ChampionRecord] = None
+    spell_recs: Optional[List[SpellRecord]] = None  # resolved [spell1, spell2]
 
 # ============================== HELPERS =======================================
-def slugify(name: str) -> str:
-    if not name:
-        return ""
-    s = unicodedata.normalize("NFKD", name)
-    s = s.encode("ascii", "ignore").decode("ascii")
-    s = s.lower()
-    s = re.sub(r"[^\w]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s
-
-def draw_pixmap_fit_center(p: QPainter, pix: QPixmap, rect: QRect, radius: int = 0):
-    if pix.isNull() or rect.width() <= 0 or rect.height() <= 0:
-        return
-    target = pix.scaled(rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-    x = rect.x() + (rect.width() - target.width()) // 2
-    y = rect.y() + (rect.height() - target.height()) // 2
-    p.save()
+def pixmap_bytes(pm: QPixmap) -> int:
+    return pm.width() * pm.height() * max(1, pm.depth() // 8)
+
+def render_pixmap_fit_center(pix: QPixmap, size: QSize, radius: int = 0, dpr: float = 1.0) -> QPixmap:
+    """Scale ``pix`` to fit ``size`` (aspect kept, centered) and clip it to a rounded rect, once."""
+    out = QPixmap(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+    out.setDevicePixelRatio(dpr)
+    out.fill(Qt.transparent)
+    if pix.isNull() or size.width() <= 0 or size.height() <= 0:
+        return out
+    target = pix.scaled(out.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    target.setDevicePixelRatio(dpr)
+    x = (size.width() - target.width() / dpr) / 2
+    y = (size.height() - target.height() / dpr) / 2
+    p = QPainter(out)
     try:
+        p.setRenderHint(QPainter.Antialiasing)
         if radius and radius > 0:
             path = QPainterPath()
-            path.addRoundedRect(QRectF(rect), float(radius), float(radius))
+            path.addRoundedRect(QRectF(0, 0, size.width(), size.height()), float(radius), float(radius))
             p.setClipPath(path)
-        p.drawPixmap(x, y, target)
+        p.drawPixmap(QPointF(x, y), target)
     finally:
-        p.restore()
+        p.end()
+    return out
+
+def iter_spell_updates(path: str, data, prefix: Tuple[str, ...] = ()):
+    """Yield (champion, spell, value) for every spell node in an RTDB put/patch event.
+
+    Patch keys may themselves be paths ("Aatrox/Flash"); a deleted node (None) yields {}.
+    """
+    parts = prefix + tuple(x for x in path.strip("/").split("/") if x)
+    if len(parts) == 3 and parts[2] in ("usedAt", "usedAtMs"):
+        yield parts[0], parts[1], {parts[2]: data}; return
+    if len(parts) == 2 and (data is None or (isinstance(data, dict) and ("usedAt" in data or "usedAtMs" in data))):
+        yield parts[0], parts[1], data or {}; return
+    if len(parts) < 2 and isinstance(data, dict):
+        for key, value in data.items():
+            yield from iter_spell_updates(str(key), value, parts)
+
+def next_change_in(remaining: float) -> float:
+    """Seconds until int(remaining), i.e. the shown mm:ss, next changes."""
+    if remaining <= 0: return 0.0
+    frac = remaining - math.floor(remaining)
+    return (frac if frac > 0 else 1.0) + 0.001
 
 def fmt_mmss(seconds: float) -> str:
     if seconds < 0: seconds = 0
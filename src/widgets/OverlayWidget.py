@@ -2,21 +2,26 @@ import sys
 from typing import Optional
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel, QSlider,
-    QToolButton, QFrame, QSizePolicy, QStackedLayout, QMessageBox
+    QToolButton, QFrame, QSizePolicy, QStackedLayout
 )
-from PySide6.QtCore import Qt, QPoint, QSize, QRectF
-from PySide6.QtGui import QPainter, QColor, QPainterPath
+from PySide6.QtCore import Qt, QPoint, QSize, QRectF, QEvent
+from PySide6.QtGui import QPainter, QColor, QPainterPath, QPixmap, QRegion, QFontDatabase
 from src.workers.GameStateWorker import GameStateWorker
 from src.workers.TopmostWorker import TopmostWorker
-from src.workers.LocalSyncWorker import LocalSyncWorker
 from .GridWidget import GridWidget
 from src.UserData import UserData
+from src.Activity import Activity
+from src.Metrics import Metrics
+from src.Scheduler import Scheduler
+from src.LiveEvents import objective_key, respawn_at
 
 # ============================== MAIN OVERLAY ==================================
 class OverlayWidget(QWidget):
     BASE_PAD = 8
     BTN_H = 24
     BTN_W = 24
+    PAGE_GRID, PAGE_SETTINGS, PAGE_DIAGNOSTICS = 0, 1, 2
+    DIAGNOSTICS_JOB = "diagnostics"
     visible = True
     loaded = False
 
@@ -27,7 +32,11 @@ class OverlayWidget(QWidget):
         self._drag_pos: Optional[QPoint] = None
         self._locked = False
         self._in_game = False
+        self._league_focused = False  # last TopmostWorker.status
         self._page = 0
+        self.objective_respawns = {}  # objective_key(event) -> game time the objective is back
+        self._mask_key = None  # (w, h, radius) the current window mask was built for
+        self._bg_cache = {}    # (w, h, radius, dragging, dpr) -> pre-rendered panel
         self._scale = self.userData.get("overlay_scale", 0.70)
         self._default_opacity = self.userData.get("overlay_opacity", 0.40)
         
@@ -38,6 +47,10 @@ class OverlayWidget(QWidget):
 
         # Top-right buttons
         topbar = QHBoxLayout(); topbar.addStretch(1)
+        self.diag_btn = QToolButton(self); self.diag_btn.setText("📊"); self.diag_btn.setToolTip("Diagnostics")
+        self.diag_btn.setAutoRaise(True); self.diag_btn.setFixedSize(self.BTN_W, self.BTN_H); self.diag_btn.clicked.connect(self.toggle_diagnostics)
+        topbar.addWidget(self.diag_btn)
+
         self.lock_btn = QToolButton(self); self.lock_btn.setText("🔓"); self.lock_btn.setToolTip("Lock/Unlock (Ctrl+L)")
         self.lock_btn.setAutoRaise(True); self.lock_btn.setFixedSize(self.BTN_W, self.BTN_H); self.lock_btn.clicked.connect(self.toggle_lock)
         topbar.addWidget(self.lock_btn)
@@ -74,6 +87,14 @@ class OverlayWidget(QWidget):
         help_lbl.setStyleSheet("color: white;"); ps_layout.addWidget(help_lbl,0)
         self.stack.addWidget(page_settings)
 
+        # Page 2: DIAGNOSTICS (metrics + scheduler jobs, refreshed while shown)
+        page_diag = QFrame(self); pd_layout = QVBoxLayout(page_diag); pd_layout.setContentsMargins(0,0,0,0)
+        self.diag_lbl = QLabel(page_diag); self.diag_lbl.setStyleSheet("color: white;")
+        self.diag_lbl.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.diag_lbl.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        pd_layout.addWidget(self.diag_lbl, 0, Qt.AlignTop | Qt.AlignLeft)
+        self.stack.addWidget(page_diag)
+
         # init
         self.on_opacity_changed(self.slider_opacity.value())
         self.adjust_to_content()
@@ -88,39 +109,80 @@ class OverlayWidget(QWidget):
 
         self._game_worker = GameStateWorker()
         self._game_worker.status.connect(self._on_game_state)
+        self._game_worker.synced.connect(self.on_sync_ok)
+        self._game_worker.game_events.connect(self._on_game_events)
         self._game_worker.start()
 
+        # activity level: pauses the focus probe out of game, suspends the grid while hidden
+        self.activity = Activity()
+        self._game_worker.state_changed.connect(self.activity.set_game_state)
+        self.activity.changed.connect(self._on_activity)
+        self.activity.apply()
+
         self.show()
+        self._on_activity(self.activity.level)
 
-    # panel paint (explicit end to silence warnings)
+    # panel paint: one blit of the pre-rendered background (explicit end to silence warnings)
     def paintEvent(self, _):
         p = QPainter(self)
         try:
-            p.setRenderHint(QPainter.Antialiasing)
-            p.setPen(QColor(255, 255, 255, 60))
-
-            # compute rounded rect and radius (scale-aware)
-            rectf = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
-            radius = max(8, int(8 * getattr(self, "_scale", 1.0)))
-
-            # background brush: different when dragging
-            if self._drag_pos is not None:
-                p.setBrush(QColor(50, 50, 50, 120))
-            else:
-                p.setBrush(QColor(30, 30, 30, 5))
-
-            p.drawRoundedRect(rectf, float(radius), float(radius))
-
-            try:
-                path = QPainterPath()
-                path.addRoundedRect(rectf, float(radius), float(radius))
-                region = QRegion(path.toFillPolygon().toPolygon())
-                self.setMask(region)
-            except Exception:
-                pass
+            p.drawPixmap(0, 0, self._background())
         finally:
             p.end()
 
+    def showEvent(self, e):
+        self.activity.set_visible(True)
+        Scheduler().resume(self.DIAGNOSTICS_JOB)
+        super().showEvent(e)
+
+    def hideEvent(self, e):
+        self.activity.set_visible(False)
+        Scheduler().pause(self.DIAGNOSTICS_JOB)
+        super().hideEvent(e)
+
+    def resizeEvent(self, e):
+        self._update_mask()
+        super().resizeEvent(e)
+
+    def _panel_radius(self) -> int:
+        return max(8, int(8 * getattr(self, "_scale", 1.0)))
+
+    def _panel_path(self) -> QPainterPath:
+        rectf = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
+        radius = float(self._panel_radius())
+        path = QPainterPath(); path.addRoundedRect(rectf, radius, radius)
+        return path
+
+    def _update_mask(self):
+        """Rebuild the window mask only when size or corner radius changed."""
+        key = (self.width(), self.height(), self._panel_radius())
+        if key == self._mask_key:
+            return
+        self._mask_key = key
+        self._bg_cache.clear()
+        self.setMask(QRegion(self._panel_path().toFillPolygon().toPolygon()))
+
+    def _background(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        dragging = self._drag_pos is not None
+        key = (self.width(), self.height(), self._panel_radius(), dragging, dpr)
+        pm = self._bg_cache.get(key)
+        if pm is None:
+            pm = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+            p = QPainter(pm)
+            try:
+                p.setRenderHint(QPainter.Antialiasing)
+                p.setPen(QColor(255, 255, 255, 60))
+                # background brush: different when dragging
+                p.setBrush(QColor(50, 50, 50, 120) if dragging else QColor(30, 30, 30, 5))
+                p.drawPath(self._panel_path())
+            finally:
+                p.end()
+            self._bg_cache[key] = pm
+        return pm
+
     def closeEvent(self, e):
             try:
                 self.save_position()
@@ -146,6 +208,8 @@ class OverlayWidget(QWidget):
 ############################################
 
     def _on_topmost_status(self, league_active_window: bool):
+        # TopmostWorker only reports changes; in-game and own-activation changes re-run this with the last value
+        self._league_focused = league_active_window
         HWND_TOPMOST = -1
         SWP_NOMOVE = 0x0002
         SWP_NOSIZE = 0x0001
@@ -172,28 +236,47 @@ class OverlayWidget(QWidget):
         except Exception as e:
             print("[TOPMOST] Error updating window state:", e)
 
+    def _on_activity(self, level: str):
+        # out of game the focus probe is paused, so nothing else would hide the overlay
+        if IS_WINDOWS and level in (Activity.IDLE, Activity.LOADING):
+            self._topmost_worker.reset()  # report afresh when the probe resumes
+            self._league_focused = False
+            if self.visible:
+                self.hide()
+                self.visible = False
+
+    def changeEvent(self, e):
+        if IS_WINDOWS and e.type() == QEvent.ActivationChange and getattr(self, "_topmost_worker", None):
+            self._on_topmost_status(self._league_focused)
+        super().changeEvent(e)
+
 #############################################
 ############ Game state handling ############
 #############################################
 
     def _on_game_state(self, in_game: bool):
-        """Called from GameStateWorker (main thread) with the latest in-game status."""
-        # game started
-        if in_game and not getattr(self, "_in_game", False):
-            print("[AUTO-SYNC] Game started, attempting sync…")
-            # don't start another worker if one is already running
-            if not getattr(self, "worker", None) or not self.worker.isRunning():
-                self.worker = LocalSyncWorker()
-                self.worker.finished_ok.connect(self.on_sync_ok)
-                self.worker.failed.connect(self.on_sync_fail)
-                self.worker.start()
-                self.loaded = True
-        elif not in_game and getattr(self, "_in_game", False):
+        """Called from GameStateWorker (main thread) when the in-game status flips.
+
+        The enemy team itself arrives through ``synced`` -> on_sync_ok.
+        """
+        if in_game:
+            print("[AUTO-SYNC] Game started.")
+            self.loaded = True
+        elif getattr(self, "_in_game", False):
             print("[AUTO-SYNC] Game ended, clearing grid.")
             self.grid.clear()
+            self.objective_respawns.clear()
             self.loaded = False
             self._in_game = False
 
+    def _on_game_events(self, events: list):
+        """New Live Client events; objective kills update ``objective_respawns`` (game time)."""
+        for ev in events:
+            back = respawn_at(ev)
+            if back is not None:
+                self.objective_respawns[objective_key(ev)] = back
+                print(f"[EVENTS] {ev.name} at {fmt_game_time(ev.time)}, back at {fmt_game_time(back)}")
+
 ############################################
 ########### Mouse drag handling ############
 ############################################
@@ -232,7 +315,7 @@ class OverlayWidget(QWidget):
 
     def on_scale_changed(self, val):
         self._scale = val/100.0; self.scale_lbl.setText(f"{val}%")
-        self.grid.set_scale(self._scale); self.adjust_to_content(); #force_topmost(self)
+        self.grid.set_scale(self._scale); self.adjust_to_content(); self._update_mask() #force_topmost(self)
         self.userData.set("overlay_scale", val/100.0)
 
     def toggle_lock(self):
@@ -241,7 +324,27 @@ class OverlayWidget(QWidget):
         self.setCursor(Qt.ArrowCursor if self._locked else Qt.OpenHandCursor)
 
     def toggle_page(self):
-        self._page = 1 - self._page; self.stack.setCurrentIndex(self._page); self.adjust_to_content(); #force_topmost(self)
+        self.show_page(self.PAGE_GRID if self._page == self.PAGE_SETTINGS else self.PAGE_SETTINGS)
+
+    def toggle_diagnostics(self):
+        self.show_page(self.PAGE_GRID if self._page == self.PAGE_DIAGNOSTICS else self.PAGE_DIAGNOSTICS)
+
+    def show_page(self, page: int):
+        self._page = page; self.stack.setCurrentIndex(page)
+        if page == self.PAGE_DIAGNOSTICS:
+            self.refresh_diagnostics()
+            Scheduler().add(self.DIAGNOSTICS_JOB, self.refresh_diagnostics, interval=1.0)
+        else:
+            Scheduler().remove(self.DIAGNOSTICS_JOB)
+        self.adjust_to_content() #force_topmost(self)
+
+    def refresh_diagnostics(self):
+        text = Metrics().summary() + "\n\n" + Scheduler().describe() + f"\n\nactivity: {self.activity.level}"
+        if text != self.diag_lbl.text():
+            hint = self.diag_lbl.sizeHint()
+            self.diag_lbl.setText(text)
+            if self.diag_lbl.sizeHint() != hint:
+                self.adjust_to_content()
 
     def adjust_to_content(self):
         tl = self.frameGeometry().topLeft()
@@ -282,11 +385,12 @@ class OverlayWidget(QWidget):
             print(f"[SYNC] {champ}: {spells}")
         self.grid.set_content_from_enemies(enemies)
         self._in_game = True
+        if IS_WINDOWS:
+            self._on_topmost_status(self._league_focused)
 
-    def on_sync_fail(self, msg: str):
-        print("[SYNC] Failed:", msg); QMessageBox.information(self, "Sync", msg)#; force_topmost(self)
-        self.grid.clear()
 
 
+def fmt_game_time(seconds: float) -> str:
+    return f"{int(seconds) // 60}:{int(seconds) % 60:02d}"
 
 IS_WINDOWS = sys.platform.startswith("win")
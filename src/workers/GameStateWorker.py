@@ -1,25 +1,156 @@
-from PySide6.QtCore import QThread, Signal
-from src.commons import is_in_game
-
-class GameStateWorker(QThread):
-    """Background thread that periodically checks if a match is active (is_in_game)."""
-    status = Signal(bool)  # in_game
-    interval = 2000
-    def __init__(self, parent=None):
+from typing import Dict, List, Optional, Tuple
+from PySide6.QtCore import QObject, Signal
+from src.commons import live_client, LiveClientError
+from src.SyncBackend import sync_backend
+from src.LiveEvents import EventFeed
+from src.Scheduler import Scheduler
+
+class GameStateWorker(QObject):
+    """Single Live Client poller driving the game lifecycle.
+
+    idle     -> nothing answering on :2999; probe with exponential backoff
+    loading  -> API up but allPlayers empty (or 404); retry fast
+    in_game  -> enemies emitted once via ``synced``; then only new entries of
+                the event stream are polled (``game_events``), which doubles
+                as the "still in game" check
+    ended    -> the API went away mid-game (connection refused, or
+                IN_GAME_MAX_ERRORS HTTP errors in a row); reported once,
+                then back to idle. A single 5xx/404 from eventdata is retried.
+
+    allgamedata is fetched directly (no separate gamestats probe first) and
+    a connection failure simply means "not in game". Signals only fire on
+    transitions.
+
+    Runs as the "game-state" job of the Scheduler (blocking, on the shared
+    executor); each poll returns the delay until the next one.
+    """
+    JOB = "game-state"
+    IDLE = "idle"
+    LOADING = "loading"
+    IN_GAME = "in_game"
+    ENDED = "ended"
+
+    status = Signal(bool)          # in_game, on change only
+    state_changed = Signal(str)    # one of the states above
+    synced = Signal(list)          # enemy team, once per game
+    game_events = Signal(list)     # new LiveEvents since the previous poll
+
+    IDLE_MIN = 2.0       # seconds
+    IDLE_MAX = 16.0
+    LOADING_INTERVAL = 0.75
+    IN_GAME_INTERVAL = 5.0
+    IN_GAME_MAX_ERRORS = 3  # consecutive HTTP errors from eventdata before the game counts as over
+
+    def __init__(self, parent=None, client=None):
         super().__init__(parent)
-        self._running = True
+        self._idle_delay = self.IDLE_MIN
+        self.client = client or live_client()
+        self.events = EventFeed(self.client)
+        self.state = self.IDLE
+        self._errors = 0
 
-    def run(self):
-        while self._running:
+    def _set_state(self, state: str):
+        if state == self.state:
+            return
+        was_in_game = self.state == self.IN_GAME
+        self.state = state
+        print(f"[GAME] State -> {state}")
+        self.state_changed.emit(state)
+        if state == self.ENDED:
             try:
-                in_game = is_in_game()
-            except Exception:
-                in_game = False
-            try:
-                self.status.emit(in_game)
-            except Exception:
-                pass
-            self.msleep(self.interval)
+                sync_backend().leave()
+            except Exception as e:
+                print("[GAME] Team sync leave failed:", e)
+        if was_in_game != (state == self.IN_GAME):
+            self.status.emit(state == self.IN_GAME)
+
+    def step(self, idle_delay: float) -> float:
+        """One poll. Returns the delay until the next one."""
+        try:
+            if self.state == self.IN_GAME:
+                new = self.events.poll()
+                self._errors = 0
+                if new:
+                    self.game_events.emit(new)
+                return self.IN_GAME_INTERVAL
+            data = self.client.allgamedata()
+        except LiveClientError as e:
+            if e.status is not None and self.state == self.IN_GAME:
+                self._errors += 1
+                if self._errors < self.IN_GAME_MAX_ERRORS:
+                    print(f"[GAME] eventdata answered HTTP {e.status}, retrying")
+                    return self.IN_GAME_INTERVAL
+            if e.status is not None:
+                # server is up but not serving data yet
+                if self.state != self.IN_GAME:
+                    self._set_state(self.LOADING)
+                    return self.LOADING_INTERVAL
+            if self.state in (self.IN_GAME, self.LOADING):
+                if self.state == self.IN_GAME:
+                    self._set_state(self.ENDED)
+                self._set_state(self.IDLE)
+                self._errors = 0
+                return self.IDLE_MIN
+            return idle_delay
+
+        if not data.get("allPlayers"):
+            self._set_state(self.LOADING)
+            return self.LOADING_INTERVAL
+        enemies, match_id = parse_enemies(data)
+        try:
+            sync_backend().setMatchID(match_id)
+        except Exception as e:
+            print("[GAME] Team sync unavailable:", e)
+        self.synced.emit(enemies)
+        # allgamedata already carries the event history: continue the feed after it instead of refetching
+        history = self.events.seed((data.get("events") or {}).get("Events") or [])
+        if history:
+            self.game_events.emit(history)
+        self._set_state(self.IN_GAME)
+        return self.IN_GAME_INTERVAL
+
+    def poll(self) -> float:
+        """step() plus the idle backoff; the Scheduler waits the returned delay."""
+        delay = self.step(self._idle_delay)
+        if self.state == self.IDLE:
+            self._idle_delay = min(self.IDLE_MAX, max(self.IDLE_MIN, delay * 2))
+        else:
+            self._idle_delay = self.IDLE_MIN
+        return delay
+
+    def start(self):
+        Scheduler().add(self.JOB, self.poll, interval=self.IDLE_MIN, jitter=0.1, backoff=self.IDLE_MAX, blocking=True)
 
     def stop(self):
-        self._running = False
\ No newline at end of file
+        Scheduler().remove(self.JOB)
+
+    def wait(self, msecs: int = 0) -> bool:
+        return True  # nothing to join: a poll in flight finishes on the executor and is dropped
+
+def parse_enemies(data: Dict) -> Tuple[List[Dict[str, List[str]]], str]:
+    """Enemy team from an allgamedata payload, plus the match id built from their riot ids."""
+    match_id = ""
+    all_players = data.get("allPlayers", []) or []
+    active = data.get("activePlayer", {}) or {}
+    my_name = active.get("summonerName", "")
+    my_team: Optional[str] = None
+    for p in all_players:
+        if p.get("summonerName", "") == my_name:
+            my_team = p.get("team"); break
+    if my_team is None and all_players:
+        my_team = all_players[0].get("team", "ORDER")
+    enemy = [p for p in all_players if p.get("team") != my_team]
+    result: List[Dict[str, List[str]]] = []
+    for p in enemy:
+        match_id += p.get("riotId","")
+        champ = p.get("championName", "Unknown") or "Unknown"
+        spells = []
+        ss = p.get("summonerSpells", {})
+        for key in ("summonerSpellOne", "summonerSpellTwo"):
+            if key in ss:
+                spells.append(ss[key].get("displayName", "Unknown") or "Unknown")
+        spells = (spells + ["", ""])[:2]
+        result.append({"champion": champ, "spells": spells})
+    print(f"[SYNC] Match ID: {match_id}")
+    #if not result: raise RuntimeError("Could not determine enemy team (maybe game mode not 5v5?).")
+    return result[:5], match_id
@@ -1,37 +1,78 @@
-from PySide6.QtCore import QThread, Signal
-import pygetwindow as gw
+from typing import Optional
+from PySide6.QtCore import QObject, Signal
+from src.Scheduler import Scheduler
+from src.FocusProbe import FocusProbe, PyGetWindowProbe, focus_probe, pygetwindow
 
-class TopmostWorker(QThread):
-    """Background thread that checks game/window state and emits booleans."""
-    status = Signal(bool)  # focused
+class TopmostWorker(QObject):
+    """Reports whether a League window has focus ("topmost" Scheduler job).
+
+    ``status`` fires only when the answer changes; with ``hysteresis`` > 1 a
+    new answer must hold for that many probes in a row first. The answer
+    comes from a FocusProbe (see src/FocusProbe.py): polled every
+    ``interval`` ms, or for event-driven probes checked on each foreground
+    change plus a slow safety poll. The title match is cached, so a probe
+    that sees the same title again costs one string compare.
+    """
+    status = Signal(bool)  # focused, on change only
     interval = 200
-    TARGET_WINDOWS = ["League of Legends", "League of Legends (TM) Client"]
+    JOB = "topmost"
+    TARGET_WINDOWS = ("League of Legends", "League of Legends (TM) Client")
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, probe: Optional[FocusProbe] = None, hysteresis: int = 1):
         super().__init__(parent)
-        self._running = True
-
-    def run(self):
-        while self._running:
-            # print("[TOPMOST WORKER] Checking game/window state…")
-            try:
-                focused = self.is_league_active_window()
-            except Exception:
-                focused = False
-            try:
+        self.probe = probe or focus_probe()
+        self.hysteresis = max(1, int(hysteresis))
+        self.emits = 0
+        self._title = None        # last title seen, and whether it matched
+        self._title_match = False
+        self.reset()
+
+    def reset(self):
+        """Forget the last reported answer; the next probe reports again."""
+        self.focused: Optional[bool] = None
+        self._pending: Optional[bool] = None
+        self._streak = 0
+
+    def check(self) -> Optional[float]:
+        try:
+            focused = self.is_league_active_window()
+        except Exception:
+            focused = False
+        if focused == self.focused:
+            self._pending, self._streak = None, 0
+        else:
+            if focused != self._pending:
+                self._pending, self._streak = focused, 0
+            self._streak += 1
+            if self._streak >= self.hysteresis or self.focused is None:
+                self.focused, self._pending, self._streak = focused, None, 0
+                self.emits += 1
                 self.status.emit(focused)
-            except Exception:
-                pass
-            self.msleep(self.interval)
+        # a change waiting for confirmation is re-probed at the normal rate
+        return None if self._pending is not None else self.probe.POLL_INTERVAL
+
+    def start(self):
+        try:
+            self.probe.start(self._on_probe_event)
+        except Exception as e:
+            print(f"[TOPMOST] {self.probe.NAME} probe failed to start ({e}), polling instead")
+            self.probe = PyGetWindowProbe() if pygetwindow() is not None else FocusProbe()
+        # title lookups are cheap local calls, so the job runs inline on the GUI thread
+        Scheduler().add(self.JOB, self.check, interval=self.interval / 1000.0)
+
+    def _on_probe_event(self):
+        Scheduler().wake(self.JOB)  # no-op while the job is paused (see Activity)
 
     def stop(self):
-        self._running = False
+        Scheduler().remove(self.JOB)
+        self.probe.stop()
 
-    def is_league_active_window(self):
-        try:
-            active = gw.getActiveWindow()
-            if not active:
-                return False
-            return any(title in active.title for title in TopmostWorker.TARGET_WINDOWS)
-        except:
-            return False
\ No newline at end of file
+    def wait(self, msecs: int = 0) -> bool:
+        return True
+
+    def is_league_active_window(self) -> bool:
+        title = self.probe.title()
+        if title != self._title:
+            self._title = title
+            self._title_match = bool(title) and any(t in title for t in self.TARGET_WINDOWS)
+        return self._title_match
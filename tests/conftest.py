@@ -0,0 +1,30 @@
+import os
+import sys
+
+# the app is run from the repository root (python SpellTracker.py), so src/ and tools/ import from there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.SyncBackend import SyncBackend
+
+def detached(cls, init: str = "_init", attrs: dict = None, **kwargs):
+    """A ``cls`` that is not the app-wide singleton: skips ``__new__``/``__init__``,
+    sets ``attrs`` on the instance, then runs its ``init`` method with ``kwargs``."""
+    obj = object.__new__(cls)
+    for name, value in (attrs or {}).items():
+        setattr(obj, name, value)
+    getattr(obj, init)(**kwargs)
+    return obj
+
+class StubSync(SyncBackend):
+    """Sync backend that joins matches locally and drops every write."""
+    def __init__(self):
+        self._init_sync()
+    def setMatchID(self, match_id): self.match_id = match_id
+    def _put(self, path, value): pass
+
+class FakeClock:
+    """Monotonic clock the tests move by hand through ``t``."""
+    def __init__(self, t: float = 0.0):
+        self.t = t
+    def __call__(self) -> float:
+        return self.t
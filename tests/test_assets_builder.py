@@ -0,0 +1,36 @@
+import hashlib
+import importlib.util
+import os
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location("assets_builder", os.path.join(ROOT, "League Assets builder.py"))
+builder = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(builder)
+
+@pytest.fixture
+def asset(tmp_path, monkeypatch):
+    dest = tmp_path / "ahri.png"
+    dest.write_bytes(b"\x89PNG icon")
+    manifest = builder.Manifest(tmp_path / "manifest.json")
+    manifest.put(dest, {"url": "u", "version": "14.1.1", "size": dest.stat().st_size,
+                        "sha256": hashlib.sha256(dest.read_bytes()).hexdigest()})
+    hashed = []
+    real = builder.sha256_file
+    monkeypatch.setattr(builder, "sha256_file", lambda path: hashed.append(path) or real(path))
+    return manifest, dest, hashed
+
+def test_up_to_date_asset_is_hashed_once(asset):
+    manifest, dest, hashed = asset
+    assert manifest.is_current(dest, "14.1.1")  # the ultimate icon pre-check
+    assert builder.fetch_asset(manifest, "14.1.1", "u", dest) == "skipped"
+    assert hashed == [dest]
+
+def test_rewritten_file_is_hashed_again(asset):
+    manifest, dest, hashed = asset
+    assert manifest.is_intact(dest)
+    mtime = dest.stat().st_mtime_ns
+    dest.write_bytes(b"\x89PNG edit")
+    os.utime(dest, ns=(mtime + 1_000_000, mtime + 1_000_000))  # don't rely on the filesystem's mtime resolution
+    assert not manifest.is_intact(dest)
+    assert len(hashed) == 2
@@ -0,0 +1,92 @@
+import pytest
+from src.CooldownEngine import CooldownEngine
+from conftest import FakeClock
+
+@pytest.fixture
+def clock():
+    return FakeClock(1000.0)
+
+@pytest.fixture
+def engine(clock):
+    e = CooldownEngine(rows=5, slots=2, clock=clock)
+    e.set_roster([("Ahri", ["Flash", "Ignite"]), ("Lux", ["Flash", "Heal"])])
+    return e
+
+def test_roster_binds_champion_spell_to_cells(engine):
+    assert engine.lookup("Ahri", "Flash") == (0, 0)
+    assert engine.lookup("Ahri", "Ignite") == (0, 1)
+    assert engine.lookup("Lux", "Heal") == (1, 1)
+    assert engine.lookup("Lux", "Ignite") is None
+
+def test_alias_points_at_existing_cell_and_first_binding_wins(engine):
+    engine.bind(0, 1, "Ahri", "Unleashed Ignite")
+    engine.bind(1, 0, "Ahri", "Flash")
+    assert engine.lookup("Ahri", "Unleashed Ignite") == (0, 1)
+    assert engine.lookup("Ahri", "Flash") == (0, 0)
+
+def test_cell_out_of_range(engine):
+    with pytest.raises(IndexError):
+        engine.start(5, 0, 10)
+    with pytest.raises(IndexError):
+        engine.cell(0, 2)
+
+def test_start_and_remaining(engine, clock):
+    deadline = engine.start(0, 0, 300)
+    assert deadline == clock.t + 300
+    assert engine.is_running(0, 0)
+    clock.t += 120
+    assert engine.remaining(0, 0) == pytest.approx(180)
+    assert not engine.is_running(0, 1)
+    assert engine.remaining(0, 1) == 0.0
+
+def test_reset_stops_cell_and_is_never_reported_expired(engine, clock):
+    engine.start(0, 0, 10)
+    engine.reset(0, 0)
+    assert not engine.is_running(0, 0)
+    clock.t += 20
+    assert engine.pop_expired() == []
+    assert engine.next_expiry() is None
+
+def test_set_roster_clears_running_cooldowns(engine):
+    engine.start(1, 1, 240)
+    engine.set_roster([("Jinx", ["Flash", "Heal"])])
+    assert engine.running() == []
+    assert engine.lookup("Ahri", "Flash") is None
+
+def test_start_from_wall_keeps_elapsed_time(engine, clock):
+    # used 100 s ago (wall clock) with a 300 s cooldown -> 200 s left on our monotonic clock
+    deadline = engine.start_from_wall(0, 0, used_at=5000.0, duration=300, wall_now=5100.0)
+    assert deadline == pytest.approx(clock.t + 200)
+    assert engine.remaining(0, 0) == pytest.approx(200)
+
+def test_start_from_wall_in_the_past_resets(engine):
+    engine.start(0, 0, 300)
+    assert engine.start_from_wall(0, 0, used_at=5000.0, duration=300, wall_now=5400.0) == 0.0
+    assert not engine.is_running(0, 0)
+
+def test_pop_expired_in_deadline_order_and_once(engine, clock):
+    engine.start(1, 0, 30)
+    engine.start(0, 1, 10)
+    engine.start(0, 0, 20)
+    engine.start(1, 1, 100)
+    assert engine.next_expiry() == clock.t + 10
+    clock.t += 25
+    assert engine.pop_expired() == [(0, 1), (0, 0)]
+    assert engine.pop_expired() == []
+    clock.t += 10
+    assert engine.pop_expired() == [(1, 0)]
+    assert engine.next_expiry() == pytest.approx(clock.t - 35 + 100)
+
+def test_restart_replaces_old_deadline(engine, clock):
+    engine.start(0, 0, 10)
+    engine.start(0, 0, 50)  # the 10 s heap entry goes stale
+    clock.t += 20
+    assert engine.pop_expired() == []
+    clock.t += 40
+    assert engine.pop_expired() == [(0, 0)]
+
+def test_running_lists_only_active_cells(engine, clock):
+    engine.start(0, 0, 10)
+    engine.start(1, 1, 60)
+    clock.t += 15
+    assert engine.running() == [(1, 1, pytest.approx(45))]
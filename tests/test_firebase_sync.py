@@ -0,0 +1,77 @@
+import threading
+import pytest
+from PySide6.QtCore import Qt
+import src.FirebaseSync as firebase_sync
+from src.FirebaseSync import FirebaseSync
+from src.Scheduler import Scheduler
+from src.SyncBackend import WriteQueue
+from conftest import detached
+
+class FakeRef:
+    def __init__(self, db, path):
+        self.db, self.path = db, path
+
+    def set(self, value):
+        self.db.gate.wait(5)
+        self.db.nodes[self.path] = 1_700_000_000_000.0
+
+    def get(self):
+        return self.db.nodes[self.path]
+
+    def delete(self):
+        self.db.nodes.pop(self.path, None)
+
+    def listen(self, callback):
+        return self
+
+    def close(self):
+        pass
+
+class FakeDB:
+    def __init__(self):
+        self.nodes, self.refs = {}, []
+        self.gate = threading.Event()
+
+    def reference(self, path):
+        self.refs.append(path)
+        return FakeRef(self, path)
+
+def test_clock_is_sampled_once_at_a_time_and_its_node_removed(monkeypatch):
+    fake = FakeDB()
+    monkeypatch.setattr(firebase_sync, "db", fake)
+    sync = detached(FirebaseSync, init="_init_sync")  # skips firebase_admin.initialize_app
+    sync.setMatchID("M1")
+    sync.setMatchID("M2")  # sampling for M1 is still blocked on the gate
+    fake.gate.set()
+    sync._clock_job.result(5)
+    assert fake.refs.count(f"/_clock/{sync.peer_id}") == 1
+    assert fake.nodes == {}
+    assert sync.clock.rtt_ms is not None
+    sync._close_listener()
+    Scheduler().shutdown()
+
+def test_failed_listen_is_retried_and_writes_outside_a_match_are_dropped(monkeypatch):
+    fake = FakeDB()
+    fake.gate.set()
+    monkeypatch.setattr(firebase_sync, "db", fake)
+    sync = detached(FirebaseSync, init="_init_sync")
+    sync.writes = WriteQueue(lambda batch: None)
+    sync.signals = sync.writes.signals
+    failed = []
+    sync.signals.failed.connect(lambda paths, error: failed.extend(paths), Qt.DirectConnection)
+
+    sync.mark_spell_used("Ahri", "Flash")
+    assert failed == ["Ahri/Flash"] and sync.writes._pending == {}
+
+    def offline(ref, callback):
+        raise ConnectionError("offline")
+    with monkeypatch.context() as patch:
+        patch.setattr(FakeRef, "listen", offline)
+        with pytest.raises(ConnectionError):
+            sync.setMatchID("M1")
+    assert sync.match_id == ""
+    sync.setMatchID("M1")
+    assert sync.match_id == "M1" and sync._listener is not None
+    sync._clock_job.result(5)
+    sync.writes.close()
+    Scheduler().shutdown()
@@ -0,0 +1,26 @@
+import json
+from src.GameRegistry import GameRegistry
+from conftest import detached
+
+def make_registry(tmp_path, names: dict) -> GameRegistry:
+    path = tmp_path / "names.json"
+    path.write_text(json.dumps(names), encoding="utf-8")
+    return detached(GameRegistry, names_path=str(path), champ_data_path=str(tmp_path / "none.json"), ult_cd_path=str(tmp_path / "none.json"))
+
+NAMES = {
+    "version": "14.1.1",
+    "champions": {"Aatrox": ["Aatrox", "aatrox"]},
+    "spells": {"Flash": ["Flash", 300, "flash"], "Destello": ["Flash", 300, "flash"],
+               "Teleport": ["Teleport", 360, "teleport"], "Smite": ["Smite", 15, "smite"]},
+}
+
+def test_hand_kept_spanish_aliases_survive_names_json(tmp_path):
+    reg = make_registry(tmp_path, NAMES)
+    assert reg.find_spell("Hextello").name == "Hexflash"
+    assert reg.find_spell("Teleportar desatado").name == "Unleashed Teleport"
+    assert reg.find_spell("Aplastar desatado").name == "Unleashed Smite"
+
+def test_generated_names_win_over_hand_kept(tmp_path):
+    reg = make_registry(tmp_path, NAMES)
+    assert reg.find_spell("Destello") is reg.find_spell("Flash")
+    assert reg.find_spell("Teleportar") is reg.find_spell("Teleport")
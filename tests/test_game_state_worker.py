@@ -0,0 +1,50 @@
+import pytest
+from src.commons import LiveClient
+from src.SyncBackend import set_backend
+from src.workers.GameStateWorker import GameStateWorker
+from tools.LiveClientSim import Simulator, synthetic_session
+from conftest import StubSync
+
+@pytest.fixture
+def worker():
+    set_backend(StubSync())
+    sim = Simulator(synthetic_session(), port=0).start()
+    client = LiveClient(port=sim.port, schemes=("http",))
+    worker = GameStateWorker(client=client)
+    states = []
+    worker.state_changed.connect(states.append)
+    assert worker.step(worker.IDLE_MIN) == worker.IN_GAME_INTERVAL
+    yield worker, sim, states
+    client.close()
+    sim.stop()
+    set_backend(None)
+
+def fail_eventdata(sim, times: int, status: int = 500):
+    respond, left = sim.respond, [times]
+    def flaky(path):
+        if "eventdata" in path and left[0]:
+            left[0] -= 1
+            return status, {"errorCode": "SIMULATED"}
+        return respond(path)
+    sim.respond = flaky
+
+def test_one_http_error_in_game_keeps_the_game(worker):
+    worker, sim, states = worker
+    fail_eventdata(sim, 1)
+    assert worker.step(worker.IDLE_MIN) == worker.IN_GAME_INTERVAL
+    assert worker.step(worker.IDLE_MIN) == worker.IN_GAME_INTERVAL
+    assert worker.state == worker.IN_GAME and states == ["in_game"]
+
+def test_http_errors_in_a_row_end_the_game(worker):
+    worker, sim, states = worker
+    fail_eventdata(sim, worker.IN_GAME_MAX_ERRORS, status=404)
+    for _ in range(worker.IN_GAME_MAX_ERRORS):
+        worker.step(worker.IDLE_MIN)
+    assert states == ["in_game", "ended", "idle"]
+
+def test_connection_failure_ends_the_game_at_once(worker):
+    worker, sim, states = worker
+    sim.stop()
+    worker.client.close()
+    worker.step(worker.IDLE_MIN)
+    assert states == ["in_game", "ended", "idle"]
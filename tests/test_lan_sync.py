@@ -0,0 +1,56 @@
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# one peer: join (staggered, so later peers only learn earlier writes from the hello/state exchange),
+# click one spell, let the group settle, then print what it knows and which of its writes were echoed
+PEER = r"""
+import json, sys, time
+from PySide6.QtCore import Qt
+from src.LanSync import LanSync
+index, peers = int(sys.argv[1]), int(sys.argv[2])
+sync, confirmed = LanSync(), []
+sync.signals.written.connect(confirmed.extend, Qt.DirectConnection)  # no event loop here
+time.sleep(0.3 * index)
+sync.setMatchID("LOOPBACK")
+time.sleep(0.5)
+sync.mark_spell_used(f"Champ{index}", "Flash")
+time.sleep(0.3 * (peers - index) + 1.5)
+with sync._lock:
+    state = {path: value["usedAtMs"] for path, value in sync._state.items()}
+print(json.dumps({"state": state, "written": confirmed}))
+sync.close()
+"""
+
+def multicast_loopback() -> bool:
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton("127.0.0.1"))
+        sock.close()
+        return True
+    except OSError:
+        return False
+
+@pytest.mark.skipif(not multicast_loopback(), reason="no multicast on the loopback interface")
+def test_peers_on_loopback_converge():
+    peers = 4
+    env = dict(os.environ, LAN_SYNC_IFACE="127.0.0.1", LAN_SYNC_PORT=str(random.randint(40000, 60000)),
+               LAN_SYNC_GROUP="239.255.77.78", PYTHONPATH=ROOT, QT_QPA_PLATFORM="offscreen")
+    procs = [subprocess.Popen([sys.executable, "-c", PEER, str(i), str(peers)], cwd=ROOT, env=env,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) for i in range(peers)]
+    results = []
+    for proc in procs:
+        out, err = proc.communicate(timeout=30)
+        assert proc.returncode == 0, err
+        results.append(json.loads(out.strip().splitlines()[-1]))
+    expected = {f"Champ{i}/Flash" for i in range(peers)}
+    assert set(results[0]["state"]) == expected
+    assert all(r["state"] == results[0]["state"] for r in results)
+    # every write was seen by at least one other peer, so each is confirmed exactly once
+    assert [r["written"] for r in results] == [[f"Champ{i}/Flash"] for i in range(peers)]
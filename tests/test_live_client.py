@@ -0,0 +1,51 @@
+import pytest
+from src.commons import LiveClient, LiveClientError
+from tools.LiveClientSim import Simulator, synthetic_session
+
+@pytest.fixture
+def loading_sim():
+    sim = Simulator(synthetic_session(), loading=3600.0, port=0).start()
+    yield sim
+    sim.stop()
+
+def test_http_status_raises_without_trying_other_scheme(loading_sim):
+    client = LiveClient(port=loading_sim.port, schemes=("http", "https"))
+    with pytest.raises(LiveClientError) as err:
+        client.gamestats()
+    assert err.value.status == 404
+    assert loading_sim.requests == 1
+    assert client.scheme == "http"
+    client.close()
+
+def test_scheme_that_answered_is_remembered(loading_sim):
+    # https fails to connect (the stand-in serves plain HTTP), http answers 404 while loading
+    client = LiveClient(port=loading_sim.port, schemes=("https", "http"))
+    with pytest.raises(LiveClientError):
+        client.gamestats()
+    assert client.scheme == "http"
+    before = loading_sim.requests
+    for _ in range(5):
+        with pytest.raises(LiveClientError):
+            client.gamestats()
+    assert loading_sim.requests - before == 5
+    client.close()
+
+def test_in_game_data():
+    sim = Simulator(synthetic_session(), port=0).start()
+    try:
+        client = LiveClient(port=sim.port)
+        data = client.allgamedata()
+        assert len(data["allPlayers"]) == 10
+        client.close()
+    finally:
+        sim.stop()
+
+def test_nothing_listening_has_no_status():
+    sim = Simulator(synthetic_session(), port=0)
+    port = sim.port
+    sim.server.server_close()
+    client = LiveClient(port=port)
+    with pytest.raises(LiveClientError) as err:
+        client.gamestats()
+    assert err.value.status is None
+    client.close()
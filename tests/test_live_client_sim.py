@@ -0,0 +1,59 @@
+import copy
+import gzip
+import json
+from src.commons import LiveClient
+from tools.LiveClientSim import Session, Simulator, apply_patch, diff, record, synthetic_session
+
+def ticking_session(seconds: int = 40) -> Session:
+    """allgamedata whose gameTime moves every second, with a kill every 10 s, like a real game."""
+    base = synthetic_session().at("allgamedata", 0.0)["body"]
+    records = []
+    for t in range(seconds):
+        body = copy.deepcopy(base)
+        body["gameData"]["gameTime"] = float(t)
+        body["allPlayers"][5]["scores"] = {"kills": t // 10}
+        body["events"]["Events"] += [{"EventID": i + 1, "EventName": "ChampionKill", "EventTime": i * 10.0 + 5}
+                                     for i in range(t // 10)]
+        records.append({"t": float(t), "endpoint": "allgamedata", "status": 200, "body": body})
+    records.append({"t": float(seconds), "endpoint": "*", "status": 0, "body": None})
+    return Session(records)
+
+def test_patch_round_trip():
+    old = {"a": 1, "b": {"c": [1, 2, 3], "d": "x"}, "gone": True, "list": [{"k": 1}, {"k": 2}]}
+    new = {"a": 1, "b": {"c": [1, 2, 3, 4, 5], "d": "y"}, "list": [{"k": 1}, {"k": 3, "n": None}], "new": {"z": 0}}
+    patch = diff(old, new)
+    assert apply_patch(copy.deepcopy(old), json.loads(json.dumps(patch))) == new
+    assert "a" not in patch["v"] and patch["v"]["b"]["v"]["c"] == {"op": "append", "v": [4, 5]}
+
+def test_patch_round_trip_with_marker_like_payload_keys():
+    old = {"x": {"~": 1}, "y": {"op": "set", "v": 2}, "z": [1]}
+    new = {"x": {"~": 2}, "y": {"op": "set", "v": 3}, "z": {"~": [1, 2]}, "w": {"~+": [3]}}
+    patch = diff(old, new)
+    assert apply_patch(copy.deepcopy(old), json.loads(json.dumps(patch))) == new
+    assert apply_patch(old, diff(old, {"~": {"a": 1}})) == {"~": {"a": 1}}
+
+def test_recording_stores_patches_and_replays_the_same_bodies(tmp_path):
+    source = ticking_session()
+    sim = Simulator(source, speed=20.0, port=0).start()
+    path = str(tmp_path / "session.jsonl.gz")
+    try:
+        client = LiveClient(port=sim.port, schemes=("http",))
+        record(path, interval=0.01, client=client)
+        client.close()
+    finally:
+        sim.stop()
+    replay = Session.load(path)
+    bodies = [r["body"] for r in replay.timeline["allgamedata"]]
+    expected = [r["body"] for r in source.timeline["allgamedata"]]
+    assert len(bodies) >= len(expected) - 2  # at 20x a tick can occasionally be missed between polls
+    assert all(body in expected for body in bodies)
+    assert bodies[-1] == expected[-1]
+    assert replay.at("*", replay.duration) is not None
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    allgamedata = [line for line in lines if line["endpoint"] == "allgamedata"]
+    assert "body" in allgamedata[0] and all("patch" in line for line in allgamedata[1:])
+    full = sum(len(json.dumps(b, separators=(",", ":"))) for b in bodies)
+    patched = sum(len(json.dumps(line, separators=(",", ":"))) for line in allgamedata)
+    assert patched * 5 < full
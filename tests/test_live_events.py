@@ -0,0 +1,37 @@
+from src.LiveEvents import EventFeed, objective_key, parse_event, respawn_at
+
+class FakeClient:
+    def __init__(self, events):
+        self.events = events
+        self.asked = []
+
+    def eventdata(self, event_id=None):
+        self.asked.append(event_id)
+        return {"Events": [e for e in self.events if event_id is None or e["EventID"] >= event_id]}
+
+HISTORY = [
+    {"EventID": 0, "EventName": "GameStart", "EventTime": 0.05},
+    {"EventID": 1, "EventName": "InhibKilled", "EventTime": 1500.0, "InhibKilled": "Barracks_T2_L1"},
+    {"EventID": 2, "EventName": "InhibKilled", "EventTime": 1510.0, "InhibKilled": "Barracks_T2_C1"},
+]
+
+def test_each_inhibitor_is_its_own_objective():
+    first, second = (parse_event(raw) for raw in HISTORY[1:])
+    respawns = {objective_key(ev): respawn_at(ev) for ev in (first, second)}
+    assert len(respawns) == 2
+    assert respawns[("InhibKilled", "Barracks_T2_C1")] == 1810.0
+
+def test_dragons_share_one_pit():
+    a = parse_event({"EventID": 3, "EventName": "DragonKill", "EventTime": 600.0, "DragonType": "Fire"})
+    b = parse_event({"EventID": 4, "EventName": "DragonKill", "EventTime": 1000.0, "DragonType": "Water"})
+    assert objective_key(a) == objective_key(b)
+
+def test_seed_continues_after_synced_history():
+    new = {"EventID": 3, "EventName": "BaronKill", "EventTime": 1600.0}
+    client = FakeClient(HISTORY + [new])
+    feed = EventFeed(client)
+    seeded = feed.seed(HISTORY)
+    assert [e.id for e in seeded] == [0, 1, 2]
+    polled = feed.poll()
+    assert client.asked == [3]
+    assert [e.id for e in polled] == [3]
@@ -0,0 +1,72 @@
+import asyncio
+import socket
+import threading
+import time
+import pytest
+from PySide6.QtCore import Qt
+from src.RelaySync import RelaySync
+from tools.SyncRelay import Relay, free_port, main
+from conftest import detached
+
+def start_relay(secret: str = "") -> int:
+    port = free_port()
+    relay = Relay(secret=secret)
+    threading.Thread(target=lambda: asyncio.run(relay.serve("127.0.0.1", port)), daemon=True).start()
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close(); break
+        except OSError:
+            time.sleep(0.05)
+    return port
+
+def make_client(port: int, secret: str = ""):
+    sync = detached(RelaySync, attrs={"URL": f"127.0.0.1:{port}", "SECRET": secret})
+    sync.ACK_TIMEOUT = 0.5
+    sync.writes.RETRIES = 0
+    written, failed = [], []
+    sync.signals.written.connect(written.extend, Qt.DirectConnection)  # no event loop in the tests
+    sync.signals.failed.connect(lambda paths, error: failed.extend(paths), Qt.DirectConnection)
+    return sync, written, failed
+
+def wait_for(predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return predicate()
+
+def test_write_is_confirmed_by_the_relay_ack():
+    sync, written, failed = make_client(start_relay())
+    sync.setMatchID("M1")
+    assert wait_for(lambda: sync._sock is not None)
+    sync.mark_spell_used("Ahri", "Flash")
+    assert wait_for(lambda: written == ["Ahri/Flash"])
+    assert failed == []
+    sync.close()
+
+def test_write_without_a_match_fails():
+    sync, written, failed = make_client(start_relay())
+    sync.mark_spell_used("Ahri", "Flash")
+    assert wait_for(lambda: failed == ["Ahri/Flash"])
+    assert written == []
+    sync.close()
+
+def test_relay_with_a_secret_ignores_clients_without_it():
+    port = start_relay(secret="s3cret")
+    outsider, written, failed = make_client(port)
+    outsider.setMatchID("M1")
+    outsider.mark_spell_used("Ahri", "Flash")
+    assert wait_for(lambda: failed == ["Ahri/Flash"])
+    assert written == []
+    outsider.close()
+    member, written, failed = make_client(port, secret="s3cret")
+    member.setMatchID("M1")
+    assert wait_for(lambda: member._sock is not None)
+    member.mark_spell_used("Ahri", "Flash")
+    assert wait_for(lambda: written == ["Ahri/Flash"])
+    member.close()
+
+def test_serve_refuses_a_public_address_without_a_secret(monkeypatch):
+    monkeypatch.delenv("RELAY_SECRET", raising=False)
+    with pytest.raises(SystemExit):
+        main(["serve", "--host", "0.0.0.0", "--secret", ""])
@@ -0,0 +1,32 @@
+from src.Metrics import Metrics
+from src.SyncMetrics import CLICK_TO_RENDER_MS
+from conftest import StubSync
+
+def per_match():
+    return [i for i in Metrics().items() if i.name == "sync_match_click_to_render_ms"]
+
+def test_latency_is_summarised_per_match_and_dropped_on_leave():
+    metrics = Metrics()
+    metrics.enable()
+    try:
+        sync, before = StubSync(), CLICK_TO_RENDER_MS.count
+        sync.setMatchID("M1")
+        for ms in (12, 40, 180):
+            sync.record_latency(ms)
+        assert sync.latency_summary().startswith("n=3 ")
+        assert [i.labels for i in per_match()] == [(("match", "M1"),)]
+        sync.leave()
+        assert per_match() == [] and sync.latency_summary() == "no samples"
+        sync.setMatchID("M2")
+        sync.record_latency(25)
+        assert [(i.labels, i.count) for i in per_match()] == [((("match", "M2"),), 1)]
+        assert CLICK_TO_RENDER_MS.count - before == 4  # the lifetime histogram keeps every sample
+        sync.leave()
+    finally:
+        metrics.enable(False)
+
+def test_nothing_is_registered_while_metrics_are_off():
+    sync = StubSync()
+    sync.setMatchID("M1")
+    sync.record_latency(12)
+    assert per_match() == [] and sync.latency_summary() == "no samples"
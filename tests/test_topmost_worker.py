@@ -0,0 +1,52 @@
+from src.FocusProbe import ScriptedProbe
+from src.workers.TopmostWorker import TopmostWorker
+from conftest import FakeClock
+
+LEAGUE = "League of Legends (TM) Client"
+
+def run(worker: TopmostWorker, clock: FakeClock, seconds: float, step: float = 0.2):
+    """Drive ``check`` like the Scheduler would at ``step`` intervals; returns the reported answers."""
+    reported = []
+    worker.status.connect(reported.append)
+    end = clock.t + seconds
+    while clock.t < end:
+        worker.check()
+        clock.t += step
+    worker.status.disconnect(reported.append)
+    return reported
+
+def make(script, hysteresis: int = 1):
+    clock = FakeClock()
+    probe = ScriptedProbe(script, clock=clock)
+    probe.start(lambda: None)
+    return TopmostWorker(probe=probe, hysteresis=hysteresis), clock
+
+def test_emits_only_when_focus_changes():
+    worker, clock = make([(0.0, "Discord"), (1.0, LEAGUE), (3.0, "Chrome"), (4.0, "Explorer")])
+    reported = run(worker, clock, 6.0)
+    assert reported == [False, True, False]
+    assert worker.emits == 3
+    assert worker.probe.calls == 30  # probed every tick, reported only on change
+
+def test_same_title_again_is_not_reported():
+    worker, clock = make([(0.0, LEAGUE)])
+    assert run(worker, clock, 2.0) == [True]
+    assert run(worker, clock, 2.0) == []
+
+def test_hysteresis_filters_short_blips():
+    # a 0.2 s alt-tab (one probe) to another window and back
+    script = [(0.0, LEAGUE), (2.0, "Discord"), (2.2, LEAGUE), (4.0, "Chrome")]
+    worker, clock = make(script, hysteresis=2)
+    assert run(worker, clock, 6.0) == [True, False]
+    worker, clock = make(script, hysteresis=1)
+    assert run(worker, clock, 6.0) == [True, False, True, False]
+
+def test_pending_change_is_reprobed_at_the_normal_rate():
+    clock = FakeClock()
+    probe = ScriptedProbe([(0.0, LEAGUE), (1.0, "Discord")], poll_interval=2.0, clock=clock)
+    probe.start(lambda: None)
+    worker = TopmostWorker(probe=probe, hysteresis=2)
+    assert worker.check() == 2.0   # first answer is reported at once
+    clock.t = 1.0
+    assert worker.check() is None  # change seen once: confirm at the job interval, not the safety poll
+    assert worker.check() == 2.0 and worker.focused is False
@@ -0,0 +1,45 @@
+import json
+import threading
+import time
+import pytest
+from PySide6.QtCore import QCoreApplication
+from src.UserData import UserData
+from conftest import detached
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # userdata.json is relative to the working directory
+    data = detached(UserData)
+    data.FLUSH_DELAY = 0.05
+    return data
+
+def run_loop(app, seconds: float):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        app.processEvents(); time.sleep(0.005)
+
+def test_burst_of_sets_is_one_write_without_extra_threads(app, store):
+    threads = threading.active_count()
+    for i in range(50):
+        store.set("overlay_opacity", i / 100.0)
+    assert threading.active_count() == threads
+    assert store.writes == 0
+    run_loop(app, 0.2)
+    assert store.writes == 1
+    assert json.loads(store._path.read_text(encoding="utf-8")) == {"overlay_opacity": 0.49}
+
+def test_flush_writes_pending_changes_and_cancels_the_timer(app, store):
+    store.set("overlay_scale", 1.5)
+    store.flush()
+    assert store.writes == 1
+    run_loop(app, 0.2)
+    assert store.writes == 1
+
+def test_set_from_another_thread_writes_right_away(app, store):
+    worker = threading.Thread(target=store.set, args=("overlay_pos", {"x": 1, "y": 2}))
+    worker.start(); worker.join()
+    assert store.writes == 1
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the League Live Client Data API (127.0.0.1:2999), plus a
+recorder for real sessions, so the workers can be exercised and benchmarked
+on machines without the game.
+
+  # capture a real game into a compact gzip'd JSON-lines file
+  python -m tools.LiveClientSim record session.jsonl.gz
+
+  # replay it (or a built-in synthetic 5v5 when no file is given)
+  python -m tools.LiveClientSim serve session.jsonl.gz --speed 10 --https
+  python -m tools.LiveClientSim serve --loading 5 --latency 50 --timeout-rate 0.1
+
+  # time-to-sync / probe overhead of GameStateWorker and is_in_game
+  python -m tools.LiveClientSim bench
+
+Recording format: one JSON object per line, {"t": seconds since start,
+"endpoint": name, "status": http status, "body": payload}. A line is only
+written when an endpoint's payload changes, and then usually as "patch"
+instead of "body": what changed since that endpoint's previous line (see
+diff/apply_patch), since most polls only move gameTime and a few stats.
+Each endpoint gets a full "body" again every KEYFRAME seconds. eventdata
+is replayed as the full list and sliced by ?eventID= at replay time.
+"""
+import argparse, bisect, gzip, json, os, random, socket, ssl, subprocess, sys, tempfile, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.commons import LiveClient, LiveClientError
+
+ENDPOINTS = ("gamestats", "allgamedata", "activeplayer", "playerlist", "eventdata")
+HOST = "127.0.0.1"
+PORT = 2999
+KEYFRAME = 60.0  # seconds between full bodies of one endpoint in a recording
+
+# ============================== PATCHES =======================================
+# A patch is always an envelope, never the payload itself, so payload keys can't
+# be mistaken for markers: {"op": "set", "v": new value}, {"op": "patch",
+# "v": {key or list index: patch}, "del": [removed keys]} or {"op": "append",
+# "v": [items]} for a list that only grew at the end (events).
+_SAME = object()
+
+def diff(old, new):
+    """Patch turning ``old`` into ``new``; ``_SAME`` when they are equal."""
+    if old == new:
+        return _SAME
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key, value in new.items():
+            d = diff(old[key], value) if key in old else {"op": "set", "v": value}
+            if d is not _SAME:
+                changes[key] = d
+        patch = {"op": "patch", "v": changes}
+        gone = [key for key in old if key not in new]
+        if gone:
+            patch["del"] = gone
+        return patch
+    if isinstance(old, list) and isinstance(new, list):
+        if len(new) > len(old) and new[:len(old)] == old:
+            return {"op": "append", "v": new[len(old):]}
+        if len(new) == len(old):
+            return {"op": "patch", "v": {str(i): d for i, (a, b) in enumerate(zip(old, new)) if (d := diff(a, b)) is not _SAME}}
+    return {"op": "set", "v": new}
+
+def apply_patch(old, patch):
+    """Inverse of ``diff``: the value ``patch`` was made to reach from ``old``."""
+    op, value = patch["op"], patch["v"]
+    if op == "set":
+        return value
+    if op == "append":
+        return list(old) + value
+    if isinstance(old, list):
+        out = list(old)
+        for i, d in value.items():
+            out[int(i)] = apply_patch(out[int(i)], d)
+        return out
+    out = {k: v for k, v in old.items() if k not in patch.get("del", ())}
+    for key, d in value.items():
+        out[key] = apply_patch(out.get(key), d)
+    return out
+
+# ============================== SESSIONS ======================================
+class Session:
+    """Timeline of endpoint payloads, queried by replay time (patches are resolved on load)."""
+    def __init__(self, records: List[Dict]):
+        self.timeline: Dict[str, List[Dict]] = {}
+        for rec in sorted(records, key=lambda r: r["t"]):  # stable: same-t lines keep file order
+            recs = self.timeline.setdefault(rec["endpoint"], [])
+            if "patch" in rec:
+                rec = {"t": rec["t"], "endpoint": rec["endpoint"], "status": rec["status"],
+                       "body": apply_patch(recs[-1]["body"], rec["patch"])}
+            recs.append(rec)
+        self._times = {ep: [r["t"] for r in recs] for ep, recs in self.timeline.items()}
+        self.duration = max((r["t"] for r in records), default=0.0)
+
+    @classmethod
+    def load(cls, path: str) -> "Session":
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            return cls([json.loads(line) for line in f if line.strip()])
+
+    def at(self, endpoint: str, t: float) -> Optional[Dict]:
+        i = bisect.bisect_right(self._times.get(endpoint, []), t)
+        return self.timeline[endpoint][i - 1] if i else None
+
+def synthetic_session(length: float = 1800.0) -> Session:
+    """A plausible 5v5: enemy team, a few objectives, game end after ``length`` seconds."""
+    champs = ["Ahri", "Lee Sin", "Jinx", "Thresh", "Darius", "Aatrox", "Lux", "Ezreal", "Nautilus", "Viego"]
+    spells = [("Flash", "Ignite"), ("Flash", "Smite"), ("Flash", "Heal"), ("Flash", "Exhaust"), ("Teleport", "Flash")]
+    players = []
+    for i, champ in enumerate(champs):
+        s1, s2 = spells[i % 5]
+        players.append({
+            "summonerName": f"Player{i}", "riotId": f"Player{i}#SIM", "championName": champ,
+            "team": "ORDER" if i < 5 else "CHAOS",
+            "summonerSpells": {"summonerSpellOne": {"displayName": s1}, "summonerSpellTwo": {"displayName": s2}},
+        })
+    events = [{"EventID": 0, "EventName": "GameStart", "EventTime": 0.05}]
+    def ev(name, t, **kw):
+        events.append(dict({"EventID": len(events), "EventName": name, "EventTime": t}, **kw))
+    ev("MinionsSpawning", 65.0)
+    ev("ChampionKill", 240.0, KillerName="Player5", VictimName="Player1", Assisters=[])
+    ev("DragonKill", 420.0, DragonType="Fire", Stolen="False", KillerName="Player6", Assisters=[])
+    ev("HeraldKill", 840.0, Stolen="False", KillerName="Player1", Assisters=[])
+    ev("BaronKill", 1260.0, Stolen="False", KillerName="Player6", Assisters=["Player7"])
+    ev("InhibKilled", 1500.0, InhibKilled="Barracks_T1_L1", KillerName="Player8", Assisters=[])
+    ev("Ace", 1510.0, Acer="Player8", AcingTeam="CHAOS")
+
+    # the loading screen is simulated by Simulator(loading=...), the session starts in game
+    records = []
+    start = 0.0
+    records.append({"t": start, "endpoint": "allgamedata", "status": 200,
+                    "body": {"activePlayer": {"summonerName": "Player0"}, "allPlayers": players,
+                             "events": {"Events": events[:1]}, "gameData": {"gameTime": 0.0}}})
+    records.append({"t": start, "endpoint": "playerlist", "status": 200, "body": players})
+    records.append({"t": start, "endpoint": "activeplayer", "status": 200, "body": {"summonerName": "Player0"}})
+    for e in events:
+        records.append({"t": start + e["EventTime"], "endpoint": "eventdata", "status": 200,
+                        "body": {"Events": [x for x in events if x["EventTime"] <= e["EventTime"]]}})
+    for t in range(0, int(length), 30):
+        records.append({"t": start + t, "endpoint": "gamestats", "status": 200,
+                        "body": {"gameMode": "CLASSIC", "gameTime": float(t), "mapName": "Map11"}})
+    records.append({"t": start + length, "endpoint": "*", "status": 0, "body": None})  # client closes
+    return Session(records)
+
+# ============================== RECORDER ======================================
+def record(path: str, interval: float = 1.0, client: Optional[LiveClient] = None, keyframe: float = KEYFRAME):
+    """Poll a real client and append every payload change to ``path`` until the game closes."""
+    client = client or LiveClient()
+    last: Dict[str, tuple] = {}  # endpoint -> (status, body, t of its last full body)
+    start = None
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "wt", encoding="utf-8") as f:
+        print(f"[SIM] Recording to {path} (Ctrl+C to stop)…")
+        try:
+            while True:
+                alive = False
+                for endpoint in ENDPOINTS:
+                    try:
+                        body, status = getattr(client, endpoint)(), 200
+                    except LiveClientError as e:
+                        if e.status is None:
+                            continue
+                        body, status = None, e.status
+                    alive = True
+                    if start is None:
+                        start = time.monotonic()
+                    t = round(time.monotonic() - start, 3)
+                    prev = last.get(endpoint)
+                    if prev is not None and prev[0] == status and prev[1] == body:
+                        continue
+                    line = {"t": t, "endpoint": endpoint, "status": status}
+                    if prev is not None and prev[0] == status and t - prev[2] < keyframe:
+                        line["patch"] = diff(prev[1], body)
+                        last[endpoint] = (status, body, prev[2])
+                    else:
+                        line["body"] = body
+                        last[endpoint] = (status, body, t)
+                    f.write(json.dumps(line, separators=(",", ":")) + "\n")
+                if start is not None and not alive:
+                    f.write(json.dumps({"t": round(time.monotonic() - start, 3), "endpoint": "*", "status": 0, "body": None}) + "\n")
+                    print("[SIM] Game closed, recording done.")
+                    return
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\n[SIM] Stopped.")
+
+# ============================== SERVER ========================================
+class Faults:
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, timeout_rate: float = 0.0,
+                 error_rate: float = 0.0, hang_s: float = 10.0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.timeout_rate = timeout_rate
+        self.error_rate = error_rate
+        self.hang_s = hang_s
+
+class Simulator:
+    """Replays a Session over HTTP (and optionally self-signed HTTPS)."""
+    def __init__(self, session: Session, speed: float = 1.0, loading: float = 0.0,
+                 faults: Optional[Faults] = None, host: str = HOST, port: int = PORT, https: bool = False):
+        self.session = session
+        self.speed = speed
+        self.loading = loading  # extra seconds of "allPlayers: []" before the session starts
+        self.faults = faults or Faults()
+        self.requests = 0
+        self.https = https
+        self.started = time.monotonic()
+        sim = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # headers and body go out as separate writes; don't let Nagle hold the body back
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self):
+                sim.requests += 1
+                status, body = sim.respond(self.path)
+                if status is None:
+                    self.close_connection = True  # "client not running"
+                    return
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        if https:
+            self.server.socket = self._tls_context().wrap_socket(self.server.socket, server_side=True)
+        self.port = self.server.server_address[1]
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _tls_context() -> ssl.SSLContext:
+        tmp = tempfile.mkdtemp(prefix="lcsim-")
+        cert, key = os.path.join(tmp, "cert.pem"), os.path.join(tmp, "key.pem")
+        subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                        "-subj", "/CN=127.0.0.1", "-keyout", key, "-out", cert],
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ctx.load_cert_chain(cert, key)
+        return ctx
+
+    def now(self) -> float:
+        return (time.monotonic() - self.started) * self.speed
+
+    def restart(self):
+        self.started = time.monotonic()
+
+    def respond(self, path: str):
+        f = self.faults
+        if f.latency_ms or f.jitter_ms:
+            time.sleep(max(0.0, f.latency_ms + random.uniform(-f.jitter_ms, f.jitter_ms)) / 1000.0)
+        if f.timeout_rate and random.random() < f.timeout_rate:
+            time.sleep(f.hang_s)
+        if f.error_rate and random.random() < f.error_rate:
+            return 503, {"errorCode": "SIMULATED"}
+
+        parts = urlsplit(path)
+        endpoint = parts.path.rsplit("/", 1)[-1]
+        if endpoint not in ENDPOINTS:
+            return 404, {"errorCode": "RESOURCE_NOT_FOUND"}
+        t = self.now() - self.loading
+        closed = self.session.at("*", t)
+        if closed is not None:
+            return None, None
+        if t < 0:
+            if endpoint == "allgamedata":
+                return 200, {"activePlayer": {}, "allPlayers": [], "events": {"Events": []}}
+            return 404, {"errorCode": "RESOURCE_NOT_FOUND"}
+        rec = self.session.at(endpoint, t)
+        if rec is None:
+            return 404, {"errorCode": "RESOURCE_NOT_FOUND"}
+        body = rec["body"]
+        if endpoint == "eventdata" and isinstance(body, dict):
+            since = parse_qs(parts.query).get("eventID")
+            if since:
+                body = {"Events": [e for e in body.get("Events", []) if e.get("EventID", 0) >= int(since[0])]}
+        return rec["status"], body
+
+    def start(self) -> "Simulator":
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+# ============================== BENCH =========================================
+def bench(session: Session, speed: float = 1.0, loading: float = 2.0, faults: Optional[Faults] = None,
+          probes: int = 200, https: bool = False) -> Dict[str, float]:
+    """Time-to-sync and poll overhead against a local simulator."""
+    from src.workers.GameStateWorker import GameStateWorker
+
+    sim = Simulator(session, speed=speed, loading=loading, faults=faults, port=0, https=https).start()
+    try:
+        client = LiveClient(port=sim.port, schemes=("https", "http") if https else ("http", "https"))
+        t0 = time.perf_counter()
+        for _ in range(probes):
+            client.is_in_game()
+        probe_ms = (time.perf_counter() - t0) / probes * 1000.0
+
+        worker = GameStateWorker(client=LiveClient(port=sim.port, schemes=client._schemes))
+        synced = []
+        worker.synced.connect(synced.append)
+        sim.restart()
+        before = sim.requests
+        t0 = time.perf_counter()
+        delay = worker.IDLE_MIN
+        while not synced and time.perf_counter() - t0 < 60:
+            delay = worker.step(delay)
+            if not synced:
+                time.sleep(delay)
+        tts = time.perf_counter() - t0
+        return {
+            "probe_ms": round(probe_ms, 3),
+            "time_to_sync_s": round(tts, 3),
+            "loading_s": loading / speed,
+            "sync_overhead_s": round(tts - loading / speed, 3),
+            "requests_to_sync": sim.requests - before,
+            "synced": bool(synced),
+        }
+    finally:
+        sim.stop()
+
+# ============================== CLI ===========================================
+def _faults(args) -> Faults:
+    return Faults(args.latency, args.jitter, args.timeout_rate, args.error_rate)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Live Client API simulator / recorder.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    for name in ("serve", "bench"):
+        sp = sub.add_parser(name)
+        sp.add_argument("session", nargs="?", help="recorded session (.jsonl or .jsonl.gz); synthetic if omitted")
+        sp.add_argument("--speed", type=float, default=1.0, help="replay speed multiplier")
+        sp.add_argument("--loading", type=float, default=2.0 if name == "bench" else 0.0,
+                        help="seconds of loading screen (empty allPlayers) before the session")
+        sp.add_argument("--https", action="store_true", help="serve self-signed HTTPS instead of HTTP")
+        sp.add_argument("--latency", type=float, default=0.0, help="added latency per request (ms)")
+        sp.add_argument("--jitter", type=float, default=0.0, help="latency jitter (± ms)")
+        sp.add_argument("--timeout-rate", type=float, default=0.0, help="fraction of requests that hang")
+        sp.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 503")
+    sub.choices["serve"].add_argument("--port", type=int, default=PORT)
+    sub.choices["bench"].add_argument("--probes", type=int, default=200)
+    rp = sub.add_parser("record")
+    rp.add_argument("out", help="output file (.jsonl or .jsonl.gz)")
+    rp.add_argument("--interval", type=float, default=1.0)
+    rp.add_argument("--keyframe", type=float, default=KEYFRAME, help="seconds between full bodies per endpoint (0 = always full)")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "record":
+        record(args.out, args.interval, keyframe=args.keyframe)
+        return
+    session = Session.load(args.session) if args.session else synthetic_session()
+    if args.cmd == "bench":
+        print(json.dumps(bench(session, args.speed, args.loading, _faults(args), args.probes, args.https), indent=2))
+        return
+    sim = Simulator(session, args.speed, args.loading, _faults(args), port=args.port, https=args.https).start()
+    print(f"[SIM] Serving {'https' if args.https else 'http'}://{HOST}:{sim.port}/liveclientdata/ (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        sim.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Offscreen rendering / interaction benchmarks for GridWidget and OverlayWidget.
+
+  python -m tools.RenderBench --out bench.json
+  python -m tools.RenderBench --baseline bench.json --tolerance 0.25
+
+Runs under QT_QPA_PLATFORM=offscreen (set automatically) and measures, for
+scales 0.5-2.0 and 0-10 running timers:
+  - GridWidget / OverlayWidget paintEvent wall time
+  - GridWidget._on_tick cost
+  - set_content_from_enemies latency
+  - mousePressEvent return time and click -> team-sync call latency
+    (against an in-process stub, no network)
+  - steady-state CPU per minute with the event loop running
+
+Results are written as JSON; with --baseline every metric is compared with
+the previous run and the exit status is 1 if any got slower than the
+tolerance allows.
+"""
+import argparse, json, os, platform, statistics, sys, tempfile, time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # assets are loaded relative to the repo root
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt, QPointF, QTimer, QEvent
+from PySide6.QtGui import QImage, QMouseEvent
+from src.SyncBackend import SyncBackend, SyncSignals
+
+SCALES = (0.5, 0.75, 1.0, 1.5, 2.0)
+TIMER_COUNTS = (0, 5, 10)
+ENEMIES = [
+    {"champion": "Ahri", "spells": ["Flash", "Ignite"]},
+    {"champion": "Lee Sin", "spells": ["Flash", "Smite"]},
+    {"champion": "Jinx", "spells": ["Flash", "Heal"]},
+    {"champion": "Thresh", "spells": ["Flash", "Exhaust"]},
+    {"champion": "Darius", "spells": ["Teleport", "Flash"]},
+]
+
+# ============================== STUBS =========================================
+class StubSync(SyncBackend):
+    """Stands in for the team-sync backend; records when each write arrives."""
+    def __init__(self):
+        self._init_sync()
+        self.calls: List[float] = []
+        self.match_id = "BENCH"
+        self.signals = SyncSignals()
+    def setMatchID(self, match_id): pass
+    def _put(self, path, value): self.calls.append(time.perf_counter())
+
+def install_stubs(tmp: str) -> StubSync:
+    from src.SyncBackend import set_backend
+    from src.UserData import UserData
+    stub = StubSync()
+    set_backend(stub)
+    UserData()._path = Path(tmp) / "userdata.json"  # keep the real settings untouched
+    return stub
+
+# ============================== HELPERS =======================================
+def measure(fn: Callable[[], None], n: int) -> Dict[str, float]:
+    fn()  # warm-up (caches, fonts)
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter(); fn(); samples.append((time.perf_counter() - t0) * 1000.0)
+    samples.sort()
+    return {
+        "n": n,
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p50_ms": round(samples[len(samples) // 2], 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+    }
+
+def click(widget, row: int, col: int, button=Qt.LeftButton):
+    pos = QPointF(widget.cell_rect(row, col).center())
+    ev = QMouseEvent(QEvent.MouseButtonPress, pos, widget.mapToGlobal(pos), button, button, Qt.NoModifier)
+    widget.mousePressEvent(ev)
+
+def start_timers(grid, count: int):
+    cells = [(r, c) for r in range(5) for c in (1, 2)][:count]
+    for r, c in cells:
+        click(grid, r, c)
+
+def render_cost(widget, n: int) -> Dict[str, float]:
+    img = QImage(widget.size(), QImage.Format_ARGB32_Premultiplied)
+    def paint():
+        img.fill(0); widget.render(img)
+    return measure(paint, n)
+
+def process_events_until(pred: Callable[[], bool], timeout: float = 5.0):
+    app = QApplication.instance()
+    deadline = time.perf_counter() + timeout
+    while not pred() and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.0005)
+
+# ============================== SUITE =========================================
+def run(n: int = 200, cpu_seconds: float = 5.0) -> Dict[str, Dict[str, float]]:
+    from src.widgets.GridWidget import GridWidget
+    from src.widgets.OverlayWidget import OverlayWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    tmp = tempfile.mkdtemp(prefix="renderbench-")
+    stub = install_stubs(tmp)
+    results: Dict[str, Dict[str, float]] = {}
+
+    for scale in SCALES:
+        for count in TIMER_COUNTS:
+            grid = GridWidget(scale=scale)
+            grid.resize(grid.sizeHint())
+            grid.set_content_from_enemies(ENEMIES)
+            start_timers(grid, count)
+            tag = f"scale={scale},timers={count}"
+            results[f"grid.paint[{tag}]"] = render_cost(grid, n)
+            results[f"grid.tick[{tag}]"] = measure(grid._on_tick, n)
+            grid.deleteLater()
+
+    grid = GridWidget(scale=1.0); grid.resize(grid.sizeHint())
+    results["grid.set_content_from_enemies"] = measure(lambda: grid.set_content_from_enemies(ENEMIES), n)
+
+    # click -> return of mousePressEvent, and click -> team-sync call
+    grid.set_content_from_enemies(ENEMIES)
+    press, sync = [], []
+    for i in range(n):
+        before = len(stub.calls)
+        t0 = time.perf_counter()
+        click(grid, i % 5, 1 + i % 2, Qt.LeftButton if i % 2 == 0 else Qt.RightButton)
+        press.append((time.perf_counter() - t0) * 1000.0)
+        process_events_until(lambda: len(stub.calls) > before)
+        if len(stub.calls) > before:
+            sync.append((stub.calls[before] - t0) * 1000.0)
+    for name, samples in (("grid.mouse_press", press), ("grid.click_to_sync", sync)):
+        if samples:
+            samples.sort()
+            results[name] = {"n": len(samples), "mean_ms": round(statistics.fmean(samples), 4),
+                             "p50_ms": round(samples[len(samples) // 2], 4),
+                             "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4)}
+
+    overlay = OverlayWidget()
+    for w in ("_game_worker", "_topmost_worker"):
+        worker = getattr(overlay, w, None)
+        if worker:
+            worker.stop(); worker.wait(2000)
+    for scale in SCALES:
+        overlay.on_scale_changed(int(scale * 100))
+        results[f"overlay.paint[scale={scale}]"] = render_cost(overlay, n)
+
+    # steady state: real event loop, grid visible with N timers running
+    for count in TIMER_COUNTS:
+        grid = GridWidget(scale=1.0); grid.resize(grid.sizeHint())
+        grid.set_content_from_enemies(ENEMIES); start_timers(grid, count); grid.show()
+        QTimer.singleShot(int(cpu_seconds * 1000), app.quit)
+        c0 = time.process_time()
+        app.exec()
+        cpu = time.process_time() - c0
+        results[f"grid.cpu_per_min[timers={count}]"] = {"n": 1, "mean_ms": round(cpu * 1000.0 * 60.0 / cpu_seconds, 2)}
+        grid.hide(); grid.deleteLater()
+
+    overlay.close()
+    return results
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Metrics whose mean got slower than baseline * (1 + tolerance)."""
+    regressions = []
+    for name, cur in current.items():
+        base = baseline.get(name)
+        if not base or not base.get("mean_ms"):
+            continue
+        ratio = cur["mean_ms"] / base["mean_ms"]
+        if ratio > 1.0 + tolerance:
+            regressions.append(f"{name}: {base['mean_ms']:.3f} -> {cur['mean_ms']:.3f} ms (x{ratio:.2f})")
+    return regressions
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Offscreen GridWidget / OverlayWidget benchmarks.")
+    ap.add_argument("--out", help="write results JSON here")
+    ap.add_argument("--baseline", help="compare against a previous results JSON")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    ap.add_argument("-n", type=int, default=200, help="samples per metric")
+    ap.add_argument("--cpu-seconds", type=float, default=5.0, help="event-loop seconds per steady-state CPU sample")
+    args = ap.parse_args(argv)
+
+    results = run(args.n, args.cpu_seconds)
+    report = {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(),
+                 "qpa": os.environ.get("QT_QPA_PLATFORM", ""), "time": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    for name, r in results.items():
+        print(f"{name:<48} {r['mean_ms']:>10.3f} ms" + (f"  p95 {r['p95_ms']:.3f}" if "p95_ms" in r else ""))
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, (json.load(f) or {}).get("results", {}), args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(" -", line)
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+if __name__ == "__main__":
+    main()
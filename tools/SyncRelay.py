@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Self-hostable team-sync relay (SYNC_BACKEND=relay) and its load generator.
+
+  python -m tools.SyncRelay serve --port 47800
+  python -m tools.SyncRelay serve --host 0.0.0.0 --secret <shared secret>
+  python -m tools.SyncRelay load --matches 2000 --clients 5 --rounds 5
+
+The relay listens on 127.0.0.1 unless told otherwise, and only binds
+another address with a shared secret (--secret or RELAY_SECRET): every
+connection must then open with an "auth" line carrying it, or is closed.
+
+Protocol: newline-delimited JSON over TCP, one object per line. Paths are
+relative to the match, e.g. "Ahri/Flash".
+
+  client -> relay
+    {"op": "auth", "secret": s}                  first line, when the relay has a secret
+    {"op": "sub", "m": match}                    join a match (leaves the previous one)
+    {"op": "unsub"}
+    {"op": "mset", "v": {path: value}, "seq": n} set values in the joined match
+    {"op": "ping", "seq": n}
+    {"op": "stats"}
+  relay -> client
+    {"op": "snap", "m": match, "v": {path: value}}  whole match, right after sub
+    {"op": "patch", "m": match, "v": {path: value}} what another client set
+    {"op": "ack", "seq": n, "ts": ms}               mset n applied (server wall clock)
+    {"op": "pong", "seq": n, "ts": ms}
+    {"op": "stats", ...}
+
+Matches live only in memory: fan-out is a set of writers per match, and a
+match nobody is subscribed to is dropped after --idle-ttl seconds. Clients
+that stop reading get disconnected instead of growing the relay's buffers.
+"""
+import argparse, asyncio, hmac, ipaddress, json, os, socket, statistics, subprocess, sys, time
+from typing import Dict, List, Optional, Set
+
+HOST = "127.0.0.1"
+PORT = 47800
+
+def rss_kb() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # peak, kB on Linux
+
+def encode(msg: Dict) -> bytes:
+    return json.dumps(msg, separators=(",", ":")).encode("utf-8") + b"\n"
+
+# ============================== RELAY =========================================
+class Match:
+    __slots__ = ("state", "clients", "last_active")
+
+    def __init__(self):
+        self.state: Dict[str, dict] = {}
+        self.clients: Set[asyncio.StreamWriter] = set()
+        self.last_active = time.monotonic()
+
+class Relay:
+    MAX_LINE = 64 * 1024
+    MAX_BUFFER = 256 * 1024  # bytes queued to one client before it counts as stuck
+    SWEEP_INTERVAL = 30.0
+
+    def __init__(self, idle_ttl: float = 600.0, secret: str = ""):
+        self.idle_ttl = idle_ttl
+        self.secret = secret
+        self.matches: Dict[str, Match] = {}
+        self.clients = 0
+        self.messages = 0
+        self.fanout = 0
+        self.dropped = 0
+        self.evicted = 0
+        self.refused = 0
+
+    async def serve(self, host: str = HOST, port: int = PORT):
+        server = await asyncio.start_server(self.handle, host, port, limit=self.MAX_LINE)
+        print(f"[RELAY] Listening on {host}:{port}", flush=True)
+        asyncio.get_running_loop().create_task(self._sweep())
+        async with server:
+            await server.serve_forever()
+
+    def _send(self, writer: asyncio.StreamWriter, data: bytes):
+        if writer.is_closing():
+            return
+        if writer.transport.get_write_buffer_size() > self.MAX_BUFFER:
+            self.dropped += 1
+            writer.close()
+            return
+        writer.write(data)
+
+    def _leave(self, match_id: Optional[str], writer: asyncio.StreamWriter):
+        match = self.matches.get(match_id) if match_id is not None else None
+        if match:
+            match.clients.discard(writer)
+            match.last_active = time.monotonic()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.clients += 1
+        match_id: Optional[str] = None
+        try:
+            if self.secret and not await self._authenticate(reader):
+                self.refused += 1
+                return
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError, ConnectionError):
+                    break
+                if not line:
+                    break
+                try:
+                    msg = json.loads(line)
+                except ValueError:
+                    continue
+                self.messages += 1
+                op = msg.get("op")
+                if op == "sub":
+                    self._leave(match_id, writer)
+                    match_id = str(msg.get("m", ""))
+                    match = self.matches.get(match_id)
+                    if match is None:
+                        match = self.matches[match_id] = Match()
+                    match.clients.add(writer)
+                    match.last_active = time.monotonic()
+                    self._send(writer, encode({"op": "snap", "m": match_id, "v": match.state}))
+                elif op == "unsub":
+                    self._leave(match_id, writer); match_id = None
+                elif op == "mset" and match_id is not None and isinstance(msg.get("v"), dict):
+                    match = self.matches.get(match_id)
+                    if match is None:  # evicted meanwhile; a subscribed client keeps it alive
+                        match = self.matches[match_id] = Match(); match.clients.add(writer)
+                    match.state.update(msg["v"])
+                    match.last_active = time.monotonic()
+                    data = encode({"op": "patch", "m": match_id, "v": msg["v"]})  # encoded once per fan-out
+                    for other in match.clients:
+                        if other is not writer:
+                            self._send(other, data); self.fanout += 1
+                    self._send(writer, encode({"op": "ack", "seq": msg.get("seq"), "ts": time.time() * 1000.0}))
+                elif op == "ping":
+                    self._send(writer, encode({"op": "pong", "seq": msg.get("seq"), "ts": time.time() * 1000.0}))
+                elif op == "stats":
+                    self._send(writer, encode(dict(op="stats", **self.stats())))
+        finally:
+            self._leave(match_id, writer)
+            self.clients -= 1
+            writer.close()
+
+    async def _authenticate(self, reader: asyncio.StreamReader) -> bool:
+        try:
+            msg = json.loads(await asyncio.wait_for(reader.readline(), timeout=5.0))
+        except (asyncio.TimeoutError, asyncio.LimitOverrunError, ValueError, ConnectionError):
+            return False
+        return (isinstance(msg, dict) and msg.get("op") == "auth"
+                and hmac.compare_digest(str(msg.get("secret", "")).encode("utf-8"), self.secret.encode("utf-8")))
+
+    async def _sweep(self):
+        while True:
+            await asyncio.sleep(self.SWEEP_INTERVAL)
+            now = time.monotonic()
+            stale = [k for k, m in self.matches.items() if not m.clients and now - m.last_active > self.idle_ttl]
+            for k in stale:
+                del self.matches[k]
+            self.evicted += len(stale)
+
+    def stats(self) -> Dict:
+        return {"matches": len(self.matches), "clients": self.clients, "messages": self.messages,
+                "fanout": self.fanout, "dropped": self.dropped, "evicted": self.evicted, "refused": self.refused, "rss_kb": rss_kb()}
+
+# ============================== LOAD GENERATOR ================================
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+def auth(secret: str) -> bytes:
+    return encode({"op": "auth", "secret": secret}) if secret else b""
+
+def is_loopback(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == "localhost"
+
+async def _request(host: str, port: int, msg: Dict, secret: str = "") -> Dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(auth(secret) + encode(msg)); await writer.drain()
+    reply = json.loads(await reader.readline())
+    writer.close()
+    return reply
+
+async def _load(host: str, port: int, matches: int, clients: int, rounds: int, rate: float, secret: str = "") -> Dict:
+    before = await _request(host, port, {"op": "stats"}, secret)
+    latencies: List[float] = []
+    received = 0
+    done = asyncio.Event()
+    expected = matches * (clients - 1) * rounds
+
+    async def reader_loop(reader: asyncio.StreamReader):
+        nonlocal received
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            msg = json.loads(line)
+            if msg.get("op") == "patch":
+                sent = next(iter(msg["v"].values())).get("_ns")
+                if sent:
+                    latencies.append((time.perf_counter_ns() - sent) / 1e6)
+                received += 1
+                if received >= expected:
+                    done.set()
+
+    sem = asyncio.Semaphore(256)  # concurrent connects
+    conns: List[List[asyncio.StreamWriter]] = []
+    tasks = []
+
+    async def connect(match_id: str) -> asyncio.StreamWriter:
+        async with sem:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(auth(secret) + encode({"op": "sub", "m": match_id})); await writer.drain()
+            await reader.readline()  # snap
+            tasks.append(asyncio.ensure_future(reader_loop(reader)))
+            return writer
+
+    t0 = time.perf_counter()
+    for i in range(matches):
+        conns.append(await asyncio.gather(*(connect(f"match-{i}") for _ in range(clients))))
+    connect_s = time.perf_counter() - t0
+    # every match gets a realistic state: 5 enemies x 2 spells
+    for i, writers in enumerate(conns):
+        writers[0].write(encode({"op": "mset", "seq": 0, "v": {f"Champ{c}/Spell{s}": {"usedAt": 0} for c in range(5) for s in range(2)}}))
+    await asyncio.sleep(0.5)
+    received = 0; latencies.clear()
+    mid = await _request(host, port, {"op": "stats"}, secret)
+
+    interval = 1.0 / rate if rate > 0 else 0.0
+    t0 = time.perf_counter()
+    for r in range(rounds):
+        for i, writers in enumerate(conns):
+            w = writers[(r + i) % clients]
+            w.write(encode({"op": "mset", "seq": r + 1, "v": {f"Champ{r % 5}/Spell{i % 2}": {"usedAt": time.time(), "_ns": time.perf_counter_ns()}}}))
+            if interval and i % 64 == 63:
+                await asyncio.sleep(interval * 64)  # pace in small bursts
+    try:
+        await asyncio.wait_for(done.wait(), timeout=30)
+    except asyncio.TimeoutError:
+        pass
+    send_s = time.perf_counter() - t0
+    for writers in conns:
+        for w in writers:
+            w.close()
+    for t in tasks:
+        t.cancel()
+
+    latencies.sort()
+    pct = lambda q: round(latencies[min(len(latencies) - 1, int(len(latencies) * q))], 3) if latencies else None
+    return {
+        "matches": matches, "clients_per_match": clients, "rounds": rounds,
+        "connect_s": round(connect_s, 2), "run_s": round(send_s, 2),
+        "deliveries": received, "expected": expected,
+        "deliveries_per_s": round(received / send_s, 1) if send_s else None,
+        "fanout_p50_ms": pct(0.50), "fanout_p99_ms": pct(0.99), "fanout_max_ms": latencies[-1] if latencies else None,
+        "fanout_mean_ms": round(statistics.fmean(latencies), 3) if latencies else None,
+        "relay_rss_kb": mid["rss_kb"],
+        "relay_kb_per_match": round((mid["rss_kb"] - before["rss_kb"]) / matches, 2),
+    }
+
+def load(host: Optional[str], port: int, matches: int, clients: int, rounds: int, rate: float, secret: str = "") -> Dict:
+    proc = None
+    if host is None:  # spawn a relay of our own so its memory is measured alone
+        host, port = HOST, free_port()
+        proc = subprocess.Popen([sys.executable, "-m", "tools.SyncRelay", "serve", "--host", host, "--port", str(port)],
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), stdout=subprocess.DEVNULL)
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection((host, port), timeout=0.2).close(); break
+            except OSError:
+                time.sleep(0.05)
+    try:
+        return asyncio.run(_load(host, port, matches, clients, rounds, rate, secret))
+    finally:
+        if proc:
+            proc.terminate(); proc.wait(5)
+
+# ============================== CLI ===========================================
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Team-sync relay server and load generator.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    s = sub.add_parser("serve", help="run the relay")
+    s.add_argument("--host", default=HOST, help="address to listen on; anything but loopback needs --secret")
+    s.add_argument("--port", type=int, default=PORT)
+    s.add_argument("--secret", default=os.getenv("RELAY_SECRET", ""), help="shared secret clients must send first (default: RELAY_SECRET)")
+    s.add_argument("--idle-ttl", type=float, default=600.0, help="seconds an unsubscribed match is kept")
+    l = sub.add_parser("load", help="simulate matches x clients against a relay")
+    l.add_argument("--host", help="relay to target (default: spawn a local one)")
+    l.add_argument("--port", type=int, default=PORT)
+    l.add_argument("--secret", default=os.getenv("RELAY_SECRET", ""), help="secret of the targeted relay")
+    l.add_argument("--matches", type=int, default=1000)
+    l.add_argument("--clients", type=int, default=5)
+    l.add_argument("--rounds", type=int, default=5, help="writes per match")
+    l.add_argument("--rate", type=float, default=5000.0, help="writes per second across all matches (0 = as fast as possible)")
+    l.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "serve":
+        if not is_loopback(args.host) and not args.secret:
+            ap.error(f"refusing to listen on {args.host} without a shared secret (--secret or RELAY_SECRET)")
+        try:
+            asyncio.run(Relay(args.idle_ttl, args.secret).serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        return
+    report = load(args.host, args.port, args.matches, args.clients, args.rounds, args.rate, args.secret if args.host else "")
+    if args.json:
+        print(json.dumps(report, indent=2)); return
+    for k, v in report.items():
+        print(f"{k:<20} {v}")
+
+if __name__ == "__main__":
+    main()